@@ -29,8 +29,7 @@ setup(
         'numpy==1.26.4',
         'matplotlib==3.9.3',
         'scikit-learn==1.5.2',
-        'graphviz==0.20.3',
-        'seaborn==0.13.2'
+        'graphviz==0.20.3'
     ],
     extras_require={
         'test': [
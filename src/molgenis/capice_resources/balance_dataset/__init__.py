@@ -5,3 +5,9 @@ class BalanceDatasetEnums(Enum):
     BALANCED = 'balanced'
     REMAINDER = 'remainder'
     BALANCED_ON = 'balanced_on'
+    REPLICATES = 'replicates'
+    REPLICATE = 'replicate'
+    AF_BIN = 'gnomAD_AF_bin'
+    N_PATHOGENIC = 'n_pathogenic'
+    N_BENIGN = 'n_benign'
+    N_BALANCED = 'n_balanced'
@@ -4,6 +4,7 @@ import pandas as pd
 
 from molgenis.capice_resources.core import Module, CommandLineInterface, \
     TSVFileEnums, AlleleFrequencyEnums, ColumnEnums, DatasetIdentifierEnums
+from molgenis.capice_resources.core.downcaster import Downcaster
 from molgenis.capice_resources.balance_dataset import BalanceDatasetEnums
 from molgenis.capice_resources.balance_dataset.balancer import Balancer
 
@@ -49,6 +50,44 @@ class BalanceDataset(Module):
             help='Print verbose messages during balancing.'
         )
 
+        optional.add_argument(
+            '-d',
+            '--downcast',
+            action='store_true',
+            help='Downcast the integer columns to the smallest integer dtype that fits their '
+                 'values right after loading, reducing memory usage. Float columns are not '
+                 'downcasted, so that the exported datasets are unchanged.'
+        )
+
+        optional.add_argument(
+            '-p',
+            '--plan-only',
+            action='store_true',
+            help='Only print the amount of samples each consequence and allele frequency bin '
+                 'contributes to the balanced dataset, without exporting the balanced and '
+                 'remainder datasets.'
+        )
+
+        optional.add_argument(
+            '-r',
+            '--replicates',
+            type=int,
+            default=1,
+            help='The amount of balanced and remainder datasets to draw, each with its own seed '
+                 '(-s / --seed plus the number of the replicate). When greater than 1, the '
+                 'datasets are exported as balanced_replicate_<n> and remainder_replicate_<n>. '
+                 'Default: 1.'
+        )
+
+        optional.add_argument(
+            '-s',
+            '--seed',
+            type=int,
+            default=Balancer.RANDOM_STATE,
+            help=f'The seed to draw the (first) balanced dataset with. '
+                 f'Default: {Balancer.RANDOM_STATE}.'
+        )
+
         return parser
 
     def _validate_module_specific_arguments(self, parser: CommandLineInterface):
@@ -60,10 +99,20 @@ class BalanceDataset(Module):
             parser.get_argument('output')
         )
         verbose = parser.get_argument('verbose')
+        downcast = parser.get_argument('downcast')
+        plan_only = parser.get_argument('plan_only')
+        replicates = parser.get_argument('replicates')
+        if replicates['replicates'] < 1:
+            raise ValueError('Replicates should be at least 1.')
+        seed = parser.get_argument('seed')
         return {
             **input_file,
             **output,
-            **verbose
+            **verbose,
+            **downcast,
+            **plan_only,
+            **replicates,
+            **seed
         }
 
     def run_module(self, arguments):
@@ -75,8 +124,25 @@ class BalanceDataset(Module):
                 ColumnEnums.BINARIZED_LABEL.value
             ]
         )
+        if arguments['downcast']:
+            # Only lossless downcasting, as the datasets are exported
+            Downcaster(lossless=True).downcast(dataset)
         self._validate_benign_pathogenic_present(dataset)
-        balancer = Balancer(arguments['verbose'])
+        balancer = Balancer(arguments['verbose'], arguments['seed'])
+        if arguments['plan_only']:
+            self._print_plan(balancer.plan(dataset))
+            return {
+                BalanceDatasetEnums.BALANCED.value: None,
+                BalanceDatasetEnums.REMAINDER.value: None,
+                DatasetIdentifierEnums.OUTPUT.value: arguments['output']
+            }
+        if arguments['replicates'] > 1:
+            seeds = [arguments['seed'] + replicate for replicate in range(arguments['replicates'])]
+            return {
+                # Replicates are drawn one by one while being exported
+                BalanceDatasetEnums.REPLICATES.value: balancer.balance_replicates(dataset, seeds),
+                DatasetIdentifierEnums.OUTPUT.value: arguments['output']
+            }
         balanced, remainder = balancer.balance(dataset)
         return {
             BalanceDatasetEnums.BALANCED.value: balanced,
@@ -108,20 +174,72 @@ class BalanceDataset(Module):
         if n_pathogenic == 0:
             raise ValueError('No pathogenic samples present. Balancing not possible.')
 
+    @staticmethod
+    def _print_plan(plan: pd.DataFrame) -> None:
+        """
+        Function to print the balancing plan and the expected balanced set size.
+
+        Args:
+            plan:
+                The table of each consequence and allele frequency bin, as obtained from
+                Balancer.plan().
+        """
+        print(plan.to_string(index=False))
+        print(f'Expected balanced set size: {plan[BalanceDatasetEnums.N_BALANCED.value].sum()}')
+
     def export(self, output) -> None:
+        if BalanceDatasetEnums.REPLICATES.value in output:
+            for replicate, (balanced, remainder) in enumerate(
+                    output[BalanceDatasetEnums.REPLICATES.value],
+                    start=1
+            ):
+                print(f'Exporting replicate {replicate}.')
+                self._export_balanced_and_remainder(
+                    output[DatasetIdentifierEnums.OUTPUT.value],
+                    balanced,
+                    remainder,
+                    f'_{BalanceDatasetEnums.REPLICATE.value}_{replicate}'
+                )
+        elif output[BalanceDatasetEnums.BALANCED.value] is not None:
+            self._export_balanced_and_remainder(
+                output[DatasetIdentifierEnums.OUTPUT.value],
+                output[BalanceDatasetEnums.BALANCED.value],
+                output[BalanceDatasetEnums.REMAINDER.value]
+            )
+
+    def _export_balanced_and_remainder(
+            self,
+            output_path: os.PathLike[str] | str,
+            balanced: pd.DataFrame,
+            remainder: pd.DataFrame,
+            suffix: str = ''
+    ) -> None:
+        """
+        Function to export a balanced and remainder dataset.
+
+        Args:
+            output_path:
+                The output directory.
+            balanced:
+                The balanced dataset.
+            remainder:
+                The remainder dataset.
+            suffix:
+                (Optional) Suffix to add to the file names, for instance the replicate.
+        """
         self.exporter.export_pandas_file(
             os.path.join(  # type: ignore
-                output[DatasetIdentifierEnums.OUTPUT.value],
+                output_path,
                 BalanceDatasetEnums.BALANCED.value
-            ) + TSVFileEnums.TSV_EXTENSIONS.value[0],
-            output[BalanceDatasetEnums.BALANCED.value]
+            ) + suffix + TSVFileEnums.TSV_EXTENSIONS.value[0],
+            balanced
         )
         self.exporter.export_pandas_file(
             os.path.join(  # type: ignore
-                output[DatasetIdentifierEnums.OUTPUT.value],
+                output_path,
                 BalanceDatasetEnums.REMAINDER.value
-            ) + TSVFileEnums.TSV_EXTENSIONS.value[0],
-            output[BalanceDatasetEnums.REMAINDER.value]
+            ) + suffix + TSVFileEnums.TSV_EXTENSIONS.value[0],
+            remainder
         )
 
 
@@ -1,7 +1,11 @@
+from collections.abc import Iterator
+
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.core import ColumnEnums, AlleleFrequencyEnums
-from molgenis.capice_resources.utilities import split_consequences
+from molgenis.capice_resources.utilities import af_bin_codes
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
 from molgenis.capice_resources.balance_dataset import BalanceDatasetEnums
 from molgenis.capice_resources.balance_dataset.verbosity_printer import VerbosityPrinter
 
@@ -9,12 +13,12 @@ from molgenis.capice_resources.balance_dataset.verbosity_printer import Verbosit
 class Balancer:
     RANDOM_STATE = 5
 
-    def __init__(self, verbose: bool):
+    def __init__(self, verbose: bool, random_state: int = RANDOM_STATE):
         self.printer = VerbosityPrinter(verbose)
-        self.bins = [pd.IntervalIndex]
+        self.random_state = random_state
+        self.bins: list[int] = []
+        self.af_bin_codes = np.empty(0, dtype=np.int8)
         self.columns: list[str] = []
-        self.drop_benign = pd.Index([])
-        self.drop_pathogenic = pd.Index([])
 
     @staticmethod
     def _mark_and_impute(dataset: pd.DataFrame) -> None:
@@ -51,21 +55,26 @@ class Balancer:
 
     def _set_bins(self, gnomad_af: pd.Series) -> None:
         """
-        Setter for the init variable self.bins, according to both the bins defined in the
-        GlobalEnums and the allele frequency ranges present in the gnomAD_AF column.
+        Setter for the init variables self.af_bin_codes and self.bins, according to both the
+        bins defined in the GlobalEnums and the allele frequency ranges present in the gnomAD_AF
+        column.
+
+        The (left inclusive) allele frequency bin of each sample is determined once, through a
+        binary search on the bin edges, and stored (by position of the sample) as the code
+        (position) of the bin.
 
         Args:
             gnomad_af:
                 pandas.Series instance of the dataset "gnomAD_AF" column.
 
         """
-        self.bins = pd.cut(
-            gnomad_af,
-            bins=AlleleFrequencyEnums.AF_BINS.value,
-            right=False,
-            include_lowest=True
-        ).dropna().unique()
-        self.printer.print(f'Bins set: {self.bins}')
+        # Samples outside the bin edges (or without allele frequency) are not within any bin
+        self.af_bin_codes = af_bin_codes(gnomad_af)
+        self.bins = [code for code in np.unique(self.af_bin_codes) if code >= 0]
+        edges = AlleleFrequencyEnums.AF_BINS.value
+        self.printer.print(
+            f'Bins set: {pd.IntervalIndex.from_breaks(edges, closed="left")[self.bins]}'
+        )
 
     def _set_columns(self, columns: pd.DataFrame.columns) -> None:
         """
@@ -81,10 +90,9 @@ class Balancer:
 
     def balance(self, dataset: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Primary function of the Balancer class. Loops through each (split) consequence,
-        samples pathogenic and benign separately, then calls the "_process_consequence" function.
-        After that is done, then filters out the drop Indexes that have been generated by
-        "_process_bins" to prevent a multi-consequence sample from being sampled multiple times.
+        Primary function of the Balancer class. Allocates the amount of balanced samples of
+        each stratum through "_allocate", draws the positions of the balanced samples through
+        "_draw_positions", then obtains the balanced and remainder datasets from dataset at once.
 
         Args:
             dataset:
@@ -97,167 +105,403 @@ class Balancer:
                 [1] the remainder dataset of all samples that have not been sampled.
 
         """
+        return next(self.balance_replicates(dataset, [self.random_state]))
+
+    def balance_replicates(
+            self,
+            dataset: pd.DataFrame,
+            random_states: list[int]
+    ) -> Iterator[tuple[pd.DataFrame, pd.DataFrame]]:
+        """
+        Function to obtain a balanced and remainder dataset for each of random_states.
+
+        The samples of dataset are only counted once per (consequence combination, AF bin, label)
+        stratum; each replicate only allocates the amount of samples to draw per stratum from
+        these counts (see "_allocate") and then draws the samples of all strata at once.
+
+        Args:
+            dataset:
+                The pandas.Dataframe over which should be balanced.
+                Requires the GnomAD_AF column and the Consequence column.
+            random_states:
+                The random state to sample each of the replicates with.
+
+        Yields:
+            tuple:
+                Tuple containing [0] the balanced dataset over each Consequence over each AF bin
+                as per defined in GlobalEnums and
+                [1] the remainder dataset of all samples that have not been sampled, for each
+                of random_states.
+        """
         self._mark_and_impute(dataset)
         self._set_columns(dataset.columns)
         self._set_bins(dataset[ColumnEnums.GNOMAD_AF.value])
-        pathogenic = dataset.loc[dataset[dataset[ColumnEnums.BINARIZED_LABEL.value] == 1].index, :]
-        benign = dataset.loc[dataset[dataset[ColumnEnums.BINARIZED_LABEL.value] == 0].index, :]
-        return_dataset = pd.DataFrame(columns=self.columns)
-        consequences = split_consequences(dataset[ColumnEnums.CONSEQUENCE.value])
-        for consequence in consequences:
-            self.printer.print(f'Processing: {consequence}')
-            selected_pathogenic = pathogenic[
-                pathogenic[ColumnEnums.CONSEQUENCE.value].str.contains(consequence)
-            ]
-            self.printer.print(
-                f'Total amount of pathogenic samples (for consequence): '
-                f'{selected_pathogenic.shape[0]}'
-            )
-            selected_benign = benign[
-                benign[ColumnEnums.CONSEQUENCE.value].str.contains(consequence)
-            ]
-            self.printer.print(
-                f'Total amount of benign samples (for consequence): '
-                f'{selected_benign.shape[0]}'
-            )
-            processed_consequence = self._process_consequence(
-                selected_pathogenic,
-                selected_benign
-            )
-            counts = processed_consequence.value_counts(  # One-liner in F-string not possible.
-                subset=[  # type: ignore
-                    ColumnEnums.BINARIZED_LABEL.value,
-                    ColumnEnums.GNOMAD_AF.value
-                ]
-            )
-            self.printer.print(
-                f'Sampled total for consequence: {consequence}\n'
-                f'{counts}'
+        strata, counts, consequence_index = self._count_strata(dataset)
+        for random_state in random_states:
+            self.random_state = random_state
+            generator = np.random.default_rng(random_state)
+            allocation = self._allocate(counts, consequence_index, generator)
+            balanced_positions, balanced_on = self._draw_positions(strata, allocation, generator)
+            yield self._take_balanced_and_remainder(
+                dataset,
+                consequence_index,
+                balanced_positions,
+                balanced_on
             )
-            processed_consequence[BalanceDatasetEnums.BALANCED_ON.value] = consequence
-            return_dataset = pd.concat(
+
+    def _take_balanced_and_remainder(
+            self,
+            dataset: pd.DataFrame,
+            consequence_index: ConsequenceIndex,
+            balanced_positions: np.ndarray,
+            balanced_on: np.ndarray
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Function to obtain the balanced and remainder datasets from dataset at once.
+
+        Args:
+            dataset:
+                The pandas.Dataframe over which has been balanced.
+            consequence_index:
+                The ConsequenceIndex of the consequence combinations of dataset.
+            balanced_positions:
+                The positions of all balanced samples within dataset.
+            balanced_on:
+                The consequence (position in consequence_index.consequences) each of the
+                balanced samples is balanced on.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the balanced dataset, sorted on the index of dataset, and
+                [1] the remainder dataset of all samples that have not been sampled.
+        """
+        order = np.argsort(dataset.index.to_numpy()[balanced_positions], kind='stable')
+        return_dataset = dataset.iloc[balanced_positions[order]].copy()
+        return_dataset[BalanceDatasetEnums.BALANCED_ON.value] = np.array(
+            consequence_index.consequences,
+            dtype=object
+        )[balanced_on[order]]
+        self._reset_impute(return_dataset)
+        labels = dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy()
+        available = np.ones(dataset.shape[0], dtype=bool)
+        available[balanced_positions] = False
+        remainder = dataset.iloc[
+            np.concatenate(
                 [
-                    return_dataset,
-                    processed_consequence
-                ], axis=0
+                    np.flatnonzero(available & (labels == 0)),
+                    np.flatnonzero(available & (labels == 1))
+                ]
             )
-            return_dataset.sort_index(inplace=True)
-            benign.drop(self.drop_benign, inplace=True)
-            self.drop_benign = pd.Index([])
-            pathogenic.drop(index=self.drop_pathogenic, inplace=True)
-            self.drop_pathogenic = pd.Index([])
-        self._reset_impute(return_dataset)
-        remainder = pd.concat([benign, pathogenic], ignore_index=True, axis=0)
+        ].reset_index(drop=True)
         self._reset_impute(remainder)
         self.printer.print(f'Balanced set size: {return_dataset.shape[0]}')
         self.printer.print(f'Remainder set size: {remainder.shape[0]}')
         return return_dataset, remainder
 
-    def _sample_variants(self, dataset: pd.DataFrame, n_required: int) -> pd.DataFrame:
+    def plan(self, dataset: pd.DataFrame) -> pd.DataFrame:
         """
-        Small function to randomly sample an x amount of samples according to n_required if
-        dataset exceeds the n_required.
+        Function to obtain the amount of samples each (consequence, AF bin) stratum contributes
+        to the balanced dataset, without drawing the balanced and remainder datasets. The
+        amounts are allocated on the stratum counts alone, equal to balance() with the same
+        random state.
 
         Args:
             dataset:
-                The pandas.DataFrame that should be checked if the amount of samples is equal to or
-                lower than n_required.
-            n_required:
-                The integer of the amount of samples "dataset" should have at max.
-                Does not sample if the amount of samples in "dataset" is lower or equal to
-                n_required.
+                The pandas.Dataframe over which should be balanced.
+                Requires the GnomAD_AF column and the Consequence column.
 
         Returns:
             dataframe:
-                Returns a pandas.DataFrame that is the same as input "dataset",
-                but randomly sampled to fit a maximum of n_required.
-
+                Table containing for each stratum that contains samples: the consequence, the
+                AF bin, the amount of pathogenic and benign samples containing the consequence
+                within the AF bin, and the amount of these samples that is balanced on the
+                consequence (pathogenic and benign combined).
+        """
+        self._set_bins(dataset[ColumnEnums.GNOMAD_AF.value].fillna(0))
+        _, counts, consequence_index = self._count_strata(dataset)
+        allocation = self._allocate(
+            counts,
+            consequence_index,
+            np.random.default_rng(self.random_state)
+        )
+        n_bins = len(AlleleFrequencyEnums.AF_BINS.value) - 1
+        present = np.zeros((len(consequence_index.consequences), n_bins, 2), dtype=np.int64)
+        for i, consequence in enumerate(consequence_index.consequences):
+            present[i] = counts[consequence_index.rows(consequence), :n_bins].sum(axis=0)
+        balanced = allocation[:, :, :n_bins].sum(axis=(1, 3))
+        consequences, af_bins = np.nonzero(present.sum(axis=2))
+        intervals = pd.IntervalIndex.from_breaks(
+            AlleleFrequencyEnums.AF_BINS.value,
+            closed='left'
+        )
+        return pd.DataFrame(
+            {
+                ColumnEnums.CONSEQUENCE.value: np.array(
+                    consequence_index.consequences,
+                    dtype=object
+                )[consequences],
+                BalanceDatasetEnums.AF_BIN.value: intervals[af_bins].astype(str),
+                BalanceDatasetEnums.N_PATHOGENIC.value: present[consequences, af_bins, 1],
+                BalanceDatasetEnums.N_BENIGN.value: present[consequences, af_bins, 0],
+                BalanceDatasetEnums.N_BALANCED.value: balanced[consequences, af_bins]
+            }
+        )
+
+    def _count_strata(
+            self,
+            dataset: pd.DataFrame
+    ) -> tuple[np.ndarray, np.ndarray, ConsequenceIndex]:
         """
-        if dataset.shape[0] > n_required:
-            dataset = dataset.sample(n=n_required, random_state=self.RANDOM_STATE)
-        return dataset
+        Function to count the samples per (consequence combination, AF bin, label) stratum in a
+        single grouped pass. A consequence combination is a unique value of the Consequence
+        column, so that the strata of a (split) consequence are those of all combinations
+        containing it. Samples outside the AF bins are counted in an additional last bin, since
+        these do take part in equalizing the pathogenic and benign samples of a consequence.
 
-    def _process_consequence(
+        Args:
+            dataset:
+                The pandas.Dataframe over which should be balanced, after "_set_bins".
+
+        Returns:
+            tuple:
+                Tuple containing [0] the stratum of each sample (-1 for samples without
+                consequence or label), [1] an array of shape (combinations, AF bins + 1, 2)
+                containing the amount of benign [..., 0] and pathogenic [..., 1] samples of each
+                stratum and [2] the ConsequenceIndex of the combinations, of which the rows are
+                the combinations containing each consequence.
+        """
+        codes, combinations = pd.factorize(dataset[ColumnEnums.CONSEQUENCE.value])
+        consequence_index = ConsequenceIndex(np.asarray(combinations, dtype=object))
+        n_columns = len(AlleleFrequencyEnums.AF_BINS.value)
+        af_bins = self.af_bin_codes.astype(np.intp)
+        af_bins[af_bins < 0] = n_columns - 1
+        labels = dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy()
+        valid = (codes >= 0) & ((labels == 0) | (labels == 1))
+        strata = np.full(dataset.shape[0], -1, dtype=np.intp)
+        strata[valid] = (
+            (codes[valid] * n_columns + af_bins[valid]) * 2 + labels[valid].astype(np.intp)
+        )
+        counts = np.bincount(
+            strata[valid],
+            minlength=len(combinations) * n_columns * 2
+        ).reshape(len(combinations), n_columns, 2)
+        return strata, counts, consequence_index
+
+    def _allocate(
             self,
-            pathogenic_dataset: pd.DataFrame,
-            benign_dataset: pd.DataFrame
-    ) -> pd.DataFrame:
+            counts: np.ndarray,
+            consequence_index: ConsequenceIndex,
+            generator: np.random.Generator
+    ) -> np.ndarray:
         """
-        Function to process one specific consequence, which it assumes is already subsetted.
-        Does not perform checks if a sample has already been sampled before.
-        Does not set the indexes of samples that have to be removed from the initial pathogenic and
-        benign subset (without Consequence subset), since it can not know what samples are going
-        to be sampled in the allele frequency balancing.
+        Function that loops through each (split) consequence and allocates the amount of
+        pathogenic and benign samples to draw from each of its strata, through
+        "_process_consequence". Allocated samples are no longer available to the following
+        consequences, to prevent a multi-consequence sample from being sampled multiple times.
+
+        Only the stratum counts are used: drawing samples at random from the available samples
+        of a consequence is equal to drawing the amount of samples of each stratum from a
+        multivariate hypergeometric distribution over the available counts.
 
         Args:
-            pathogenic_dataset:
-                The pandas.DataFrame subset of pathogenic variants, subset further on "Consequence".
-            benign_dataset:
-                The pandas.DataFrame subset of benign variants, subset further on "Consequence".
+            counts:
+                The stratum counts, as obtained from "_count_strata".
+            consequence_index:
+                The ConsequenceIndex of the consequence combinations.
+            generator:
+                The random generator to draw the allocation with.
 
         Returns:
-            dataframe:
-                Returns a pandas.DataFrame that contains variants that have been balanced on the
-                allele frequency bins defined in GlobalEnums.
+            numpy.ndarray:
+                Array of shape (consequences, *counts.shape) containing the amount of samples of
+                each stratum that is balanced on each consequence.
         """
-        pathogenic_dataset = self._sample_variants(pathogenic_dataset, benign_dataset.shape[0])
-        benign_dataset = self._sample_variants(benign_dataset, pathogenic_dataset.shape[0])
-        processed_bins = pd.DataFrame(columns=self.columns)
-        for af_bin in self.bins:
-            processed_bins = pd.concat(
-                [processed_bins, self._process_bins(pathogenic_dataset, benign_dataset, af_bin)],
-                axis=0
+        available = counts.copy()
+        allocation = np.zeros((len(consequence_index.consequences), *counts.shape), dtype=np.int64)
+        for i, consequence in enumerate(consequence_index.consequences):
+            self.printer.print(f'Processing: {consequence}')
+            combinations = consequence_index.rows(consequence)
+            pathogenic = available[combinations, :, 1]
+            self.printer.print(
+                f'Total amount of pathogenic samples (for consequence): {pathogenic.sum()}'
             )
-        return processed_bins
+            benign = available[combinations, :, 0]
+            self.printer.print(
+                f'Total amount of benign samples (for consequence): {benign.sum()}'
+            )
+            sampled_pathogenic, sampled_benign = self._process_consequence(
+                pathogenic,
+                benign,
+                generator
+            )
+            if self.printer.verbose:
+                counts_per_bin = pd.DataFrame(
+                    {
+                        'n_benign': sampled_benign.sum(axis=0)[self.bins],
+                        'n_pathogenic': sampled_pathogenic.sum(axis=0)[self.bins]
+                    },
+                    index=pd.IntervalIndex.from_breaks(
+                        AlleleFrequencyEnums.AF_BINS.value,
+                        closed='left'
+                    )[self.bins]
+                )
+                self.printer.print(
+                    f'Sampled total for consequence: {consequence}\n'
+                    f'{counts_per_bin}'
+                )
+            allocation[i, combinations, :, 1] = sampled_pathogenic
+            allocation[i, combinations, :, 0] = sampled_benign
+            available[combinations] -= allocation[i, combinations]
+        return allocation
 
-    def _process_bins(self, pathogenic_dataset, benign_dataset, af_bin):
+    @staticmethod
+    def _draw_positions(
+            strata: np.ndarray,
+            allocation: np.ndarray,
+            generator: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
         """
-        Function to process an allele frequency bin.
-        Does set the indexes of benign and pathogenic sampled variants.
-        Calls the "get_variants_within_range", then equalizes between benign and pathogenic by
-        randomly sampling.
+        Function to draw the balanced samples of all strata at once. The samples of each stratum
+        are shuffled, after which the allocated amount of samples of the stratum is taken and
+        divided over the consequences in order of the consequences.
 
         Args:
-            pathogenic_dataset:
-                The subset of pathogenic variants, subset on Consequence, as supplied to
-                "_process_consequence" but equalized to the benign subset supplied to
-                "_process_consequence".
-            benign_dataset:
-                The subset of benign variants, subset on Consequence, as supplied to
-                "_process_consequence" but equalized to the pathogenic subset supplied to
-                "_process_consequence".
-            af_bin:
-                The pandas.IntervalIndex of the AF bin of interest.
+            strata:
+                The stratum of each sample, as obtained from "_count_strata".
+            allocation:
+                The allocation of each consequence, as obtained from "_allocate".
+            generator:
+                The random generator to shuffle the samples with.
 
         Returns:
-            dataframe:
-                Concatenated pandas.DataFrame between pathogenic and benign samples,
-                sampled by "af_bin" and then equalized between the amount of benign and
-                pathogenic samples.
+            tuple:
+                Tuple containing [0] the positions of all balanced samples within the dataset
+                and [1] the consequence (position in ConsequenceIndex.consequences) each of these
+                samples is balanced on.
         """
-        selected_pathogenic = self._get_variants_within_range(pathogenic_dataset, af_bin)
-        selected_benign = self._get_variants_within_range(benign_dataset, af_bin)
-        return_benign = self._sample_variants(selected_benign, selected_pathogenic.shape[0])
-        return_pathogenic = self._sample_variants(selected_pathogenic, selected_benign.shape[0])
-        self.drop_benign = self.drop_benign.union(return_benign.index).astype(int)
-        self.drop_pathogenic = self.drop_pathogenic.union(return_pathogenic.index).astype(int)
-        return pd.concat([return_benign, return_pathogenic], axis=0)
+        allocation = allocation.reshape(allocation.shape[0], -1)
+        bounds = np.cumsum(allocation, axis=0)
+        valid = np.flatnonzero(strata >= 0)
+        order = valid[np.lexsort((generator.random(valid.size), strata[valid]))]
+        sorted_strata = strata[order]
+        ranks = np.arange(order.size) - np.searchsorted(sorted_strata, sorted_strata)
+        selected = ranks < bounds[-1, sorted_strata] if bounds.shape[0] > 0 else np.zeros(
+            order.size,
+            dtype=bool
+        )
+        balanced_on = (
+            bounds[:, sorted_strata[selected]] <= ranks[selected][np.newaxis, :]
+        ).sum(axis=0)
+        return order[selected], balanced_on
 
     @staticmethod
-    def _get_variants_within_range(dataset, af_bin) -> pd.DataFrame:
+    def _sample_counts(
+            counts: np.ndarray,
+            n_required: int,
+            generator: np.random.Generator
+    ) -> np.ndarray:
         """
-        Small function to get samples that are within a pandas.IntervalIndex range.
+        Small function to randomly sample an x amount of samples according to n_required from
+        the strata of counts, if the amount of samples of counts exceeds n_required.
 
         Args:
-            dataset:
-                The pandas.DataFrame containing the gnomAD_AF column to get the variants
-                that are within the AF bin range.
-            af_bin:
-                The pandas.IntervalIndex containing the AF bin range.
+            counts:
+                The amount of samples of each stratum that should be checked if the amount of
+                samples is equal to or lower than n_required.
+            n_required:
+                The integer of the amount of samples "counts" should have at max.
+                Does not sample if the amount of samples in "counts" is lower or equal to
+                n_required.
+            generator:
+                The random generator to sample with.
 
         Returns:
-            dataframe:
-                The input "dataset" containing only samples that
-                are within the AF range of "af_bin".
+            numpy.ndarray:
+                Returns the same counts as input "counts", but randomly sampled to fit a maximum
+                of n_required. The amount of samples of each stratum is drawn equal to drawing
+                n_required samples at random from all samples.
+        """
+        if counts.sum() > n_required:
+            counts = generator.multivariate_hypergeometric(
+                counts.ravel(),
+                n_required
+            ).reshape(counts.shape)
+        return counts
+
+    def _process_consequence(
+            self,
+            pathogenic_counts: np.ndarray,
+            benign_counts: np.ndarray,
+            generator: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to process one specific consequence, which it assumes is already subsetted.
+        Does not perform checks if a sample has already been sampled before.
+
+        Args:
+            pathogenic_counts:
+                The amount of available pathogenic samples of each (consequence combination, AF
+                bin) stratum of the consequence.
+            benign_counts:
+                The amount of available benign samples of each (consequence combination, AF bin)
+                stratum of the consequence.
+            generator:
+                The random generator to sample with.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the amount of pathogenic and [1] the amount of benign
+                samples of each stratum that have been balanced on the allele frequency bins
+                defined in GlobalEnums.
+        """
+        pathogenic_counts = self._sample_counts(
+            pathogenic_counts,
+            benign_counts.sum(),
+            generator
+        )
+        benign_counts = self._sample_counts(benign_counts, pathogenic_counts.sum(), generator)
+        processed_pathogenic = np.zeros_like(pathogenic_counts)
+        processed_benign = np.zeros_like(benign_counts)
+        for af_bin in self.bins:
+            processed_pathogenic[:, af_bin], processed_benign[:, af_bin] = self._process_bins(
+                pathogenic_counts[:, af_bin],
+                benign_counts[:, af_bin],
+                generator
+            )
+        return processed_pathogenic, processed_benign
+
+    def _process_bins(
+            self,
+            pathogenic_counts: np.ndarray,
+            benign_counts: np.ndarray,
+            generator: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to process an allele frequency bin.
+        Equalizes between benign and pathogenic by randomly sampling.
+
+        Args:
+            pathogenic_counts:
+                The amount of pathogenic samples of each consequence combination within the AF
+                bin of interest, as supplied to "_process_consequence" but equalized to the
+                benign samples supplied to "_process_consequence".
+            benign_counts:
+                The amount of benign samples of each consequence combination within the AF bin
+                of interest, as supplied to "_process_consequence" but equalized to the
+                pathogenic samples supplied to "_process_consequence".
+            generator:
+                The random generator to sample with.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the amount of pathogenic and [1] the amount of benign
+                samples of each consequence combination within the AF bin, equalized between
+                the amount of benign and pathogenic samples.
         """
-        return dataset[dataset[ColumnEnums.GNOMAD_AF.value].apply(lambda value: value in af_bin)]
+        return_benign = self._sample_counts(benign_counts, pathogenic_counts.sum(), generator)
+        return_pathogenic = self._sample_counts(
+            pathogenic_counts,
+            benign_counts.sum(),
+            generator
+        )
+        return return_pathogenic, return_benign
@@ -12,6 +12,16 @@ class CompareModelPerformanceEnums(Enum):
     MODEL_IDENTIFIER = 'model_identifier'
     MODEL_1 = 'model_1'
     MODEL_2 = 'model_2'
+    MODEL_IDENTIFIER_PREFIX = 'model_'
+    N_SAMPLES = 'n_samples'
+    N_PATHOGENIC = 'n_pathogenic'
+    N_BENIGN = 'n_benign'
+    AUC = 'auc'
+    AUC_PER_GENE = 'auc_per_gene'
+    METRICS = 'metrics'
+    SUBSET_TYPE = 'subset_type'
+    SUBSET = 'subset'
+    AF_BIN = 'allele_frequency_bin'
 
 
 class CMPPlottingEnums(Enum):
@@ -19,6 +29,7 @@ class CMPPlottingEnums(Enum):
     Enums specific to the plotting process of CompareModelPerformance.
     """
     GLOBAL = 'Global'
+    PLOTTER = 'plotter'
     LOC = 'upper left'
     FIG_AUC = 'auc'
     FIG_ROC = 'roc'
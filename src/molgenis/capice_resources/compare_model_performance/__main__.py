@@ -1,17 +1,22 @@
 import os
 from pathlib import Path
+from functools import partial
 from typing import Optional, Any
 
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.utilities import add_dataset_source
 from molgenis.capice_resources.core import Module, TSVFileEnums, DatasetIdentifierEnums, \
     ColumnEnums, VCFEnums
 from molgenis.capice_resources.core.errors import SampleSizeMismatchError
-from molgenis.capice_resources.compare_model_performance.plotter import Plotter
+from molgenis.capice_resources.compare_model_performance.metrics import MetricsCalculator
 from molgenis.capice_resources.compare_model_performance.annotator import Annotator
-from molgenis.capice_resources.compare_model_performance import CompareModelPerformanceEnums
+from molgenis.capice_resources.compare_model_performance import CompareModelPerformanceEnums, \
+    CMPPlottingEnums
 from molgenis.capice_resources.compare_model_performance.consequence_tools import ConsequenceTools
+from molgenis.capice_resources.compare_model_performance.performance_calculator import \
+    PerformanceCalculator
 
 
 class CompareModelPerformance(Module):
@@ -19,7 +24,7 @@ class CompareModelPerformance(Module):
         super().__init__(
             program='Compare model performance',
             description='Calculate the performance of a singular CAPICE model or '
-                        'compare the performance of 2 CAPICE models. '
+                        'compare the performance of any amount of CAPICE models. '
                         'Please note that model 1 is leading for '
                         'the per-consequence performance measurements. '
                         'If the size of the label file does not match the size of the scores file, '
@@ -30,7 +35,7 @@ class CompareModelPerformance(Module):
                         'the score file or the label file, assuming sizes differ.'
         )
         self.force_merge = False
-        self.model_2_present = False
+        self.workers = 1
 
     @staticmethod
     def _create_module_specific_arguments(parser):
@@ -43,12 +48,16 @@ class CompareModelPerformance(Module):
             '--scores-model-1',
             type=str,
             required=True,
+            action='extend',
+            nargs='+',
             help='Input location of the file containing the scores for model 1. '
+                 'Can be supplied multiple times (or with multiple files) to compare any amount '
+                 'of models, in order of model. '
                  'Column `Consequence` is required to be present in either the score file or '
                  'the label file (or both). '
                  'Has to contain the `score` column and '
                  'must be supplied in either TSV or gzipped TSV format! '
-                 'Leading for per-consequence performance metrics.'
+                 'The first file is leading for per-consequence performance metrics.'
         )
 
         required.add_argument(
@@ -57,9 +66,13 @@ class CompareModelPerformance(Module):
             '--labels-model-1',
             type=str,
             required=True,
+            action='extend',
+            nargs='+',
             help='Input location of the validation file used to create the score files. '
-                 'If 2 seperate validation files are used, this argument is for the validation '
-                 'file used to generate -a/--scores-model-1. '
+                 'If seperate validation files are used, this argument can be supplied multiple '
+                 'times (or with multiple files): one for each file of -a/--scores, in the same '
+                 'order. Each label file is only loaded once, even when supplied for multiple '
+                 'models. '
                  'Column `Consequence` is required to be present in either the score file or '
                  'the label file (or both). '
                  'Has to contain the `binarized_label` column and '
@@ -71,8 +84,10 @@ class CompareModelPerformance(Module):
             '-b',
             '--scores-model-2',
             type=str,
-            help='Optional input location of the file containing the scores for model 2. '
-                 'If not defined, will just plot statistics for arguments given for model 1. '
+            help='Optional input location of the file containing the scores for model 2, '
+                 'compared after the models of -a/--scores. '
+                 'If not defined, will just plot statistics for arguments given for '
+                 '-a/--scores. '
                  'Column `Consequence` is required to be present in either the score file or '
                  'the label file (or both). '
                  'Has to contain the `score` column and '
@@ -106,10 +121,28 @@ class CompareModelPerformance(Module):
                  'score and label file for any model.'
         )
 
+        optional.add_argument(
+            '-w',
+            '--workers',
+            type=int,
+            default=1,
+            help='The amount of processes to draw and save the figures with, one figure per '
+                 'process. Default: 1.'
+        )
+
+        optional.add_argument(
+            '--metrics-only',
+            action='store_true',
+            help='Add flag to only calculate and export the performance metrics (the AUC and '
+                 'score difference statistics of the global dataset, each consequence and each '
+                 'allele frequency bin, and the AUC per gene) without creating any plot. '
+                 'Matplotlib is not imported.'
+        )
+
         return parser
 
     def _validate_module_specific_arguments(self, parser):
-        scores1 = self.input_validator.validate_input_command_line_interface_file(
+        scores1 = self.input_validator.validate_input_command_line_interface_files(
             parser.get_argument('scores'),
             TSVFileEnums.TSV_EXTENSIONS.value
         )
@@ -118,7 +151,7 @@ class CompareModelPerformance(Module):
             TSVFileEnums.TSV_EXTENSIONS.value,
             can_be_optional=True
         )
-        labels = self.input_validator.validate_input_command_line_interface_file(
+        labels = self.input_validator.validate_input_command_line_interface_files(
             parser.get_argument('labels'),
             TSVFileEnums.TSV_EXTENSIONS.value
         )
@@ -131,196 +164,217 @@ class CompareModelPerformance(Module):
             parser.get_argument('output')
         )
         force_merge = parser.get_argument('force_merge')
+        metrics_only = parser.get_argument('metrics_only')
+        workers = parser.get_argument('workers')
+        if workers['workers'] < 1:
+            raise ValueError('Workers should be at least 1.')
         return {
             **scores1,
             **scores2,
             **labels,
             **labels_2,
             **output,
-            **force_merge
+            **force_merge,
+            **metrics_only,
+            **workers
         }
 
     def run_module(self, arguments):
-        path_scores_model_1 = arguments['scores']
-        path_labels_model_1 = arguments['labels']
-        path_scores_model_2 = arguments['scores_model_2']
-        path_labels_model_2 = arguments['labels_model_2']
         self.force_merge = arguments['force_merge']
+        self.workers = arguments['workers']
 
-        self._set_model_2_presence(
-            path_scores_model_2,
-            path_labels_model_2
+        scores_paths, labels_paths = self._get_model_paths(
+            arguments['scores'],
+            arguments['labels'],
+            arguments['scores_model_2'],
+            arguments['labels_model_2']
         )
 
-        model_1, model_2 = self._read_and_parse_input_data(
-            path_scores_model_1,
-            path_labels_model_1,
-            path_scores_model_2,
-            path_labels_model_2
-        )
+        models = self._read_and_parse_input_data(scores_paths, labels_paths)
+        model_1 = models[0]
         consequence_tools = ConsequenceTools()
-        consequences = consequence_tools.has_consequence(model_1, model_2)
+        consequences = consequence_tools.has_consequence(
+            model_1,
+            models[1] if len(models) > 1 else pd.DataFrame(columns=model_1.columns)
+        )
+        for additional_model in models[2:]:
+            if consequences:
+                consequences = consequence_tools.has_consequence(model_1, additional_model)
 
         annotator = Annotator()
-        annotator.add_score_difference(model_1)
-
-        annotator.add_and_process_impute_af(model_1)
-
-        add_dataset_source(model_1, CompareModelPerformanceEnums.MODEL_1.value)
-
-        if self.model_2_present:
-            if consequences:
+        for i, model in enumerate(models):
+            if i > 0 and consequences:
                 consequence_tools.validate_consequence_samples_equal(
                     model_1,
-                    model_2,
+                    model,
                     consequences
                 )
-            annotator.add_score_difference(model_2)
-            annotator.add_and_process_impute_af(model_2)
-            add_dataset_source(model_2, CompareModelPerformanceEnums.MODEL_2.value)
-        else:
-            model_2 = pd.DataFrame(columns=model_1.columns)
-
-        plotter = Plotter(
-            process_consequences=consequences,
-            model_1_score_path=path_scores_model_1,
-            model_1_label_path=path_labels_model_1,
-            model_2_present=self.model_2_present,
-            model_2_score_path=path_scores_model_2,
-            model_2_label_path=path_labels_model_2
-        )
-        plots = plotter.plot(model_1, model_2)
-        return {**plots, DatasetIdentifierEnums.OUTPUT.value: arguments['output']}
+            annotator.add_score_difference(model)
+            annotator.add_and_process_impute_af(model)
+            add_dataset_source(
+                model,
+                CompareModelPerformanceEnums.MODEL_IDENTIFIER_PREFIX.value + str(i + 1)
+            )
 
-    def _set_model_2_presence(
-            self,
-            model_2_score_argument: Optional[str],
-            model_2_label_argument: Optional[str]
-    ) -> None:
+        metrics = MetricsCalculator(consequences).calculate(models)
+        plotter = None
+        if not arguments['metrics_only']:
+            # Imported here so that matplotlib is not imported for metrics only
+            from molgenis.capice_resources.compare_model_performance.plotter import Plotter
+            plotter = Plotter(
+                process_consequences=consequences,
+                score_paths=scores_paths,
+                label_paths=labels_paths
+            )
+            # The figures are drawn on export, so that they can be drawn over multiple workers
+            plotter.summarize(models)
+        return {
+            CMPPlottingEnums.PLOTTER.value: plotter,
+            CompareModelPerformanceEnums.METRICS.value: metrics,
+            CompareModelPerformanceEnums.AUC_PER_GENE.value: self._calculate_auc_per_gene(models),
+            DatasetIdentifierEnums.OUTPUT.value: arguments['output']
+        }
+
+    @staticmethod
+    def _get_model_paths(
+            scores: list[os.PathLike[str] | Path | str],
+            labels: list[os.PathLike[str] | Path | str],
+            scores_model_2: Optional[os.PathLike[str] | Path | str],
+            labels_model_2: Optional[os.PathLike[str] | Path | str]
+    ) -> tuple[list[os.PathLike[str] | Path | str], list[os.PathLike[str] | Path | str]]:
         """
-        Function to se the boolean value if model 2 is supplied in CLI or not.
-        Also checks if model_2_score_argument is given when model_2_label_argument is given and
-        not None, raises IOError when incorrect.
+        Function to obtain the path to the score file and the path to the label file of each
+        model, in order of model. The model of -b/--scores-model-2 is compared after the models
+        of -a/--scores and, without -m/--labels-model-2, uses the label file of model 1.
 
         Args:
-            model_2_score_argument:
-                The CLI argument for the scores of model 2.
-            model_2_label_argument:
-                The CLI argument for the labels of model 2.
+            scores:
+                List of paths to the score files of -a/--scores.
+            labels:
+                List of paths to the label files of -l/--labels: either a single file for all
+                models or a file for each of the models of -a/--scores.
+            scores_model_2:
+                (Optional) Path to the score file of -b/--scores-model-2.
+            labels_model_2:
+                (Optional) Path to the label file of -m/--labels-model-2.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the list of score file paths and [1] the list of label file
+                paths of each model.
 
         Raises:
             IOError:
-                IOError is raised when model_2_label_argument is not None,
-                but model_2_score_argument is None.
+                IOError is raised when the model 2 label file is supplied without the model 2
+                score file or when the amount of label files is neither 1 nor the amount of
+                score files.
         """
-        if model_2_score_argument is None:
-            if model_2_label_argument is None:
-                self.model_2_present = False
-            else:
-                raise IOError(
-                    'Model 2 label argument is supplied, while model 2 score argument is not.'
-                )
-        else:
-            self.model_2_present = True
+        scores_paths = list(scores)
+        labels_paths = list(labels)
+        if scores_model_2 is not None:
+            if labels_model_2 is not None or len(labels_paths) > 1:
+                if len(labels_paths) == 1:
+                    labels_paths = labels_paths * len(scores_paths)
+                labels_paths.append(labels_paths[0] if labels_model_2 is None else labels_model_2)
+            scores_paths.append(scores_model_2)
+        elif labels_model_2 is not None:
+            raise IOError(
+                'Model 2 label argument is supplied, while model 2 score argument is not.'
+            )
+        if len(labels_paths) == 1:
+            labels_paths = labels_paths * len(scores_paths)
+        elif len(labels_paths) != len(scores_paths):
+            raise IOError(
+                'Amount of label files should be 1 or equal to the amount of score files.'
+            )
+        return scores_paths, labels_paths
 
-    def _read_and_parse_input_data(
-            self,
-            scores1_argument: os.PathLike[str] | Path | str,
-            labels1_argument: os.PathLike[str] | Path | str,
-            scores2_argument: Optional[os.PathLike[str] | Path | str],
-            labels2_argument: Optional[os.PathLike[str] | Path | str]
-    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    @staticmethod
+    def _calculate_auc_per_gene(models: list[pd.DataFrame]) -> pd.DataFrame | None:
         """
-        Function to read and parse the scores and labels arguments.
+        Function to calculate the AUC of each gene of each model at once.
+
+        The gene is obtained from the "gene_name" column of the score file, or (if absent) the
+        "SYMBOL" column of the label file.
 
         Args:
-            scores1_argument:
-                Path to the score file of model 1.
-            labels1_argument:
-                Path to the label file (of model 2).
-            scores2_argument:
-                (Optional) Path to the score file of model 2.
-            labels2_argument:
-                (Optional) Argument of the label file of model 2 if supplied through CLI.
+            models:
+                List of the merged frames of the data of each model, containing the score and
+                labels.
 
         Returns:
-            tuple:
-                Tuple containing [0]: the merged frame for model 1 and [1] the merged frame for
-                model 2.
+            dataframe:
+                Frame containing for each model and gene the amount of samples, pathogenic
+                samples and benign samples and the AUC. None if neither gene column is present.
         """
-        scores_model_1 = self._read_pandas_tsv(
-            scores1_argument,
-            [
-                ColumnEnums.SCORE.value
-            ]
-        )
-        labels = self._read_pandas_tsv(
-            labels1_argument,
-            [
-                ColumnEnums.BINARIZED_LABEL.value,
-                ColumnEnums.GNOMAD_AF.value
-            ]
-        )
-        merge_model_1 = self._merge_scores_and_labes(
-            scores_model_1,
-            labels
-        )
-        merge_model_2 = self._process_model_2_merge(
-            scores2_argument,
-            labels2_argument,
-            merge_model_1
-        )
-        return merge_model_1, merge_model_2
+        gene_column = None
+        for column in [CompareModelPerformanceEnums.GENE_NAME.value, ColumnEnums.SYMBOL.value]:
+            if column in models[0].columns:
+                gene_column = column
+                break
+        if gene_column is None:
+            return None
+        aucs = []
+        for model in models:
+            codes, genes = pd.factorize(model[gene_column], sort=True)
+            positions = np.flatnonzero(codes >= 0)
+            model_aucs = PerformanceCalculator.calculate_grouped_auc(
+                model,
+                positions,
+                codes[positions],
+                genes.size
+            )
+            model_aucs.insert(0, gene_column, genes)
+            model_aucs.insert(
+                0,
+                ColumnEnums.DATASET_SOURCE.value,
+                model[ColumnEnums.DATASET_SOURCE.value].iloc[0]
+            )
+            aucs.append(model_aucs)
+        return pd.concat(aucs, ignore_index=True)
 
-    def _process_model_2_merge(
+    def _read_and_parse_input_data(
             self,
-            scores2_argument: Optional[os.PathLike[str] | Path | str],
-            labels2_argument: Optional[os.PathLike[str] | Path | str],
-            model_1_merge: pd.DataFrame
-    ) -> pd.DataFrame:
+            scores_paths: list[os.PathLike[str] | Path | str],
+            labels_paths: list[os.PathLike[str] | Path | str]
+    ) -> list[pd.DataFrame]:
         """
-        Function to fully process the model 2 score and label arguments, if present.
+        Function to read and parse the scores and labels of each model.
+
+        Each label file is read only once, so that the models that share a label file also share
+        its loaded (and, for mismatch merges, indexed) frame.
 
         Args:
-            scores2_argument:
-                The CLI argument for the model 2 scores.
-            labels2_argument:
-                The CLI argument for the model 2 labels.
-            model_1_merge:
-                The scores and labels merged dataframe for model 1.
+            scores_paths:
+                List of the paths to the score file of each model.
+            labels_paths:
+                List of the paths to the label file of each model.
 
         Returns:
-            DataFrame:
-                Always returns a pandas.DataFrame, either with scores and labels of model 2 merged,
-                scores of model 2 merged with labels of model 1 or an empty dataframe containing
-                the columns of model 1 merged frame.
+            list:
+                List containing the merged frame of each model.
         """
-        if self.model_2_present:
-            scores_model_2 = self._read_pandas_tsv(
-                scores2_argument,
-                [
-                    ColumnEnums.SCORE.value
-                ]
-            )
-            if labels2_argument is None:
-                return self._merge_scores_and_labes(
-                    scores_model_2,
-                    model_1_merge
-                )
-            else:
-                model_2_labels = self._read_pandas_tsv(
-                    labels2_argument,
-                    [
-                        ColumnEnums.BINARIZED_LABEL.value,
-                        ColumnEnums.GNOMAD_AF.value
-                    ]
-                )
-                return self._merge_scores_and_labes(
-                    scores_model_2,
-                    model_2_labels
-                )
-        else:
-            return pd.DataFrame(columns=model_1_merge.columns)
+        score_columns = [ColumnEnums.SCORE.value]
+        label_columns = [ColumnEnums.BINARIZED_LABEL.value, ColumnEnums.GNOMAD_AF.value]
+        unique_labels_paths = list(dict.fromkeys(labels_paths))
+        inputs = self._prefetch_inputs(
+            {
+                **{
+                    f'scores_{i}': partial(self._read_pandas_tsv, path, score_columns)
+                    for i, path in enumerate(scores_paths)
+                },
+                **{
+                    f'labels_{i}': partial(self._read_pandas_tsv, path, label_columns)
+                    for i, path in enumerate(unique_labels_paths)
+                }
+            }
+        )
+        return [
+            self._merge_scores_and_labes(
+                inputs[f'scores_{i}'],  # type: ignore
+                inputs[f'labels_{unique_labels_paths.index(labels_path)}']  # type: ignore
+            ) for i, labels_path in enumerate(labels_paths)
+        ]
 
     def _merge_scores_and_labes(
             self,
@@ -410,11 +464,13 @@ class CompareModelPerformance(Module):
             VCFEnums.ID_SEPARATOR.value.join, axis=1
         )
 
-        labels[
-            CompareModelPerformanceEnums.MERGE_COLUMN.value
-        ] = labels[labels_merge_columns].astype(str).agg(
-            VCFEnums.ID_SEPARATOR.value.join, axis=1
-        )
+        # Label frames shared by multiple models are only indexed once
+        if CompareModelPerformanceEnums.MERGE_COLUMN.value not in labels.columns:
+            labels[
+                CompareModelPerformanceEnums.MERGE_COLUMN.value
+            ] = labels[labels_merge_columns].astype(str).agg(
+                VCFEnums.ID_SEPARATOR.value.join, axis=1
+            )
 
         return scores.merge(
             labels,
@@ -424,10 +480,17 @@ class CompareModelPerformance(Module):
 
     def export(self, output: dict[str, Any]) -> None:
         output_path = output[DatasetIdentifierEnums.OUTPUT.value]
-        for filename, figure in output.items():
-            if filename == DatasetIdentifierEnums.OUTPUT.value:
-                continue
-            figure.savefig(os.path.join(output_path, filename + '.png'))
+        if output[CMPPlottingEnums.PLOTTER.value] is not None:
+            output[CMPPlottingEnums.PLOTTER.value].save_figures(output_path, self.workers)
+        for table in [
+            CompareModelPerformanceEnums.METRICS.value,
+            CompareModelPerformanceEnums.AUC_PER_GENE.value
+        ]:
+            if output[table] is not None:
+                self.exporter.export_pandas_file(
+                    os.path.join(output_path, table + '.tsv.gz'),  # type: ignore
+                    output[table]
+                )
 
 
 def main():
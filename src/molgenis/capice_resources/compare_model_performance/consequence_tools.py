@@ -4,6 +4,7 @@ import pandas as pd
 
 from molgenis.capice_resources.core import ColumnEnums
 from molgenis.capice_resources.utilities import split_consequences
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
 
 
 class ConsequenceTools:
@@ -40,23 +41,32 @@ class ConsequenceTools:
                 return split_consequences(merged_model_2[ColumnEnums.CONSEQUENCE.value].values)
 
     @staticmethod
-    def subset_consequence(dataframe: pd.DataFrame, consequence: str) -> pd.DataFrame:
+    def subset_consequence(
+            dataframe: pd.DataFrame,
+            consequence: str,
+            consequence_index: ConsequenceIndex | None = None
+    ) -> pd.DataFrame:
         """
         Method to subset dataframe on the presence of consequence.
 
         Args:
             dataframe:
                 The dataframe containing the Consequence column that a subset should be obtained
-                from. Please note that consequence should not exactly match, just that a sample
-                should contain consequence.
+                from. Please note that the Consequence of a sample should not exactly match, just
+                that one of the (split) consequences of a sample should be consequence.
             consequence:
                 The consequence that should lead the sub setting.
+            consequence_index:
+                (Optional) The ConsequenceIndex of the Consequence column of dataframe, to prevent
+                indexing the column for each consequence.
         Returns:
             dataframe:
                 The sub setted input dataframe in which all samples contain the consequence
                 "consequence".
         """
-        return dataframe[dataframe[ColumnEnums.CONSEQUENCE.value].str.contains(consequence)]
+        if consequence_index is None:
+            consequence_index = ConsequenceIndex(dataframe[ColumnEnums.CONSEQUENCE.value])
+        return dataframe.iloc[consequence_index.rows(consequence)]
 
     @staticmethod
     def validate_consequence_samples_equal(
@@ -78,14 +88,14 @@ class ConsequenceTools:
 
         """
         nonequal = []
+        consequence_index_1 = ConsequenceIndex(merged_model_1[ColumnEnums.CONSEQUENCE.value])
+        consequence_index_2 = ConsequenceIndex(merged_model_2[ColumnEnums.CONSEQUENCE.value])
         for consequence in splitted_consequences:
-            m1 = merged_model_1[
-                merged_model_1[ColumnEnums.CONSEQUENCE.value].str.contains(consequence)
-            ]
-            m2 = merged_model_2[
-                merged_model_2[ColumnEnums.CONSEQUENCE.value].str.contains(consequence)
-            ]
-            if m1.shape[0] != m2.shape[0] and consequence not in nonequal:
+            if (
+                    consequence_index_1.count(consequence) !=
+                    consequence_index_2.count(consequence) and
+                    consequence not in nonequal
+            ):
                 nonequal.append(consequence)
         if len(nonequal) > 0:
             warnings.warn(
@@ -0,0 +1,252 @@
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.core import ColumnEnums
+
+
+class DistributionSummaries:
+    """
+    Box plot and violin plot summaries of a column, for each benign and pathogenic subset of
+    many (possibly overlapping) groups of samples, obtained in a single grouped pass.
+
+    All (group, sample) pairs are sorted once by group, binarized label and value, after which
+    the quartiles, whiskers and outliers (as matplotlib.cbook.boxplot_stats) of all subsets
+    follow from their sorted values. The kernel density estimate of each subset (a gaussian
+    kernel with a bandwidth of BANDWIDTH times its standard deviation, evaluated on GRID_SIZE
+    points up to CUT bandwidths beyond its values, as the violin plots of seaborn) is evaluated
+    on the counts of KDE_BINS equal width bins of its values, so that drawing the plots does not
+    depend on the amount of samples.
+    """
+    WHISKER_RANGE = 1.5
+    BANDWIDTH = 0.1
+    CUT = 2
+    GRID_SIZE = 100
+    KDE_BINS = 10000
+
+    def __init__(
+            self,
+            dataset: pd.DataFrame,
+            column: str,
+            positions: np.ndarray,
+            groups: np.ndarray,
+            n_groups: int
+    ):
+        """
+        Args:
+            dataset:
+                Frame containing the Binarized_label column and column.
+            column:
+                The column to summarize.
+            positions:
+                The position within dataset of the sample of each (group, sample) pair.
+            groups:
+                The group (between 0 and n_groups) of each (group, sample) pair.
+            n_groups:
+                The amount of groups.
+        """
+        labels = dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy(dtype=np.float64)[positions]
+        values = dataset[column].to_numpy(dtype=np.float64)[positions]
+        present = np.isin(labels, [0, 1]) & ~np.isnan(values)
+        keys = groups[present] * 2 + labels[present].astype(np.intp)
+        values = values[present]
+        order = np.lexsort((values, keys))
+        self._keys = keys[order]
+        self._values = values[order]
+        n_keys = n_groups * 2
+        self.counts = np.bincount(self._keys, minlength=n_keys)
+        self._starts = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+        self.q1, self.median, self.q3 = (
+            self._quantiles(quantile) for quantile in [0.25, 0.5, 0.75]
+        )
+        self.mean = self._divide(np.bincount(self._keys, weights=self._values, minlength=n_keys))
+        self.std = np.sqrt(
+            np.bincount(
+                self._keys,
+                weights=(self._values - self.mean[self._keys]) ** 2,
+                minlength=n_keys
+            ) / np.maximum(self.counts - 1, 1)
+        )
+        self._set_whiskers_and_fliers()
+        self._set_bins()
+
+    def _divide(self, sums: np.ndarray) -> np.ndarray:
+        """
+        Function to divide the sums of each subset by its amount of samples (NaN without
+        samples).
+        """
+        divided = np.full(sums.size, np.nan)
+        np.divide(sums, self.counts, out=divided, where=self.counts > 0)
+        return divided
+
+    def _quantiles(self, quantile: float) -> np.ndarray:
+        """
+        Function to obtain the quantile of the values of each subset, linearly interpolated
+        between the closest values (as numpy.percentile).
+
+        Args:
+            quantile:
+                The quantile (between 0 and 1) to obtain.
+
+        Returns:
+            numpy.ndarray:
+                The quantile of each subset (NaN for subsets without samples).
+        """
+        present = self.counts > 0
+        index = (self.counts[present] - 1) * quantile
+        lower = np.floor(index).astype(np.intp)
+        upper = np.minimum(lower + 1, self.counts[present] - 1)
+        fraction = index - lower
+        lower_values = self._values[self._starts[present] + lower]
+        upper_values = self._values[self._starts[present] + upper]
+        difference = upper_values - lower_values
+        # As numpy.percentile, interpolating from the closest of both values
+        interpolated = np.where(
+            fraction >= 0.5,
+            upper_values - difference * (1 - fraction),
+            lower_values + difference * fraction
+        )
+        quantiles = np.full(self.counts.size, np.nan)
+        quantiles[present] = interpolated
+        return quantiles
+
+    def _set_whiskers_and_fliers(self) -> None:
+        """
+        Function to set the whiskers of each subset (the most extreme values within
+        WHISKER_RANGE times the interquartile range of the quartiles) and its outliers (the
+        values beyond the whiskers), sorted within their subset.
+        """
+        interquartile_range = self.q3 - self.q1
+        upper_limit = self.q3 + self.WHISKER_RANGE * interquartile_range
+        lower_limit = self.q1 - self.WHISKER_RANGE * interquartile_range
+        # Values are sorted within their subset, so the values within the limits are a prefix
+        # (upper) and suffix (lower) of the values of the subset.
+        n_within_upper = np.bincount(
+            self._keys[self._values <= upper_limit[self._keys]],
+            minlength=self.counts.size
+        )
+        n_within_lower = np.bincount(
+            self._keys[self._values >= lower_limit[self._keys]],
+            minlength=self.counts.size
+        )
+        self.whisker_high = self.q3.copy()
+        self.whisker_low = self.q1.copy()
+        within = n_within_upper > 0
+        self.whisker_high[within] = np.maximum(
+            self._values[self._starts[within] + n_within_upper[within] - 1],
+            self.q3[within]
+        )
+        within = n_within_lower > 0
+        self.whisker_low[within] = np.minimum(
+            self._values[self._starts[within] + self.counts[within] - n_within_lower[within]],
+            self.q1[within]
+        )
+        outlier = (
+            (self._values < self.whisker_low[self._keys]) |
+            (self._values > self.whisker_high[self._keys])
+        )
+        self._fliers = self._values[outlier]
+        self._flier_pointers = np.searchsorted(
+            self._keys[outlier],
+            np.arange(self.counts.size + 1)
+        )
+
+    def _set_bins(self) -> None:
+        """
+        Function to set the counts of the values of each subset within KDE_BINS equal width
+        bins between the minimum and maximum value of all subsets, as (subset, bin, count) runs.
+        """
+        if self._values.size == 0:
+            self._bin_width = 1.0
+            self._bin_offset = 0.0
+            self._bins = np.empty(0, dtype=np.intp)
+            self._bin_counts = np.empty(0, dtype=np.intp)
+            self._bin_pointers = np.zeros(self.counts.size + 1, dtype=np.intp)
+            return
+        self._bin_offset = np.min(self._values)
+        self._bin_width = max(np.max(self._values) - self._bin_offset, 1e-12) / self.KDE_BINS
+        bins = np.minimum(
+            ((self._values - self._bin_offset) / self._bin_width).astype(np.intp),
+            self.KDE_BINS - 1
+        )
+        # Sorted by subset and value, the bins of a subset are ascending
+        codes = self._keys * self.KDE_BINS + bins
+        run_starts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+        run_keys = self._keys[run_starts]
+        self._bins = bins[run_starts]
+        self._bin_counts = np.diff(np.append(run_starts, codes.size))
+        self._bin_pointers = np.searchsorted(run_keys, np.arange(self.counts.size + 1))
+
+    def boxplot_stats(self, group: int, label: int) -> dict[str, float | np.ndarray]:
+        """
+        Function to obtain the box plot statistics of the subset of group with label, as
+        accepted by matplotlib.axes.Axes.bxp.
+
+        Args:
+            group:
+                The group of the subset.
+            label:
+                The binarized label (0 or 1) of the subset.
+
+        Returns:
+            dict:
+                Dictionary containing the mean, median, first (q1) and third (q3) quartile, the
+                lower (whislo) and upper (whishi) whisker and the outliers (fliers) of the
+                subset. All NaN (and no outliers) for a subset without samples.
+        """
+        key = group * 2 + label
+        return {
+            'mean': self.mean[key],
+            'med': self.median[key],
+            'q1': self.q1[key],
+            'q3': self.q3[key],
+            'whislo': self.whisker_low[key],
+            'whishi': self.whisker_high[key],
+            'fliers': self._fliers[self._flier_pointers[key]:self._flier_pointers[key + 1]]
+        }
+
+    def violin_stats(self, group: int, label: int) -> dict[str, float | np.ndarray] | None:
+        """
+        Function to obtain the violin plot statistics of the subset of group with label, as
+        accepted by matplotlib.axes.Axes.violin.
+
+        Args:
+            group:
+                The group of the subset.
+            label:
+                The binarized label (0 or 1) of the subset.
+
+        Returns:
+            dict:
+                Dictionary containing the grid (coords) and kernel density estimate on the grid
+                (vals), the mean, median, minimum (min) and maximum (max) of the subset. The
+                grid is a single value for subsets of which all values are equal.
+                None for a subset without samples.
+        """
+        key = group * 2 + label
+        if self.counts[key] == 0:
+            return None
+        minimum = self._values[self._starts[key]]
+        maximum = self._values[self._starts[key] + self.counts[key] - 1]
+        bandwidth = self.std[key] * self.BANDWIDTH
+        if bandwidth == 0:
+            coords = np.array([self.median[key]])
+            density = np.ones(1)
+        else:
+            coords = np.linspace(
+                minimum - bandwidth * self.CUT,
+                maximum + bandwidth * self.CUT,
+                self.GRID_SIZE
+            )
+            runs = slice(self._bin_pointers[key], self._bin_pointers[key + 1])
+            centers = self._bin_offset + (self._bins[runs] + 0.5) * self._bin_width
+            density = np.exp(
+                -0.5 * ((coords[:, np.newaxis] - centers[np.newaxis, :]) / bandwidth) ** 2
+            ) @ self._bin_counts[runs] / (self.counts[key] * bandwidth * np.sqrt(2 * np.pi))
+        return {
+            'coords': coords,
+            'vals': density,
+            'mean': self.mean[key],
+            'median': self.median[key],
+            'min': minimum,
+            'max': maximum
+        }
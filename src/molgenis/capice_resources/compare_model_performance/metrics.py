@@ -0,0 +1,240 @@
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.core import ColumnEnums, AlleleFrequencyEnums
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
+from molgenis.capice_resources.compare_model_performance import CMPPlottingEnums, \
+    CompareModelPerformanceEnums
+from molgenis.capice_resources.compare_model_performance.performance_calculator import \
+    PerformanceCalculator
+
+
+class MetricsCalculator:
+    """
+    Calculator of the performance metrics that are plotted by the Plotter (the AUC and the
+    score difference statistics of the global dataset, of each consequence and of each allele
+    frequency bin), without plotting them, so that it does not require matplotlib.
+    """
+    SCORE_DIFF_STATISTICS = {
+        'mean': 'mean',
+        'q1': '25%',
+        'median': '50%',
+        'q3': '75%'
+    }
+
+    def __init__(self, process_consequences: list[str] | bool):
+        """
+        Args:
+            process_consequences:
+                The list (or False) of all the unique and split consequences.
+        """
+        self.process_consequences = process_consequences
+
+    def calculate(self, merged_models_data: list[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Main function of the MetricsCalculator class.
+
+        Args:
+            merged_models_data:
+                List of the merged frames of the data of each model. Contains both the score and
+                labels frames.
+
+        Returns:
+            dataframe:
+                Frame containing for each model and subset (Global, each consequence and each
+                allele frequency bin) the amount of samples, pathogenic samples and benign
+                samples, the AUC and the mean, first quartile, median and third quartile of the
+                absolute score difference.
+        """
+        metrics = []
+        for model in merged_models_data:
+            model_metrics = self._calculate_model_metrics(model)
+            model_metrics.insert(
+                0,
+                ColumnEnums.DATASET_SOURCE.value,
+                model[ColumnEnums.DATASET_SOURCE.value].iloc[0]
+            )
+            metrics.append(model_metrics)
+        return pd.concat(metrics, ignore_index=True)
+
+    def _calculate_model_metrics(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        """
+        Function to calculate the metrics of all subsets of the dataset of a single model at
+        once, by assigning all subsets their own group.
+
+        Args:
+            dataset:
+                Merged frame of the data of a model, containing the score and labels.
+
+        Returns:
+            dataframe:
+                Frame containing the subset type and subset and the metrics of each subset.
+        """
+        subset_positions, subset_groups = self.subset_groups(dataset, self.process_consequences)
+        positions = [subset_positions]
+        groups = [subset_groups]
+        consequences = self.consequences_to_process(self.process_consequences)
+        subset_types = [CMPPlottingEnums.GLOBAL.value]
+        subset_types += [ColumnEnums.CONSEQUENCE.value] * len(consequences)
+        subsets = [CMPPlottingEnums.GLOBAL.value] + consequences
+
+        af_positions, af_groups = self.af_bin_groups(dataset)
+        positions.append(af_positions)
+        groups.append(af_groups + len(subsets))
+        subset_types += [CompareModelPerformanceEnums.AF_BIN.value] * len(
+            AlleleFrequencyEnums.AF_BINS.value
+        )
+        subsets += self._af_bin_names()
+
+        positions = np.concatenate(positions)
+        groups = np.concatenate(groups)
+        metrics = PerformanceCalculator.calculate_grouped_auc(
+            dataset,
+            positions,
+            groups,
+            len(subsets)
+        )
+        score_diff = pd.Series(
+            dataset[CompareModelPerformanceEnums.SCORE_DIFF.value].to_numpy(
+                dtype=np.float64
+            )[positions]
+        ).groupby(groups).describe().reindex(range(len(subsets)))
+        for name, statistic in self.SCORE_DIFF_STATISTICS.items():
+            metrics[f'{CompareModelPerformanceEnums.SCORE_DIFF.value}_{name}'] = score_diff[
+                statistic
+            ].to_numpy()
+        metrics.insert(0, CompareModelPerformanceEnums.SUBSET.value, subsets)
+        metrics.insert(0, CompareModelPerformanceEnums.SUBSET_TYPE.value, subset_types)
+        return metrics
+
+    @staticmethod
+    def _af_bin_names() -> list[str]:
+        """
+        Function to obtain the names of the allele frequency bins of af_bin_groups().
+
+        Returns:
+            list:
+                List containing the name of each allele frequency bin.
+        """
+        bins = AlleleFrequencyEnums.AF_BINS.value
+        return ['0'] + [f'{bins[i - 1]}-{bins[i]}' for i in range(1, len(bins))]
+
+    @staticmethod
+    def consequences_to_process(process_consequences: list[str] | bool) -> list[str]:
+        """
+        Function to obtain the list of consequences to process.
+
+        Args:
+            process_consequences:
+                The list (or False) of all the unique and split consequences to process.
+
+        Returns:
+            list:
+                The consequences to process, empty when process_consequences is not a list.
+        """
+        if isinstance(process_consequences, list):
+            return process_consequences
+        return []
+
+    @staticmethod
+    def subset_groups(
+            dataset: pd.DataFrame,
+            process_consequences: list[str] | bool
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to assign the samples of dataset to the Global group (0) and to the group of
+        each of the (split) consequences to process they contain (1 up to and including the
+        amount of consequences to process), in the order of process_consequences.
+
+        Args:
+            dataset:
+                Merged frame of the data of a model, containing the Consequence column if
+                process_consequences is a list.
+            process_consequences:
+                The list (or False) of all the unique and split consequences to process.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the position within dataset and [1] the group of each
+                (group, sample) pair.
+        """
+        positions = [np.arange(dataset.shape[0])]
+        groups = [np.zeros(dataset.shape[0], dtype=np.intp)]
+        consequences = MetricsCalculator.consequences_to_process(process_consequences)
+        if consequences:
+            consequence_index = ConsequenceIndex(dataset[ColumnEnums.CONSEQUENCE.value])
+            # Model 1 is leading, consequences absent from dataset have no samples
+            consequence_ids = {
+                consequence: i + 1 for i, consequence in enumerate(consequences)
+            }
+            consequence_positions, consequence_groups = MetricsCalculator.consequence_groups(
+                consequence_index
+            )
+            mapping = np.array(
+                [
+                    consequence_ids.get(consequence, -1)
+                    for consequence in consequence_index.consequences
+                ],
+                dtype=np.intp
+            )
+            consequence_groups = mapping[consequence_groups]
+            processed = consequence_groups >= 0
+            positions.append(consequence_positions[processed])
+            groups.append(consequence_groups[processed])
+        return np.concatenate(positions), np.concatenate(groups)
+
+    @staticmethod
+    def consequence_groups(consequence_index: ConsequenceIndex) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to assign the samples to the (split) consequences they contain.
+
+        Args:
+            consequence_index:
+                The ConsequenceIndex of the Consequence column of a dataset.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the position within the dataset and [1] the position of the
+                consequence in consequence_index.consequences of each (consequence, sample)
+                pair.
+        """
+        return (
+            consequence_index.positions,
+            np.repeat(
+                np.arange(len(consequence_index.consequences)),
+                np.diff(consequence_index.pointers)
+            )
+        )
+
+    @staticmethod
+    def af_bin_groups(dataset: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to assign the samples of dataset to the allele frequency bins of the allele
+        frequency plot: bin 0 contains all samples with an allele frequency of 0 (imputed or
+        not), bins 1 up to the amount of AF_BINS contain the non-imputed samples between the
+        lower bound (inclusive) and upper bound (exclusive, except for the last bin) of the
+        bin. Samples can therefore be a member of both bin 0 and bin 1.
+
+        Args:
+            dataset:
+                The dataframe containing the gnomAD AF and imputed columns.
+        Returns:
+            tuple:
+                Tuple containing [0] the position within dataset and [1] the bin of each
+                (bin, sample) pair.
+        """
+        allele_frequency = dataset[ColumnEnums.GNOMAD_AF.value].to_numpy(dtype=np.float64)
+        bins = np.array(AlleleFrequencyEnums.AF_BINS.value)
+        af_bins = np.searchsorted(bins, allele_frequency, side='right')
+        # The upper bound of the last bin is inclusive
+        af_bins[allele_frequency == bins[-1]] = bins.size - 1
+        binned = np.flatnonzero(
+            (af_bins >= 1) &
+            (af_bins < bins.size) &
+            ~dataset[ColumnEnums.IMPUTED.value].to_numpy(dtype=bool)
+        )
+        zero = np.flatnonzero(allele_frequency == 0)
+        return (
+            np.concatenate([zero, binned]),
+            np.concatenate([np.zeros(zero.size, dtype=np.intp), af_bins[binned]])
+        )
@@ -1,23 +1,35 @@
+import warnings
+from collections.abc import Hashable
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import roc_curve, roc_auc_score
+from sklearn.exceptions import UndefinedMetricWarning
+from sklearn.metrics import roc_curve, auc
+from sklearn.utils import check_array
 
 from molgenis.capice_resources.core import ColumnEnums
+from molgenis.capice_resources.compare_model_performance import CompareModelPerformanceEnums
 
 
 class PerformanceCalculator:
     def __init__(self, ignore_zero_sample_error: bool = False):
         """
+        The ROC curve and the AUC of a dataset are obtained from a single sort of its scores
+        (a single "roc_curve" call, of which the AUC is the area under the curve, equal to
+        "roc_auc_score"). When a key identifying the dataset (for instance the model and the
+        consequence it is a subset of) is supplied, the curve and AUC are cached, so that they
+        are only calculated once for each key.
+
         Args:
             ignore_zero_sample_error:
                 Boolean value to ignore the errors raised by "roc_curve" and "roc_auc_score"
                 when the functions are supplied with empty dataframes or emtpy series.
         """
         self.ignore_zero_sample_error = ignore_zero_sample_error
+        self._cache: dict[Hashable, tuple[np.ndarray, np.ndarray, float]] = {}
 
-    def calculate_auc(self, dataset: pd.DataFrame) -> float:
+    def calculate_auc(self, dataset: pd.DataFrame, key: Hashable | None = None) -> float:
         """
         Method to calculate the Area Under Curve (AUC) for a given dataframe containing the SCORE
         and Binarized_label columns.
@@ -26,6 +38,8 @@ class PerformanceCalculator:
             dataset:
                 frame containing the SCORE and Binarized_label columns over which an AUC should
                 be calculated.
+            key:
+                (Optional) Key identifying dataset, to cache the ROC curve and AUC with.
         Returns:
             float:
                 Rounded float of the Area Under Curve on 4 decimals.
@@ -37,7 +51,7 @@ class PerformanceCalculator:
         """
         if self.ignore_zero_sample_error:
             try:
-                return self._calculate_auc(dataset)
+                return self._calculate_auc(dataset, key)
             except ValueError as e:
                 if str(e) != "Found array with 0 sample(s) (shape=(0,)) " \
                              "while a minimum of 1 is required.":
@@ -45,21 +59,18 @@ class PerformanceCalculator:
                 else:
                     return np.nan
         else:
-            return self._calculate_auc(dataset)
+            return self._calculate_auc(dataset, key)
 
-    @staticmethod
-    def _calculate_auc(dataset: pd.DataFrame) -> float:
-        return round(
-                roc_auc_score(
-                    y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
-                    y_score=dataset[ColumnEnums.SCORE.value]
-                ),
-                4
-            )
+    def _calculate_auc(self, dataset: pd.DataFrame, key: Hashable | None) -> float:
+        if key not in self._cache:
+            # The input validation of "roc_auc_score", which precedes the ROC curve
+            check_array(dataset[ColumnEnums.BINARIZED_LABEL.value], ensure_2d=False, dtype=None)
+        return self._calculate_roc_auc(dataset, key)[2]
 
     def calculate_roc(
             self,
-            dataset: pd.DataFrame
+            dataset: pd.DataFrame,
+            key: Hashable | None = None
     ) -> tuple[Any, Any, float]:
         """
         Method to calculate the False Positive Rate (FPR), True Positive Rate (TPR) and Area
@@ -69,6 +80,8 @@ class PerformanceCalculator:
             dataset:
                 frame containing the SCORE and Binarized_label columns over which the FPR,
                 TPR and AUC should be calculated.
+            key:
+                (Optional) Key identifying dataset, to cache the ROC curve and AUC with.
         Returns:
             tuple:
                 Tuple containing [0] False Positive Rate (numpy.array) [1] True Positive Rate (
@@ -83,22 +96,124 @@ class PerformanceCalculator:
                       "either make y_true take value in {0, 1} or {-1, 1} or " \
                       "pass pos_label explicitly."
             try:
-                fpr, tpr = self._calculate_fpr_tpr(dataset)
-                return fpr, tpr, self._calculate_auc(dataset)
+                return self._calculate_roc_auc(dataset, key)
             except ValueError as e:
                 if str(e) != message:
                     raise
                 else:
                     return np.nan, np.nan, np.nan
         else:
-            fpr, tpr = self._calculate_fpr_tpr(dataset)
-            return fpr, tpr, self._calculate_auc(dataset)
+            return self._calculate_roc_auc(dataset, key)
+
+    def _calculate_roc_auc(
+            self,
+            dataset: pd.DataFrame,
+            key: Hashable | None
+    ) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Method to obtain the FPR, TPR and AUC of dataset from a single ROC curve, cached on key.
+
+        Args:
+            dataset:
+                frame containing the SCORE and Binarized_label columns.
+            key:
+                Key identifying dataset. Not cached if None.
+        Returns:
+            tuple:
+                Tuple containing [0] False Positive Rate, [1] True Positive Rate and [2] Area
+                Under Curve (rounded to 4 decimals).
+        Raises:
+            ValueError:
+                ValueError is raised when dataset is empty, contains invalid labels or contains
+                only one class (for which the AUC is not defined).
+        """
+        if key is not None and key in self._cache:
+            return self._cache[key]
+        with warnings.catch_warnings():
+            # Raised below as the ValueError of "roc_auc_score" instead
+            warnings.simplefilter('ignore', UndefinedMetricWarning)
+            fpr, tpr, _ = roc_curve(
+                y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
+                y_score=dataset[ColumnEnums.SCORE.value]
+            )
+        # Without positive or without negative samples, the TPR or FPR is not defined
+        if np.isnan(fpr).any() or np.isnan(tpr).any():
+            raise ValueError(
+                'Only one class present in y_true. ROC AUC score is not defined in that case.'
+            )
+        result = fpr, tpr, round(auc(fpr, tpr), 4)
+        if key is not None:
+            self._cache[key] = result
+        return result
 
     @staticmethod
-    def _calculate_fpr_tpr(
-            dataset: pd.DataFrame
-    ) -> tuple[np.ndarray, np.ndarray]:
-        return roc_curve(
-            y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
-            y_score=dataset[ColumnEnums.SCORE.value]
-        )[0:2]
+    def calculate_grouped_auc(
+            dataset: pd.DataFrame,
+            positions: np.ndarray,
+            groups: np.ndarray,
+            n_groups: int
+    ) -> pd.DataFrame:
+        """
+        Method to calculate the AUC of many (possibly overlapping) groups of samples of dataset
+        at once, through the Mann-Whitney U formulation of the AUC: the sum of the (tie
+        averaged) ranks of the pathogenic samples within their group, minus its minimum, divided
+        by the amount of pathogenic-benign pairs of the group.
+
+        All (group, sample) pairs are ranked in a single sort by group and score, after which
+        the rank sums and sample counts of all groups follow from one grouped sum. A sample can
+        be a member of multiple groups (for instance each of its split consequences) by
+        supplying its position once for each group.
+
+        Args:
+            dataset:
+                frame containing the SCORE and Binarized_label columns.
+            positions:
+                The position within dataset of the sample of each (group, sample) pair.
+            groups:
+                The group (between 0 and n_groups) of each (group, sample) pair.
+            n_groups:
+                The amount of groups.
+        Returns:
+            dataframe:
+                Frame containing for each group (by index) the amount of samples, pathogenic
+                samples and benign samples and the AUC (rounded to 4 decimals). The AUC is NaN
+                for groups without pathogenic or benign samples, or with samples that have no
+                label or score.
+        """
+        labels = dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy(dtype=np.float64)[positions]
+        scores = dataset[ColumnEnums.SCORE.value].to_numpy(dtype=np.float64)[positions]
+        n_samples = np.bincount(groups, minlength=n_groups)
+        missing = np.isnan(labels) | np.isnan(scores)
+        undefined = np.bincount(groups[missing], minlength=n_groups) > 0
+        groups = groups[~missing]
+        labels = labels[~missing]
+        scores = scores[~missing]
+        order = np.lexsort((scores, groups))
+        groups = groups[order]
+        scores = scores[order]
+        pathogenic = labels[order] == 1
+        # Ties (equal score within the same group) share the average of their ranks
+        tie_start = np.ones(groups.size, dtype=bool)
+        tie_start[1:] = (groups[1:] != groups[:-1]) | (scores[1:] != scores[:-1])
+        tie_starts = np.flatnonzero(tie_start)
+        tie_ends = np.append(tie_starts[1:], groups.size)
+        tie_ranks = (tie_starts + tie_ends + 1) / 2
+        group_starts = np.searchsorted(groups, groups[tie_starts], side='left')
+        ranks = np.repeat(tie_ranks - group_starts, tie_ends - tie_starts)
+        n_pathogenic = np.bincount(groups[pathogenic], minlength=n_groups)
+        n_benign = np.bincount(groups[~pathogenic], minlength=n_groups)
+        rank_sums = np.bincount(groups[pathogenic], weights=ranks[pathogenic], minlength=n_groups)
+        pairs = n_pathogenic * n_benign
+        undefined |= pairs == 0
+        auc = np.full(n_groups, np.nan)
+        auc[~undefined] = (
+            rank_sums[~undefined] - n_pathogenic[~undefined] * (n_pathogenic[~undefined] + 1) / 2
+        ) / pairs[~undefined]
+        return pd.DataFrame(
+            {
+                CompareModelPerformanceEnums.N_SAMPLES.value: n_samples,
+                CompareModelPerformanceEnums.N_PATHOGENIC.value: n_pathogenic,
+                CompareModelPerformanceEnums.N_BENIGN.value: n_benign,
+                CompareModelPerformanceEnums.AUC.value: auc.round(4)
+            }
+        )
@@ -1,31 +1,64 @@
 import math
 import os
-from typing import Optional
+import colorsys
+from functools import partial
+from collections.abc import Callable
+from typing import Literal, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 import pandas as pd
-import seaborn as sns
 from matplotlib import pyplot as plt
+from matplotlib import colors as mcolors
 from matplotlib import patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 
 from molgenis.capice_resources.core import ColumnEnums, PlottingEnums, AlleleFrequencyEnums
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
 from molgenis.capice_resources.compare_model_performance import CMPPlottingEnums
+from molgenis.capice_resources.compare_model_performance.metrics import MetricsCalculator
+from molgenis.capice_resources.compare_model_performance.distribution_summaries import \
+    DistributionSummaries
 from molgenis.capice_resources.compare_model_performance.consequence_tools import ConsequenceTools
 from molgenis.capice_resources.compare_model_performance.performance_calculator import \
     PerformanceCalculator
 from molgenis.capice_resources.compare_model_performance import CompareModelPerformanceEnums
 
 
+class Subplot(NamedTuple):
+    """
+    What the subplot of a subset (the Global dataset or a consequence) is drawn from.
+    """
+    title: str
+    aucs: list[float]
+    sizes: list[int]
+    # Amount of benign and pathogenic samples of each model
+    label_counts: list[tuple[int, int]]
+
+
 class Plotter:
+    FIGURE_NAMES = [
+        CMPPlottingEnums.FIG_ROC.value,
+        CMPPlottingEnums.FIG_AUC.value,
+        CMPPlottingEnums.FIG_AF.value,
+        CMPPlottingEnums.FIG_B_DIST.value,
+        CMPPlottingEnums.FIG_V_DIST.value,
+        CMPPlottingEnums.FIG_B_DIFF.value,
+        CMPPlottingEnums.FIG_V_DIFF.value
+    ]
+    MODEL_COLORS = ['red', 'blue', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive',
+                    'cyan']
+    # Violins are drawn as seaborn.violinplot(saturation=0.75, width=0.8, inner='box')
+    VIOLIN_SATURATION = 0.75
+    VIOLIN_WIDTH = 0.8
+    VIOLIN_LINE_COLOR = '.25'
+
     def __init__(
             self,
             process_consequences: list[str] | bool,
-            model_1_score_path: os.PathLike[str] | str,
-            model_1_label_path: os.PathLike[str] | str,
-            model_2_present: bool,
-            model_2_score_path: Optional[os.PathLike[str] | str],
-            model_2_label_path: Optional[os.PathLike[str] | str],
+            score_paths: list[os.PathLike[str] | str],
+            label_paths: list[os.PathLike[str] | str]
     ):
         """
         Init of the Plotter class.
@@ -34,21 +67,22 @@ class Plotter:
         Args:
             process_consequences:
                 The list (or False) of all the unique and split consequences.
-            model_1_score_path:
-                The path to the model 1 score file.
-            model_1_label_path:
-                The path to the model 1 label file.
-            model_2_present:
-                Whenever model 2 data is supplied (True) or not (False).
-            model_2_score_path:
-                (Optional) The path to the model 2 score file.
-            model_2_label_path:
-                (Optional) The path to the model 2 label file.
-        """
-        # Not because ignore_zero_sample_error is the inverse of model_2_present
-        self.calculator = PerformanceCalculator(not model_2_present)
+            score_paths:
+                The paths to the score file of each model, in order of model.
+            label_paths:
+                The paths to the label file of each model, in order of model.
+        """
+        self.n_models = len(score_paths)
+        # A single model is plotted without comparison, in which case subsets without samples
+        # are allowed
+        self.calculator = PerformanceCalculator(self.n_models == 1)
         self.process_consequences = process_consequences
         self.index = 1
+        self.summary_groups: dict[str, int] = {}
+        self.summaries: list[dict[str, DistributionSummaries]] = []
+        self.rocs: list[tuple[np.ndarray, np.ndarray, float]] = []
+        self.af_bin_aucs: list[pd.DataFrame] = []
+        self.subplots: list[Subplot] = []
         self.fig_auc = plt.figure()
         self.fig_roc = plt.figure()
         self.fig_afb = plt.figure()
@@ -56,16 +90,43 @@ class Plotter:
         self.fig_score_dist_vio = plt.figure()
         self.fig_score_diff_box = plt.figure()
         self.fig_score_diff_vio = plt.figure()
-        self.model_2_present = model_2_present
-        self.model_1_score_path = self._get_basename_from_path(model_1_score_path)
-        self.model_1_label_path = self._get_basename_from_path(model_1_label_path)
-        self.model_2_score_path = self._get_basename_from_path(model_2_score_path)
-        self.model_2_label_path = self._get_basename_from_path(model_2_label_path)
+        self.score_paths = [self._get_basename_from_path(path) for path in score_paths]
+        self.label_paths = [self._get_basename_from_path(path) for path in label_paths]
         self._prepare_figure_supertitle_and_size()
         self.n_rows = 1
         self.n_cols = 1
         self._set_nrows_and_ncols()
 
+    @staticmethod
+    def _model_name(model: int) -> str:
+        """
+        Function to obtain the name of a model in the plots.
+
+        Args:
+            model:
+                The (0-based) index of the model.
+
+        Returns:
+            str:
+                The name of the model, starting at "Model 1".
+        """
+        return f'Model {model + 1}'
+
+    @classmethod
+    def _model_color(cls, model: int) -> str:
+        """
+        Function to obtain the color of a model in the plots.
+
+        Args:
+            model:
+                The (0-based) index of the model.
+
+        Returns:
+            str:
+                The matplotlib color of the model.
+        """
+        return cls.MODEL_COLORS[model % len(cls.MODEL_COLORS)]
+
     @staticmethod
     def _get_basename_from_path(
             path: Optional[os.PathLike[str] | str]
@@ -108,15 +169,10 @@ class Plotter:
         figsize = self._set_figure_size(self.process_consequences)
         print('Preparing plots.')
 
-        figure_supertitle = f'Model 1 scores: {os.path.basename(self.model_1_score_path)}\n' \
-                            f'Model 1 labels: {os.path.basename(self.model_1_label_path)}\n'
-
-        if self.model_2_present:
-            if self.model_2_label_path is None:
-                self.model_2_label_path = self.model_1_label_path
-
-            figure_supertitle += f'Model 2 scores: {os.path.basename(self.model_2_score_path)}\n' \
-                                 f'Model 2 labels: {os.path.basename(self.model_2_label_path)}\n'
+        figure_supertitle = ''
+        for model, (score_path, label_path) in enumerate(zip(self.score_paths, self.label_paths)):
+            figure_supertitle += f'{self._model_name(model)} scores: {score_path}\n' \
+                                 f'{self._model_name(model)} labels: {label_path}\n'
 
         self._set_size_supertitle_layout(
             self.fig_auc,
@@ -186,9 +242,7 @@ class Plotter:
         figure.set_dpi(PlottingEnums.DPI.value)
         figure.set_figwidth(figure_size[0])
         figure.set_figheight(figure_size[1])
-        supertitle = 'Model 1'
-        if self.model_2_present:
-            supertitle += ' vs Model 2'
+        supertitle = ' vs '.join(self._model_name(model) for model in range(self.n_models))
         figure.suptitle(
             f'{supertitle} {figure_supertitle}'
         )
@@ -219,148 +273,298 @@ class Plotter:
         else:
             print('Creating single plot per figure.\n')
 
-    def plot(
-            self,
-            merged_model_1_data: pd.DataFrame,
-            merged_model_2_data: pd.DataFrame
-    ) -> dict[str, plt.Figure]:
+    def plot(self, models: list[pd.DataFrame]) -> dict[str, plt.Figure]:
         """
         Main function of the plotter class.
 
         Args:
-            merged_model_1_data:
-                Merged frame of the model 1 data. Contains both the score and labels frames.
-            merged_model_2_data:
-                Merged frame of the model 2 data.
-                Contains both the score and labels frames.
-                Can be empty.
+            models:
+                List of the merged frame of the data of each model, in order of model. Each
+                frame contains both the score and labels frames.
 
         Returns:
             dict:
                 Dictionary containing [key] figure name and [value] the figure itself.
         """
-        m1_samples = merged_model_1_data.shape[0]
-        m2_samples = merged_model_2_data.shape[0]
+        self.summarize(models)
+        return {figure_name: self.draw(figure_name) for figure_name in self.FIGURE_NAMES}
+
+    def summarize(self, models: list[pd.DataFrame]) -> None:
+        """
+        Function to calculate everything the figures are drawn from for all models at once: the
+        ROC curves, the AUC, sample sizes and label counts of the Global dataset and each
+        consequence, the AUC of each allele frequency bin and the box plot and violin plot
+        summaries. Afterwards, each figure can be drawn on its own, without the models.
 
-        print('Plotting global ROC, AUC, AF Bins, Score distributions and Score differences.')
-        self._plot_roc_auc_afbins(merged_model_1_data, m1_samples, merged_model_2_data, m2_samples)
-        self._plot_score_dist(merged_model_1_data, m1_samples, merged_model_2_data, m2_samples,
-                              CMPPlottingEnums.GLOBAL.value)
-        self._plot_score_diff(merged_model_1_data, m1_samples, merged_model_2_data, m2_samples,
-                              CMPPlottingEnums.GLOBAL.value)
-        print('Plotting globally done.\n')
+        Args:
+            models:
+                List of the merged frame of the data of each model, in order of model. Each
+                frame contains both the score and labels frames.
+        """
+        print('Summarizing global ROC, AUC, AF Bins, Score distributions and Score differences.')
+        self._summarize(models)
+        self.rocs = [
+            self.calculator.calculate_roc(
+                model_data,
+                (
+                    CompareModelPerformanceEnums.MODEL_IDENTIFIER_PREFIX.value + str(model + 1),
+                    CMPPlottingEnums.GLOBAL.value
+                )
+            ) for model, model_data in enumerate(models)
+        ]
+        self.af_bin_aucs = [
+            self.calculator.calculate_grouped_auc(
+                model,
+                *MetricsCalculator.af_bin_groups(model),
+                len(AlleleFrequencyEnums.AF_BINS.value)
+            ) for model in models
+        ]
+        self.subplots = [
+            self._summarize_subplot(
+                CMPPlottingEnums.GLOBAL.value,
+                models,
+                [roc[2] for roc in self.rocs]
+            )
+        ]
         if self.process_consequences:
-            print('Plotting per consequence.')
-            self.index += 1
-            self._plot_consequences(merged_model_1_data, merged_model_2_data)
-            print('Plotting per consequence done.\n')
-
-        return {
-            CMPPlottingEnums.FIG_ROC.value: self.fig_roc,
-            CMPPlottingEnums.FIG_AUC.value: self.fig_auc,
-            CMPPlottingEnums.FIG_AF.value: self.fig_afb,
-            CMPPlottingEnums.FIG_B_DIST.value: self.fig_score_dist_box,
-            CMPPlottingEnums.FIG_V_DIST.value: self.fig_score_dist_vio,
-            CMPPlottingEnums.FIG_B_DIFF.value: self.fig_score_diff_box,
-            CMPPlottingEnums.FIG_V_DIFF.value: self.fig_score_diff_vio
+            print('Summarizing per consequence.')
+            self._summarize_consequences(models)
+        print('Summarizing done.\n')
+
+    def draw(self, figure_name: str) -> plt.Figure:
+        """
+        Function to draw a single figure from the summaries obtained through summarize().
+
+        Args:
+            figure_name:
+                The name of the figure to draw, one of FIGURE_NAMES.
+
+        Returns:
+            matplotlib.pyplot.Figure:
+                The drawn figure.
+        """
+        print(f'Plotting {figure_name}.')
+        figures: dict[str, tuple[plt.Figure, Callable[[plt.Figure], None]]] = {
+            CMPPlottingEnums.FIG_ROC.value: (self.fig_roc, self._plot_roc),
+            CMPPlottingEnums.FIG_AUC.value: (self.fig_auc, self._plot_aucs),
+            CMPPlottingEnums.FIG_AF.value: (self.fig_afb, self._plot_af_bins),
+            CMPPlottingEnums.FIG_B_DIST.value: (
+                self.fig_score_dist_box,
+                partial(self._plot_boxplots, ColumnEnums.SCORE.value)
+            ),
+            CMPPlottingEnums.FIG_V_DIST.value: (
+                self.fig_score_dist_vio,
+                partial(self._plot_violinplots, ColumnEnums.SCORE.value)
+            ),
+            CMPPlottingEnums.FIG_B_DIFF.value: (
+                self.fig_score_diff_box,
+                partial(self._plot_boxplots, CompareModelPerformanceEnums.SCORE_DIFF.value)
+            ),
+            CMPPlottingEnums.FIG_V_DIFF.value: (
+                self.fig_score_diff_vio,
+                partial(self._plot_violinplots, CompareModelPerformanceEnums.SCORE_DIFF.value)
+            )
         }
+        figure, plot_function = figures[figure_name]
+        plot_function(figure)
+        return figure
 
-    def _plot_roc_auc_afbins(
-            self,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int
-    ) -> None:
+    def save_figures(self, output_path: os.PathLike[str] | str, workers: int = 1) -> None:
         """
-        Function to house the calls to the ROC, AUC and Allele Frequency bin plotters for global
-        performance.
+        Function to draw each of the figures and save them as PNG to the output directory.
+
+        With multiple workers, each figure is drawn and saved on a process of its own, as
+        drawing and rendering the per-consequence figures is single core work. The workers only
+        receive the summaries (see summarize()), not the models or drawn figures.
 
         Args:
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in model_1_data.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in model_2_data.
-
-        """
-        fpr_m1, tpr_m1, auc_m1 = self.calculator.calculate_roc(model_1_data)
-        fpr_m2, tpr_m2, auc_m2 = self.calculator.calculate_roc(model_2_data)
-        self._plot_roc(fpr_m1, tpr_m1, auc_m1, fpr_m2, tpr_m2, auc_m2)
-        self._plot_auc(auc_m1, model_1_size, auc_m2, model_2_size, CMPPlottingEnums.GLOBAL.value)
-        self._plot_af_bins(model_1_data, model_2_data)
-
-    def _plot_consequences(
-            self,
-            merged_model_1_data: pd.DataFrame,
-            merged_model_2_data: pd.DataFrame
-    ) -> None:
+            output_path:
+                The output directory.
+            workers:
+                The (maximum) amount of processes to draw and save the figures with. Default: 1.
+        """
+        paths = [
+            os.path.join(output_path, figure_name + '.png') for figure_name in self.FIGURE_NAMES
+        ]
+        if workers > 1:
+            with ProcessPoolExecutor(
+                    max_workers=min(workers, len(self.FIGURE_NAMES))
+            ) as executor:
+                list(executor.map(self._draw_and_save_figure, self.FIGURE_NAMES, paths))
+        else:
+            for figure_name, path in zip(self.FIGURE_NAMES, paths):
+                self.draw(figure_name).savefig(path)
+
+    def _draw_and_save_figure(self, figure_name: str, path: os.PathLike[str] | str) -> None:
+        """
+        Function to draw and save a figure within a worker process, on the non-interactive Agg
+        canvas regardless of the backend of the worker.
+
+        Args:
+            figure_name:
+                The name of the figure to draw, one of FIGURE_NAMES.
+            path:
+                The path to save the figure to.
+        """
+        figure = self.draw(figure_name)
+        FigureCanvasAgg(figure)
+        figure.savefig(path)
+
+    def _summarize(self, models: list[pd.DataFrame]) -> None:
+        """
+        Function to obtain the box plot and violin plot summaries of the scores and score
+        differences of the Global dataset and each consequence of all models at once, from
+        which all box plots and violin plots are drawn.
+
+        Args:
+            models:
+                List of the merged frame of the data of each model, containing the score and
+                labels.
+        """
+        self.summary_groups = {CMPPlottingEnums.GLOBAL.value: 0}
+        consequences = MetricsCalculator.consequences_to_process(self.process_consequences)
+        for i, consequence in enumerate(consequences):
+            self.summary_groups[consequence] = i + 1
+        self.summaries = []
+        for model in models:
+            positions, groups = MetricsCalculator.subset_groups(model, self.process_consequences)
+            self.summaries.append(
+                {
+                    column: DistributionSummaries(
+                        model,
+                        column,
+                        positions,
+                        groups,
+                        len(self.summary_groups)
+                    ) for column in [
+                        ColumnEnums.SCORE.value,
+                        CompareModelPerformanceEnums.SCORE_DIFF.value
+                    ]
+                }
+            )
+
+    @staticmethod
+    def _summarize_subplot(title: str, models: list[pd.DataFrame], aucs: list[float]) -> Subplot:
+        """
+        Function to obtain what a subplot of a subset is drawn from.
+
+        Args:
+            title:
+                String of what the subplot represents (a consequence or Global).
+            models:
+                List of the subset of the score and label data of each model.
+            aucs:
+                List of the AUC of the subset of each model.
+
+        Returns:
+            Subplot:
+                The title, AUCs, sample sizes and label counts of the subplot.
+        """
+        label_counts = []
+        for model in models:
+            labels = model[ColumnEnums.BINARIZED_LABEL.value]
+            label_counts.append((int((labels == 0).sum()), int((labels == 1).sum())))
+        return Subplot(title, aucs, [model.shape[0] for model in models], label_counts)
+
+    def _summarize_consequences(self, models: list[pd.DataFrame]) -> None:
         """
-        Function to call each of the plotters on a per consequence base.
+        Function to obtain what the subplot of each consequence is drawn from.
 
         Args:
-            merged_model_1_data:
-                Merged frame of the data of model 1, containing the score and labels.
-            merged_model_2_data:
-                Merged frame of the data of model 2, containing the score and labels.
+            models:
+                List of the merged frame of the data of each model, containing the score and
+                labels.
 
         """
         consequence_tools = ConsequenceTools()
+        consequence_indexes = [
+            ConsequenceIndex(model[ColumnEnums.CONSEQUENCE.value]) for model in models
+        ]
+        aucs = [
+            self._calculate_consequence_aucs(model, consequence_index)
+            for model, consequence_index in zip(models, consequence_indexes)
+        ]
         for consequence in self.process_consequences:  # type: ignore
-            subset_m1 = consequence_tools.subset_consequence(merged_model_1_data, consequence)
-            m1_samples = subset_m1.shape[0]
-            subset_m2 = consequence_tools.subset_consequence(merged_model_2_data, consequence)
-            m2_samples = subset_m2.shape[0]
-            try:
-                auc_m1 = self.calculator.calculate_auc(subset_m1)
-                auc_m2 = self.calculator.calculate_auc(subset_m2)
-            except ValueError:
-                auc_m1 = np.NaN
-                auc_m2 = np.NaN
-
-            self._plot_auc(auc_m1, m1_samples, auc_m2, m2_samples, consequence)
-            self._plot_score_dist(subset_m1, m1_samples, subset_m2, m2_samples, consequence)
-            self._plot_score_diff(subset_m1, m1_samples, subset_m2, m2_samples, consequence)
-            self.index += 1
-
-    def _plot_roc(
+            self.subplots.append(
+                self._summarize_subplot(
+                    consequence,
+                    [
+                        consequence_tools.subset_consequence(model, consequence, consequence_index)
+                        for model, consequence_index in zip(models, consequence_indexes)
+                    ],
+                    self._get_aucs(
+                        [
+                            model_aucs.loc[consequence, CompareModelPerformanceEnums.AUC.value]
+                            for model_aucs in aucs
+                        ]
+                    )
+                )
+            )
+
+    def _calculate_consequence_aucs(
             self,
-            fpr_model_1: np.ndarray,
-            tpr_model_1: np.ndarray,
-            auc_model_1: float,
-            fpr_model_2: np.ndarray,
-            tpr_model_2: np.ndarray,
-            auc_model_2: float
-    ) -> None:
+            dataset: pd.DataFrame,
+            consequence_index: ConsequenceIndex
+    ) -> pd.DataFrame:
         """
-        Plotter method for specifically the Receiver Operator Curve plot.
+        Function to calculate the AUC of each of the consequences to process at once.
 
         Args:
-            fpr_model_1:
-                Float of the False Positive Rate of model 1.
-            tpr_model_1:
-                Float of the True Positive Rate of model 1.
-            auc_model_1:
-                Float of the Area Under Curve of model 1.
-            fpr_model_2:
-                Float of the False Positive Rate of model 2.
-            tpr_model_2:
-                Float of the True Positive Rate of model 2.
-            auc_model_2:
-                Float of the False Positive Rate of model 2.
+            dataset:
+                Merged frame of the data of a model, containing the score and labels.
+            consequence_index:
+                The ConsequenceIndex of the Consequence column of dataset.
+
+        Returns:
+            dataframe:
+                Frame containing (indexed by consequence) the amount of samples and AUC of each
+                of the consequences to process, as obtained from
+                PerformanceCalculator.calculate_grouped_auc().
+        """
+        aucs = self.calculator.calculate_grouped_auc(
+            dataset,
+            *MetricsCalculator.consequence_groups(consequence_index),
+            len(consequence_index.consequences)
+        )
+        aucs.index = consequence_index.consequences
+        # Consequences absent from dataset have no samples and thus no AUC
+        return aucs.reindex(MetricsCalculator.consequences_to_process(self.process_consequences))
+
+    @staticmethod
+    def _get_aucs(aucs: list[float]) -> list[float]:
+        """
+        Function to obtain the AUCs of each model of the same subset to plot: if the AUC of any
+        model is not available, none is plotted.
+
+        Args:
+            aucs:
+                List of the AUC of each model.
+
+        Returns:
+            list:
+                List of the AUC of each model to plot.
+        """
+        if any(math.isnan(auc) for auc in aucs):
+            return [np.NaN] * len(aucs)
+        return aucs
+
+    def _plot_roc(self, figure: plt.Figure) -> None:
+        """
+        Plotter method for specifically the Receiver Operator Curve plot, of the global ROC
+        curve of each model.
+
+        Args:
+            figure:
+                The ROC matplotlib.pyplot.Figure to plot on.
         """
         # Plotting ROCs
-        ax_roc = self.fig_roc.add_subplot(1, 1, 1)
-        ax_roc.plot(fpr_model_1, tpr_model_1, color='red', label=f'Model 1 (AUC={auc_model_1})')
-        if self.model_2_present:
+        ax_roc = figure.add_subplot(1, 1, 1)
+        for model, (fpr, tpr, auc) in enumerate(self.rocs):
             ax_roc.plot(
-                fpr_model_2,
-                tpr_model_2,
-                color='blue',
-                label=f'Model 2 (AUC={auc_model_2})'
+                fpr,
+                tpr,
+                color=self._model_color(model),
+                label=f'{self._model_name(model)} (AUC={auc})'
             )
         ax_roc.plot([0, 1], [0, 1], color='black', linestyle='--')
         ax_roc.set_xlim(0.0, 1.0)
@@ -372,10 +576,8 @@ class Plotter:
     def _create_af_bins_plotlabels(
             self,
             bin_label: str,
-            model_1_size: int,
-            model_1_auc: float,
-            model_2_size: int,
-            model_2_auc: float
+            sizes: list[int],
+            aucs: list[float]
     ) -> str:
         """
         Creates a label specifically for the allele frequency bins
@@ -385,7 +587,7 @@ class Plotter:
                 {bin_label}
                 Model 1: {auc}
                 [Model 2: {auc}]
-                {sample_size}
+                n: {sample_size}
                 {\n}
 
             If not:
@@ -394,66 +596,25 @@ class Plotter:
                 [Model 2: {auc} (n: {sample_size})]
                 {\n}
 
-            [] means optional. Will not appear if model 2 data is not supplied.
+            [] means for each additional model. Will not appear if only model 1 is supplied.
         """
-        label = f'{bin_label}\nModel 1: {model_1_auc}'
-        if self.model_2_present:
-            if model_1_size == model_2_size:
-                label += f'\nModel 2: {model_2_auc}\nn: {model_1_size}'
-            else:
-                label += f' (n: {model_1_size})\nModel 2: {model_2_auc} (n: {model_2_size})'
+        label = bin_label
+        if self.n_models > 1 and len(set(sizes)) > 1:
+            for model, (size, auc) in enumerate(zip(sizes, aucs)):
+                label += f'\n{self._model_name(model)}: {auc} (n: {size})'
         else:
-            label += f'\nn: {model_1_size}'
+            for model, auc in enumerate(aucs):
+                label += f'\n{self._model_name(model)}: {auc}'
+            label += f'\nn: {sizes[0]}'
         return label
 
-    @staticmethod
-    def _subset_af_bin(
-            dataset: pd.DataFrame,
-            upper_bound: float | int,
-            lower_bound: float | int,
-            last_iter: bool = False
-    ) -> pd.DataFrame:
-        """
-        Function to subset "dataset" based upon the upper_bound and lower_bound.
-        Last_iter is to prevent that the last iteration includes the upper bound.
-
-        Args:
-            dataset:
-                The dataframe that should be subset upon.
-            upper_bound:
-                The lower bound that the subset should start from (and include).
-            lower_bound:
-                The lower bound that the subset should start from (and include, except when
-                last_iter is set to True).
-            last_iter:
-                Boolean True if the last iteration on the allele frequency bins has been reached.
-        Returns:
-            subset:
-                Subset of "dataset" that only contains samples between upper bound and lower
-                bound allele frequencies.
-        """
-        if last_iter:
-            return dataset[
-                (dataset[ColumnEnums.GNOMAD_AF.value] >= lower_bound) &
-                (dataset[ColumnEnums.GNOMAD_AF.value] <= upper_bound) &
-                (~dataset[ColumnEnums.IMPUTED.value])
-                ]
-        else:
-            return dataset[
-                (dataset[ColumnEnums.GNOMAD_AF.value] >= lower_bound) &
-                (dataset[ColumnEnums.GNOMAD_AF.value] < upper_bound) &
-                (~dataset[ColumnEnums.IMPUTED.value])
-                ]
-
     def _plot_bin(
             self,
             ax: plt.Axes,
             x_index: int,
             label: str,
-            auc_m1: float,
-            m1_ss: int,
-            auc_m2: float,
-            m2_ss: int
+            aucs: list[float],
+            sizes: list[int]
     ) -> None:
         """
         Plotter function of the plot allele frequencies function.
@@ -465,101 +626,65 @@ class Plotter:
                 The x-index on which the bars should be placed.
             label:
                 The label the bars should get.
-            auc_m1:
-                The AUC of model 1.
-            m1_ss:
-                The sample size of model 1.
-            auc_m2:
-                The AUC of model 2.
-            m2_ss:
-                The sample size of model 2.
-
-        """
-        width = 0.3
-        if self.model_2_present:
-            ax.bar(
-                x_index - width,
-                auc_m1,
-                width,
-                align='edge',
-                color='red'
-            )
-        else:
-            ax.bar(
-                x_index,
-                auc_m1,
-                width,
-                align='center',
-                color='red'
-            )
+            aucs:
+                List of the AUC of each model.
+            sizes:
+                List of the sample size of each model.
 
-        if self.model_2_present:
-            ax.bar(
-                x_index,
-                auc_m2,
-                width,
-                align='edge',
-                color='blue'
-            )
+        """
+        if self.n_models == 1:
+            ax.bar(x_index, aucs[0], 0.3, align='center', color=self._model_color(0))
+        else:
+            # The bars of all models together are as wide as the 2 bars of 2 models
+            width = 0.6 / self.n_models
+            for model, auc in enumerate(aucs):
+                ax.bar(
+                    x_index - 0.3 + model * width,
+                    auc,
+                    width,
+                    align='edge',
+                    color=self._model_color(model)
+                )
         ax.plot(
             np.NaN,
             np.NaN,
             color='none',
-            label=self._create_af_bins_plotlabels(
-                label,
-                m1_ss,
-                auc_m1,
-                m2_ss,
-                auc_m2
-            )
+            label=self._create_af_bins_plotlabels(label, sizes, aucs)
         )
 
-    def _plot_af_bins(
-            self,
-            model_1_data: pd.DataFrame,
-            model_2_data: pd.DataFrame
-    ) -> None:
+    def _plot_af_bins(self, figure: plt.Figure) -> None:
         """
         Main function of the Allele Frequency plotting capability.
         Loops through the AF bins and calls the plotter function for each bin.
-        Adds the plots to the AF bins figure.
 
         Args:
-            model_1_data:
-                Merged frame of the data of model 1, containing the score and labels.
-            model_2_data:
-                Merged frame of the data of model 2, containing the score and labels.
+            figure:
+                The AF bins matplotlib.pyplot.Figure to plot on.
 
         """
-        ax_afb = self.fig_afb.add_subplot(1, 1, 1)
+        ax_afb = figure.add_subplot(1, 1, 1)
         bin_labels = []
 
+        bins = AlleleFrequencyEnums.AF_BINS.value
+        aucs = self.af_bin_aucs
+
         # Plotting the NaN AF values as if they were singletons
         # Including imputed and non-imputed 0
-        try:
-            f_auc_m1 = self.calculator.calculate_auc(
-                model_1_data[model_1_data[ColumnEnums.GNOMAD_AF.value] == 0]
-            )
-            f_auc_m2 = self.calculator.calculate_auc(
-                model_2_data[model_2_data[ColumnEnums.GNOMAD_AF.value] == 0]
-            )
-        except ValueError:
+        f_aucs = self._get_aucs(
+            [model_aucs.loc[0, CompareModelPerformanceEnums.AUC.value] for model_aucs in aucs]
+        )
+        if math.isnan(f_aucs[0]):
             print('Could not calculate an AUC for possible singleton variants.')
-            f_auc_m1 = np.NaN
-            f_auc_m2 = np.NaN
         bin_labels.append('"0"')
 
         self._plot_bin(
             ax_afb,
             0,
             '"0"',
-            f_auc_m1,
-            model_1_data[model_1_data[ColumnEnums.GNOMAD_AF.value] == 0].shape[0],
-            f_auc_m2,
-            model_2_data[model_2_data[ColumnEnums.GNOMAD_AF.value] == 0].shape[0]
+            f_aucs,
+            [model_aucs.loc[0, CompareModelPerformanceEnums.N_SAMPLES.value] for model_aucs in aucs]
         )
 
-        bins = AlleleFrequencyEnums.AF_BINS.value
         # Sadly bins*100 doesn't work for 1e-6, cause of rounding errors
         bins_labels = [0, 1e-4, 1e-3, 0.01, 0.1, 1, 100]
         for i in range(1, len(bins)):
@@ -568,18 +693,14 @@ class Plotter:
             if upper_bound == bins[-1]:
                 last_iter = True
             lower_bound = bins[i - 1]
-            subset_m1 = self._subset_af_bin(model_1_data, upper_bound, lower_bound, last_iter)
-            subset_m2 = self._subset_af_bin(model_2_data, upper_bound, lower_bound, last_iter)
-            try:
-                auc_m1 = self.calculator.calculate_auc(subset_m1)
-                auc_m2 = self.calculator.calculate_auc(subset_m2)
-            except ValueError:
+            bin_aucs = self._get_aucs(
+                [model_aucs.loc[i, CompareModelPerformanceEnums.AUC.value] for model_aucs in aucs]
+            )
+            if math.isnan(bin_aucs[0]):
                 print(
                     f'Could not calculate AUC for allele frequency bin: '
                     f'{lower_bound}-{upper_bound}'
                 )
-                auc_m1 = np.NaN
-                auc_m2 = np.NaN
             if last_iter:
                 bin_label = f'{bins_labels[i - 1]} <= x <= {bins_labels[i]}%'
             else:
@@ -590,23 +711,18 @@ class Plotter:
                 ax_afb,
                 i,
                 bin_label,
-                auc_m1,
-                subset_m1.shape[0],
-                auc_m2,
-                subset_m2.shape[0]
+                bin_aucs,
+                [
+                    model_aucs.loc[i, CompareModelPerformanceEnums.N_SAMPLES.value]
+                    for model_aucs in aucs
+                ]
             )
-        ax_afb.plot(
-            np.NaN,
-            np.NaN,
-            color='red',
-            label='= Model 1'
-        )
-        if self.model_2_present:
+        for model in range(self.n_models):
             ax_afb.plot(
                 np.NaN,
                 np.NaN,
-                color='blue',
-                label='= Model 2'
+                color=self._model_color(model),
+                label=f'= {self._model_name(model)}'
             )
         ax_afb.set_xticks(list(range(0, len(bins))), bin_labels, rotation=45)
         ax_afb.set_xlabel('Allele frequency Bin')
@@ -615,36 +731,48 @@ class Plotter:
         ax_afb.set_xlim(-0.5, len(bins) - 0.5)
         ax_afb.legend(loc=CMPPlottingEnums.LOC.value, bbox_to_anchor=(1.0, 1.01), labelspacing=2)
 
-    @staticmethod
     def _create_auc_label(
-            model_1_auc: float,
-            model_1_size: int,
-            model_2_auc: float,
-            model_2_size: int
-    ) -> tuple[str, str, Optional[str]]:
+            self,
+            aucs: list[float],
+            sizes: list[int]
+    ) -> tuple[list[str], Optional[str]]:
         """
         Creates the label for specifically AUC (sub)plots
 
-        Returns tuple of 3:
-        - Label for model 1. If element 3 returns None, contains sample size as well.
-        - Label for model 2. If element 3 returns None, contains sample size as well.
-        - Label for legend title (if sample sizes match).
+        Returns tuple of 2:
+        - List of the label of each model. If element 2 returns None, contains sample size as
+            well.
+        - Label for legend title (if sample sizes of multiple models match).
             Returns None (matplotlib legend title default) if sample
-        sizes do not match.
+        sizes do not match or if only model 1 is supplied.
         """
-        if model_1_size == model_2_size:
-            return f'Model 1: {model_1_auc}', f'Model 2: {model_2_auc}', f'n: {model_1_size}'
+        if self.n_models > 1 and len(set(sizes)) == 1:
+            return [
+                f'{self._model_name(model)}: {auc}' for model, auc in enumerate(aucs)
+            ], f'n: {sizes[0]}'
         else:
-            return f'Model 1: {model_1_auc}\nn: {model_1_size}', \
-                   f'Model 2: {model_2_auc}\nn: {model_2_size}', \
-                   None
+            return [
+                f'{self._model_name(model)}: {auc}\nn: {size}'
+                for model, (auc, size) in enumerate(zip(aucs, sizes))
+            ], None
+
+    def _plot_aucs(self, figure: plt.Figure) -> None:
+        """
+        Function to plot the Area Under Curve subplot of each subset.
+
+        Args:
+            figure:
+                The AUC matplotlib.pyplot.Figure to plot on.
+        """
+        for index, subplot in enumerate(self.subplots):
+            self.index = index + 1
+            self._plot_auc(figure, subplot.aucs, subplot.sizes, subplot.title)
 
     def _plot_auc(
             self,
-            model_1_auc: float,
-            model_1_size: int,
-            model_2_auc: float,
-            model_2_size: int,
+            figure: plt.Figure,
+            aucs: list[float],
+            sizes: list[int],
             title: str
     ) -> None:
         """
@@ -652,176 +780,98 @@ class Plotter:
         Adds the plot to the AUC figure.
 
         Args:
-            model_1_auc:
-                The AUC of model 1.
-            model_1_size:
-                The sample size of model 1.
-            model_2_auc:
-                The AUC of model 2.
-            model_2_size:
-                The sample size of model 2.
+            figure:
+                The AUC matplotlib.pyplot.Figure to plot on.
+            aucs:
+                List of the AUC of each model.
+            sizes:
+                List of the sample size of each model.
             title:
                 String of what the subplot represents (a consequence or Global).
 
         """
         # Plotting AUCs
-        ax_auc = self.fig_auc.add_subplot(self.n_rows, self.n_cols, self.index)
-        labels = self._create_auc_label(
-            model_1_auc, model_1_size, model_2_auc, model_2_size
-        )
-
-        xticks = [1]
-        xticklabels = ['Model 1']
-        not_available_x_index = 1.0
-        xlim = (0.0, 2.0)
+        ax_auc = figure.add_subplot(self.n_rows, self.n_cols, self.index)
+        labels, legend_title = self._create_auc_label(aucs, sizes)
 
-        ax_auc.bar(1, model_1_auc, color='red', label=labels[0])
-        if self.model_2_present:
-            ax_auc.bar(2, model_2_auc, color='blue', label=labels[1])
-            xticks.append(2)
-            xticklabels.append('Model 2')
-            not_available_x_index = 1.5
-            xlim = (0.0, 3.0)
+        for model, (auc, label) in enumerate(zip(aucs, labels)):
+            ax_auc.bar(model + 1, auc, color=self._model_color(model), label=label)
 
-        if math.isnan(model_1_auc):
+        if math.isnan(aucs[0]):
             ax_auc.text(
-                not_available_x_index, 0.5, "Not available",
+                (self.n_models + 1) / 2, 0.5, "Not available",
                 fontsize='x-large',
                 horizontalalignment='center',
                 verticalalignment='center'
             )
 
         ax_auc.set_title(title)
-        ax_auc.set_xticks(xticks, xticklabels)
-        ax_auc.set_xlim(xlim)
+        ax_auc.set_xticks(
+            list(range(1, self.n_models + 1)),
+            [self._model_name(model) for model in range(self.n_models)]
+        )
+        ax_auc.set_xlim((0.0, self.n_models + 1.0))
         ax_auc.set_ylim(0.0, 1.0)
-        ax_auc.legend(loc=CMPPlottingEnums.LOC.value, bbox_to_anchor=(1.0, 1.02), title=labels[2])
+        ax_auc.legend(
+            loc=CMPPlottingEnums.LOC.value,
+            bbox_to_anchor=(1.0, 1.02),
+            title=legend_title
+        )
 
-    def _plot_score_dist(
-            self,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int,
-            title: str
-    ) -> None:
+    def _plot_boxplots(self, column_to_plot: str, figure: plt.Figure) -> None:
         """
-        Caller function for creating a boxplot and violinplot of the score distributions.
+        Function to plot the boxplot subplot of each subset.
 
         Args:
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in model_1_data.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in model_2_data.
-            title:
-                String of what the subplot represents (a consequence or Global).
-
+            column_to_plot:
+                The column that should be used for plotting boxplot comparison on.
+            figure:
+                The boxplot matplotlib.pyplot.Figure to plot on.
         """
-        self._create_boxplot_for_column(
-            self.fig_score_dist_box,
-            ColumnEnums.SCORE.value,
-            model_1_data,
-            model_1_size,
-            model_2_data,
-            model_2_size,
-            title
-        )
-        self._create_violinplot_for_column(
-            self.fig_score_dist_vio,
-            ColumnEnums.SCORE.value,
-            model_1_data,
-            model_1_size,
-            model_2_data,
-            model_2_size,
-            title
-        )
+        for index, subplot in enumerate(self.subplots):
+            self.index = index + 1
+            self._create_boxplot_for_column(figure, column_to_plot, subplot)
 
-    def _plot_score_diff(
-            self,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int,
-            title: str
-    ) -> None:
+    def _plot_violinplots(self, column_to_plot: str, figure: plt.Figure) -> None:
         """
-        Caller function for creating a boxplot and violinplot of the absolute score differences.
+        Function to plot the violin plot subplot of each subset.
 
         Args:
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in model_1_data.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in model_2_data.
-            title:
-                String of what the subplot represents (a consequence or Global).
-
+            column_to_plot:
+                The column that should be used for plotting violin plot comparison on.
+            figure:
+                The violin plot matplotlib.pyplot.Figure to plot on.
         """
-        self._create_boxplot_for_column(
-            self.fig_score_diff_box,
-            CompareModelPerformanceEnums.SCORE_DIFF.value,
-            model_1_data,
-            model_1_size,
-            model_2_data,
-            model_2_size,
-            title
-        )
-        self._create_violinplot_for_column(
-            self.fig_score_diff_vio,
-            CompareModelPerformanceEnums.SCORE_DIFF.value,
-            model_1_data,
-            model_1_size,
-            model_2_data,
-            model_2_size,
-            title
-        )
+        for index, subplot in enumerate(self.subplots):
+            self.index = index + 1
+            self._create_violinplot_for_column(figure, column_to_plot, subplot)
 
     def _create_boxplot_label(
             self,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int,
+            sizes: list[int],
+            label_counts: list[tuple[int, int]],
             return_iterable: bool = False
     ) -> str | list[str]:
         """
         Generic function to create a boxplot label.
 
         Args:
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in model_1_data.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in model_2_data.
+            sizes:
+                List of the amount of samples of each model.
+            label_counts:
+                List of the amount of benign and pathogenic samples of each model.
             return_iterable:
                 Whenever the result should be returned as iterable (True) or single string (False)
         Returns:
             out:
-                Tuple (in case return_tuple=True) containing [0] the label for model 1 and [1]
-                the label for model 2. If return_tuple=False,
-                returns both labels joined together in a single string.
+                List (in case return_iterable=True) containing the label of each model. If
+                return_iterable=False, returns all labels joined together in a single string.
 
         """
-        n_benign_m1 = model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 0].shape[0]
-        n_patho_m1 = model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 1].shape[0]
-        n_benign_m2 = model_2_data[model_2_data[ColumnEnums.BINARIZED_LABEL.value] == 0].shape[0]
-        n_patho_m2 = model_2_data[model_2_data[ColumnEnums.BINARIZED_LABEL.value] == 1].shape[0]
-        return_value = [
-            f'Model 1:\nT: {model_1_size}\nB: {n_benign_m1}\nP: {n_patho_m1}'
-        ]
-        if self.model_2_present:
+        return_value = []
+        for model, (size, (n_benign, n_pathogenic)) in enumerate(zip(sizes, label_counts)):
             return_value.append(
-                f'Model 2:\nT: {model_2_size}\nB: {n_benign_m2}\nP: {n_patho_m2}'
+                f'{self._model_name(model)}:\nT: {size}\nB: {n_benign}\nP: {n_pathogenic}'
             )
         if return_iterable:
             return return_value
@@ -832,14 +882,11 @@ class Plotter:
             self,
             plot_figure: plt.Figure,
             column_to_plot: str,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int,
-            title: str
+            subplot: Subplot
     ) -> None:
         """
-        Plotter function to create a boxplot.
+        Plotter function to create a boxplot, drawn from the box plot summaries of the title
+        subset.
         Adds the plot to the boxplot "plot_figure".
 
         Args:
@@ -847,56 +894,30 @@ class Plotter:
                 The matplotlib.pyplot.Figure object to which the plot add to.
             column_to_plot:
                 The column that should be used for plotting boxplot comparison on.
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in the data of model 1.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in the data of model 2.
-            title:
-                The string of what the subplot should have as title (consequence or Global)
+            subplot:
+                The Subplot of the subset to plot.
 
         """
         ax = plot_figure.add_subplot(self.n_rows, self.n_cols, self.index)
-        boxplot_data = [
-                model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 0][column_to_plot],
-                model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 1][column_to_plot]
-            ]
+        group = self.summary_groups[subplot.title]
+        boxplot_stats = [
+            self.summaries[model][column_to_plot].boxplot_stats(group, label)
+            for label in [0, 1] for model in range(self.n_models)
+        ]
         boxplot_labels = [
-                'Model 1\nBenign',
-                'Model 1\nPathogenic'
-            ]
-        if self.model_2_present:
-            boxplot_data.insert(
-                1,
-                model_2_data[model_2_data[ColumnEnums.BINARIZED_LABEL.value] == 0][column_to_plot]
-            )
-            boxplot_data.append(
-                model_2_data[model_2_data[ColumnEnums.BINARIZED_LABEL.value] == 1][column_to_plot]
-            )
-            boxplot_labels.insert(
-                1,
-                'Model 2\nBenign'
-            )
-            boxplot_labels.append(
-                'Model 2\nPathogenic'
-            )
+            f'{self._model_name(model)}\n{label}'
+            for label in ['Benign', 'Pathogenic'] for model in range(self.n_models)
+        ]
 
-        ax.boxplot(boxplot_data, label=boxplot_labels)
+        ax.bxp(boxplot_stats, label=boxplot_labels)
         ax.plot(
             np.NaN,
             np.NaN,
             color='none',
-            label=self._create_boxplot_label(
-                model_1_data,
-                model_1_size,
-                model_2_data,
-                model_2_size)
+            label=self._create_boxplot_label(subplot.sizes, subplot.label_counts)
         )
         ax.set_ylim(0.0, 1.0)
-        ax.set_title(title)
+        ax.set_title(subplot.title)
         ax.legend(
             loc=CMPPlottingEnums.LOC.value,
             bbox_to_anchor=(1.0, 1.02),
@@ -907,96 +928,67 @@ class Plotter:
             self,
             plot_figure: plt.Figure,
             column_to_plot: str,
-            model_1_data: pd.DataFrame,
-            model_1_size: int,
-            model_2_data: pd.DataFrame,
-            model_2_size: int,
-            title: str
+            subplot: Subplot
     ) -> None:
         """
-        Plotter function to create a violin plot.
+        Plotter function to create a violin plot, drawn from the violin plot summaries of the
+        title subset.
         Adds the plot to the violin plot "plot_figure".
 
+        2 models are drawn as split violins (model 1 left, model 2 right), more models as
+        violins next to each other.
+
         Args:
             plot_figure:
                 The matplotlib.pyplot.Figure object to which the plot add to.
             column_to_plot:
                 The column that should be used for plotting boxplot comparison on.
-            model_1_data:
-                The dataframe of the score and label data of model 1.
-            model_1_size:
-                The amount of samples in the data of model 1.
-            model_2_data:
-                The dataframe of the score and label data of model 2.
-            model_2_size:
-                The amount of samples in the data of model 2.
-            title:
-                The string of what the subplot should have as title (consequence or Global)
+            subplot:
+                The Subplot of the subset to plot.
 
         """
         ax = plot_figure.add_subplot(self.n_rows, self.n_cols, self.index)
-        split = self._assign_violinplot_split(model_1_size, model_2_size)
-        # Sadly, due to the nature of Seaborn, no other option than adding a fake "benign variant"
-        # is possible, removing the variant after plotting.
-        benign_present = True
-        if (
-                model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 0].shape[0] == 0 and
-                model_2_data[model_2_data[ColumnEnums.BINARIZED_LABEL.value] == 0].shape[0] == 0
-        ):
-            # hacky wacky
-            benign_present = False
-        if not benign_present:
-            model_1_data = pd.concat(
-                [
-                    model_1_data,
-                    pd.DataFrame(
-                        {
-                            ColumnEnums.BINARIZED_LABEL.value: [0.0]
-                        }
+        group = self.summary_groups[subplot.title]
+        split = self._assign_violinplot_split(subplot.sizes)
+        dodge = self.n_models > 2
+        width = self.VIOLIN_WIDTH / self.n_models if dodge else self.VIOLIN_WIDTH
+        violins = []
+        for model in range(self.n_models):
+            side: Literal['both', 'low', 'high'] = 'both'
+            if split:
+                side = 'low' if model == 0 else 'high'
+            offset = (model - (self.n_models - 1) / 2) * width if dodge else 0.0
+            for label in [0, 1]:
+                violin_stats = self.summaries[model][column_to_plot].violin_stats(group, label)
+                if violin_stats is not None:
+                    violins.append(
+                        (
+                            label + offset,
+                            side,
+                            self._model_color(model),
+                            violin_stats,
+                            self.summaries[model][column_to_plot].boxplot_stats(group, label)
+                        )
                     )
-                ], ignore_index=True
-            )
-        if self.model_2_present:
-            violinplot_data = pd.concat([model_1_data, model_2_data], ignore_index=True)
-        else:
-            violinplot_data = model_1_data
-        sns.violinplot(
-            # sort_values to ensure that x axis tick 0 is always binarized_label 0 (benign)
-            data=violinplot_data.sort_values(
-                by=[
-                    ColumnEnums.DATASET_SOURCE.value,
-                    ColumnEnums.BINARIZED_LABEL.value
-                ]
-            ),
-            x=ColumnEnums.BINARIZED_LABEL.value,
-            y=column_to_plot,
-            hue=ColumnEnums.DATASET_SOURCE.value,
-            ax=ax,
-            split=split,
-            bw=0.1,
-            palette={
-                CompareModelPerformanceEnums.MODEL_1.value: 'red',
-                CompareModelPerformanceEnums.MODEL_2.value: 'blue'
-            },
-            legend=False
-        )
-        if not benign_present:
-            model_1_data.drop(
-                index=model_1_data[model_1_data[ColumnEnums.BINARIZED_LABEL.value] == 0].index,
-                inplace=True
-            )
+        # Violins of the same axes are scaled to the same area
+        norm = max([violin[3]['vals'].max() for violin in violins], default=1.0)
+        for position, side, color, violin_stats, boxplot_stats in violins:
+            self._draw_violin(ax, position, side, color, violin_stats, boxplot_stats, norm, width)
         labels = self._create_boxplot_label(
-            model_1_data, model_1_size, model_2_data, model_2_size, return_iterable=True
+            subplot.sizes,
+            subplot.label_counts,
+            return_iterable=True
         )
-        handles = [mpatches.Patch(color='red', label=labels[0])]
-        if self.model_2_present:
-            handles.append(mpatches.Patch(color='blue', label=labels[1]))
+        handles = [
+            mpatches.Patch(color=self._model_color(model), label=label)
+            for model, label in enumerate(labels)
+        ]
         ax.set_ylim(0.0, 1.0)
         ax.set_xlim(-0.5, 1.5)
         ax.set_xticks((0.0, 1.0))
         ax.set_xticklabels(['benign', 'pathogenic'])
         ax.set_xlabel('label')
-        ax.set_title(title)
+        ax.set_title(subplot.title)
         ax.legend(
             handles=handles,
             loc=CMPPlottingEnums.LOC.value,
@@ -1004,29 +996,109 @@ class Plotter:
             labelspacing=2
         )
 
+    def _draw_violin(
+            self,
+            ax: plt.Axes,
+            position: float,
+            side: Literal['both', 'low', 'high'],
+            color: str,
+            violin_stats: dict[str, float | np.ndarray],
+            boxplot_stats: dict[str, float | np.ndarray],
+            norm: float,
+            width: float
+    ) -> None:
+        """
+        Function to draw a (half) violin and its inner box from its summaries.
+
+        Args:
+            ax:
+                The matplotlib.pyplot.Axes to draw the violin on.
+            position:
+                The x position of the violin.
+            side:
+                The side of position to draw the violin on: "low", "high" or "both".
+            color:
+                The color of the model of the violin.
+            violin_stats:
+                The violin plot summary of the violin, see DistributionSummaries.violin_stats().
+            boxplot_stats:
+                The box plot summary of the violin, see DistributionSummaries.boxplot_stats().
+            norm:
+                The largest density of all violins of ax, which is drawn at full width.
+            width:
+                The full width of the violin.
+        """
+        half_width = width / 2
+        left = position - half_width if side in ['both', 'low'] else position
+        right = position + half_width if side in ['both', 'high'] else position
+        if violin_stats['coords'].size == 1:  # type: ignore
+            # All values are equal, no density to draw
+            ax.hlines(violin_stats['coords'], left, right, color=self.VIOLIN_LINE_COLOR)
+        else:
+            body = ax.violin(
+                [violin_stats],
+                positions=[position],
+                widths=[width * violin_stats['vals'].max() / norm],  # type: ignore
+                side=side,
+                showextrema=False
+            )['bodies'][0]
+            body.set_facecolor(self._desaturate(color, self.VIOLIN_SATURATION))
+            body.set_edgecolor(self.VIOLIN_LINE_COLOR)
+            body.set_alpha(1)
+        offset = {'low': -0.02, 'high': 0.02, 'both': 0.0}[side]
+        ax.vlines(
+            position + offset,
+            boxplot_stats['whislo'],
+            boxplot_stats['whishi'],
+            color=self.VIOLIN_LINE_COLOR,
+            linewidth=1
+        )
+        ax.vlines(
+            position + offset,
+            boxplot_stats['q1'],
+            boxplot_stats['q3'],
+            color=self.VIOLIN_LINE_COLOR,
+            linewidth=4
+        )
+        ax.scatter(
+            position + offset,
+            boxplot_stats['med'],
+            color='white',
+            s=10,
+            zorder=3
+        )
+
     @staticmethod
-    def _assign_violinplot_split(
-            model_1_size: int,
-            model_2_size: int
-    ) -> bool:
+    def _desaturate(color: str, proportion: float) -> tuple[float, float, float]:
         """
-        Method to check if both model_1_data is present and model_2_data is present.
-        Returns True if both model_1_size and model_2_size are not 0. If any of the 2 is 0,
-        returns False. This is to prevent ValueError
-        "ValueError: There must be exactly two hue levels to use `split`." raise from
-        Seaborn.Violinplot.
+        Function to reduce the saturation of color to proportion of its saturation.
 
         Args:
-            model_1_size:
-                The number of samples from the model 1 dataframe.
-            model_2_size:
-                The number of samples from the model 2 dataframe.
+            color:
+                The matplotlib color to desaturate.
+            proportion:
+                The proportion of the saturation to keep.
+
+        Returns:
+            tuple:
+                The RGB values of the desaturated color.
+        """
+        hue, lightness, saturation = colorsys.rgb_to_hls(*mcolors.to_rgb(color))
+        return colorsys.hls_to_rgb(hue, lightness, saturation * proportion)
+
+    @staticmethod
+    def _assign_violinplot_split(sizes: list[int]) -> bool:
+        """
+        Method to check if exactly 2 models are compared and both have samples, in which case
+        the violins are split between model 1 and model 2. If either of the 2 has no samples,
+        a split violin would only be half drawn.
+
+        Args:
+            sizes:
+                List of the number of samples of each model.
 
         Returns:
             bool
-                False if either model_1_size is 0 or model_2_size is 0, else True.
+                True if there are 2 models and neither has 0 samples, else False.
         """
-        if model_1_size == 0 or model_2_size == 0:
-            return False
-        else:
-            return True
+        return len(sizes) == 2 and 0 not in sizes
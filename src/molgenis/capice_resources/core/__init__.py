@@ -4,8 +4,12 @@ from enum import Enum
 from pathlib import Path
 from abc import abstractmethod, ABCMeta
 from argparse import ArgumentParser
+from collections.abc import Iterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
 from molgenis.capice_resources.core.exporter import Exporter
 from molgenis.capice_resources.core.validator import InputValidator, DataValidator
@@ -106,10 +110,46 @@ class Module(metaclass=ABCMeta):
         """
         return {}
 
+    @staticmethod
+    def _prefetch_inputs(loaders: dict[str, Callable[[], object] | None]) -> dict[str, object]:
+        """
+        Utilitarian function to load all inputs of a module concurrently on a pool of threads.
+
+        Decompressing and parsing of the inputs largely releases the GIL, so the time it takes
+        to load all inputs approaches the time it takes to load the largest input, rather than
+        the sum of all inputs.
+
+        Args:
+            loaders:
+                Dictionary containing the input name as key and as value a function without
+                arguments that loads and validates the input (for instance a functools.partial
+                of _read_pandas_tsv()). The value can be None for optional inputs that are not
+                supplied.
+
+        Returns:
+            dict:
+                Dictionary containing the input name as key and the loaded input as value
+                (None for the inputs without loader).
+
+        Raises:
+            Exception:
+                The exception raised by the loader of the first input (in order of loaders)
+                that failed to load or validate.
+        """
+        active = {name: loader for name, loader in loaders.items() if loader is not None}
+        if len(active) == 0:
+            return dict.fromkeys(loaders)
+        with ThreadPoolExecutor(max_workers=len(active)) as executor:
+            futures = {name: executor.submit(loader) for name, loader in active.items()}
+            return {
+                name: futures[name].result() if name in futures else None for name in loaders
+            }
+
     def _read_pandas_tsv(
             self,
             path: os.PathLike[str] | str | Path,
-            required_columns: list[str]
+            required_columns: list[str],
+            **kwargs
     ) -> pd.DataFrame:
         """
         Utilitarian function to read and immediately validate a pandas.read_csv call according
@@ -120,6 +160,9 @@ class Module(metaclass=ABCMeta):
                 Path-like object that points to the data.
             required_columns:
                 List containing all the column names that this data should have.
+            **kwargs:
+                Additional arguments to be supplied to pandas.read_csv(). Should not include:
+                filepath_or_buffer, sep, low_memory or na_values.
 
         Returns:
             pandas.DataFrame:
@@ -137,11 +180,113 @@ class Module(metaclass=ABCMeta):
                 path,
                 sep=TSVFileEnums.TSV_SEPARATOR.value,
                 low_memory=False,
-                na_values=TSVFileEnums.NA_VALUES.value
+                na_values=TSVFileEnums.NA_VALUES.value,
+                **kwargs
             ),
             required_columns
         )
 
+    def _read_pandas_tsv_chunks(
+            self,
+            path: os.PathLike[str] | str | Path,
+            required_columns: list[str],
+            chunksize: int,
+            dtype: dict[str, np.dtype | type] | type = str,
+            **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Utilitarian function to read a TSV in chunks of chunksize samples, validating each chunk
+        according to the required_columns.
+
+        All columns are read as dtype (by default string), so that the dtype of a column does
+        not differ between chunks.
+
+        Args:
+            path:
+                Path-like object that points to the data.
+            required_columns:
+                List containing all the column names that this data should have.
+            chunksize:
+                The (maximum) amount of samples per chunk.
+            dtype:
+                (Optional) The dtype of all columns, or a dictionary of the dtype of each column
+                (such as obtained from _read_pandas_tsv_dtypes()). Default: str.
+            **kwargs:
+                Additional arguments to be supplied to pandas.read_csv(). Should not include:
+                filepath_or_buffer, sep, na_values, dtype or chunksize.
+
+        Yields:
+            pandas.DataFrame:
+                Loaded chunk of the data.
+
+        Raises:
+            KeyError:
+                KeyError is raised when 1 or more columns from required_columns are
+                missing from the data.
+        """
+        with pd.read_csv(
+            path,
+            sep=TSVFileEnums.TSV_SEPARATOR.value,
+            na_values=TSVFileEnums.NA_VALUES.value,
+            dtype=dtype,
+            chunksize=chunksize,
+            **kwargs
+        ) as reader:
+            for chunk in reader:
+                yield self.data_validator.validate_pandas_dataframe(chunk, required_columns)
+
+    @staticmethod
+    def _read_pandas_tsv_dtypes(
+            *paths: os.PathLike[str] | str | Path,
+            chunksize: int
+    ) -> dict[str, np.dtype | type]:
+        """
+        Utilitarian function to obtain the dtype of each column of one or more TSVs, as inferred
+        by _read_pandas_tsv() reading the TSV in full, while only reading chunks of chunksize
+        samples into memory.
+
+        The dtype inferred for each chunk is combined over all chunks of all TSVs: a column keeps
+        its dtype when it is equal in all chunks, numeric (non-boolean) columns become float64
+        otherwise (as integer columns containing NaN do) and all other columns are read as
+        string. Reading multiple TSVs with the same dtypes ensures that their values can be
+        compared with each other.
+
+        Args:
+            *paths:
+                Path-like objects that point to the data.
+            chunksize:
+                The (maximum) amount of samples per chunk.
+
+        Returns:
+            dict:
+                Dictionary containing the dtype of each column, to be supplied to
+                _read_pandas_tsv_chunks().
+        """
+        dtypes: dict[str, np.dtype] = {}
+        for path in paths:
+            with pd.read_csv(
+                path,
+                sep=TSVFileEnums.TSV_SEPARATOR.value,
+                na_values=TSVFileEnums.NA_VALUES.value,
+                chunksize=chunksize
+            ) as reader:
+                for chunk in reader:
+                    for column, chunk_dtype in zip(chunk.columns.astype(str), chunk.dtypes):
+                        dtype = dtypes.get(column, chunk_dtype)
+                        if dtype == chunk_dtype:
+                            dtypes[column] = dtype
+                        elif all(
+                            is_numeric_dtype(value) and not is_bool_dtype(value)
+                            for value in [dtype, chunk_dtype]
+                        ):
+                            dtypes[column] = np.dtype(np.float64)
+                        else:
+                            dtypes[column] = np.dtype(object)
+        return {
+            column: str if dtype == np.dtype(object) else dtype
+            for column, dtype in dtypes.items()
+        }
+
     def _read_vcf_file(self, path: os.PathLike | Path) -> pd.DataFrame:
         """
         Utilitary function to read a (gzipped) VCF file
@@ -0,0 +1,214 @@
+import numpy as np
+import pandas as pd
+
+
+class Deduplicator:
+    """
+    Duplicate detector for (wide) dataframes.
+
+    Instead of comparing all columns of all rows, first a 64-bit hash is computed for each row
+    over the columns of interest. Only rows of which the hash is shared with at least one other
+    row can be a duplicate; only these candidates are compared on their full column values to
+    confirm that they are true duplicates.
+    """
+    HASH_MULTIPLIER = np.uint64(1000003)
+
+    def __init__(self, columns: list[str] | None = None):
+        """
+        Args:
+            columns:
+                (Optional) List of the columns that make up a duplicate (feature-subset mode).
+                If not supplied, all columns are used (full-row mode).
+        """
+        self.columns = columns
+
+    def duplicated(self, data: pd.DataFrame, hashes: np.ndarray | None = None) -> np.ndarray:
+        """
+        Method to mark the duplicated rows of data. Equal to pandas.DataFrame.duplicated(),
+        the first occurrence of each row is not marked.
+
+        Args:
+            data:
+                The dataframe of which the duplicated rows should be marked.
+            hashes:
+                (Optional) Precomputed row hashes (see hash_rows()) of data, for instance when
+                these have been computed in parallel. If not supplied, the row hashes are
+                computed from data.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each row that is a duplicate of a previous row.
+        """
+        frame = data if self.columns is None else data[self.columns]
+        if hashes is None:
+            hashes = self.hash_rows(frame)
+        return self._mark_duplicated(frame, hashes)
+
+    @classmethod
+    def _mark_duplicated(cls, frame: pd.DataFrame, hashes: np.ndarray) -> np.ndarray:
+        """
+        Method to mark the duplicated rows of frame, only comparing the full values of rows
+        that share their hash.
+
+        Args:
+            frame:
+                The dataframe, containing only the columns that make up a duplicate.
+            hashes:
+                The row hashes of frame.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each row that is a duplicate of a previous row.
+        """
+        duplicated = np.zeros(frame.shape[0], dtype=bool)
+        candidates = cls._find_candidates(hashes)
+        if candidates.size > 0:
+            duplicated[candidates] = frame.iloc[candidates].duplicated().to_numpy()
+        return duplicated
+
+    @classmethod
+    def hash_rows(cls, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Method to compute a 64-bit hash for each row of frame. Numeric (non-boolean) columns are
+        hashed as float64, so that equal values result in the same hash regardless of the dtype
+        of the column (such as an integer column in one dataset and a float column, because of
+        missing values, in another). 0.0 and -0.0 result in the same hash, as they are
+        considered equal by pandas.
+
+        Args:
+            frame:
+                The dataframe of which each row should be hashed.
+
+        Returns:
+            numpy.ndarray:
+                numpy.uint64 array containing the hash of each row.
+        """
+        hashes = np.zeros(frame.shape[0], dtype=np.uint64)
+        for _, column in frame.items():
+            if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+                column = column.astype(np.float64) + 0.0
+            hashes *= cls.HASH_MULTIPLIER
+            hashes ^= pd.util.hash_pandas_object(column, index=False).to_numpy()
+        return hashes
+
+    @staticmethod
+    def _find_candidates(hashes: np.ndarray) -> np.ndarray:
+        """
+        Method to find the positions of all hashes that occur more than once.
+
+        Args:
+            hashes:
+                numpy.uint64 array containing the hash of each row.
+
+        Returns:
+            numpy.ndarray:
+                Sorted array of the positions of all rows that share their hash with another row.
+        """
+        order = np.argsort(hashes, kind='stable')
+        sorted_hashes = hashes[order]
+        shared = np.zeros(hashes.shape[0], dtype=bool)
+        equal_to_next = sorted_hashes[1:] == sorted_hashes[:-1]
+        shared[1:] |= equal_to_next
+        shared[:-1] |= equal_to_next
+        return np.sort(order[shared])
+
+
+class StreamingDeduplicator(Deduplicator):
+    """
+    Duplicate detector for dataframes that are processed in chunks.
+
+    The hashes of all rows that have been seen are kept as a sorted numpy.uint64 array, so that
+    rows can be marked as duplicate of rows in previous chunks without keeping these rows in
+    memory. Since previous rows are no longer available, duplicates are determined on the 64-bit
+    row hashes alone.
+    """
+    def __init__(self, columns: list[str] | None = None):
+        """
+        Args:
+            columns:
+                (Optional) List of the columns that make up a duplicate (feature-subset mode).
+                If not supplied, all columns are used (full-row mode).
+        """
+        super(StreamingDeduplicator, self).__init__(columns)
+        self.seen = np.empty(0, dtype=np.uint64)
+
+    def duplicated(self, data: pd.DataFrame, hashes: np.ndarray | None = None) -> np.ndarray:
+        """
+        Method to mark the rows of data that are a duplicate of a previous row, either of data
+        itself or of any of the previously supplied chunks.
+
+        Args:
+            data:
+                The chunk of which the duplicated rows should be marked.
+            hashes:
+                (Optional) Precomputed row hashes (see hash_rows()) of data.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each row that is a duplicate of a previous row.
+        """
+        frame = data if self.columns is None else data[self.columns]
+        if hashes is None:
+            hashes = self.hash_rows(frame)
+        unique_hashes, first_occurrence = np.unique(hashes, return_index=True)
+        duplicated = np.ones(hashes.shape[0], dtype=bool)
+        duplicated[first_occurrence] = False
+        if self.seen.shape[0] > 0:
+            positions = np.searchsorted(self.seen, hashes)
+            positions[positions == self.seen.shape[0]] = 0
+            duplicated |= self.seen[positions] == hashes
+        self.seen = np.union1d(self.seen, unique_hashes)
+        return duplicated
+
+
+class SharedDeduplicator(Deduplicator):
+    """
+    Duplicate detector that is shared between multiple datasets.
+
+    Rows are marked as duplicate when they are a duplicate of a previous row of the same
+    dataset, or of any row of a previously supplied dataset. The (column subset of the)
+    previously supplied datasets and their row hashes are kept, so that rows that share their
+    hash with a row of a previous dataset can be compared on their full values.
+    """
+    def __init__(self, columns: list[str] | None = None):
+        """
+        Args:
+            columns:
+                (Optional) List of the columns that make up a duplicate (feature-subset mode).
+                If not supplied, all columns are used (full-row mode).
+        """
+        super(SharedDeduplicator, self).__init__(columns)
+        self.previous: list[tuple[pd.DataFrame, np.ndarray]] = []
+
+    def duplicated(self, data: pd.DataFrame, hashes: np.ndarray | None = None) -> np.ndarray:
+        """
+        Method to mark the rows of data that are a duplicate of a previous row of data or of any
+        row of the previously supplied datasets.
+
+        Args:
+            data:
+                The dataset of which the duplicated rows should be marked.
+            hashes:
+                (Optional) Precomputed row hashes (see hash_rows()) of data.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each row that is a duplicate of a previous row.
+        """
+        frame = data if self.columns is None else data[self.columns]
+        if hashes is None:
+            hashes = self.hash_rows(frame)
+        duplicated = self._mark_duplicated(frame, hashes)
+        for previous_frame, previous_hashes in self.previous:
+            candidates = np.flatnonzero(~duplicated & np.isin(hashes, previous_hashes))
+            if candidates.size == 0:
+                continue
+            previous_candidates = np.flatnonzero(np.isin(previous_hashes, hashes[candidates]))
+            # Candidates are unique within data, so they can only be a duplicate of a
+            # previous row
+            duplicated[candidates] = pd.concat(
+                [previous_frame.iloc[previous_candidates], frame.iloc[candidates]],
+                ignore_index=True
+            ).duplicated().to_numpy()[previous_candidates.size:]
+        self.previous.append((frame, hashes))
+        return duplicated
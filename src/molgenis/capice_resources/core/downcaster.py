@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+
+class Downcaster:
+    """
+    Memory reducer for (wide) numeric dataframes.
+
+    Integer columns are downcasted to the smallest integer dtype that can hold their value range,
+    which is lossless. Float columns are downcasted to float32 when all their values lie within
+    the float32 range. XGBoost, as used in CAPICE training, converts all features to float32
+    internally, so this does not change training results.
+
+    When multiple datasets are downcasted at once, each column is downcasted to the same dtype
+    in all datasets, so that their values remain comparable (for instance to find duplicates
+    across datasets).
+    """
+    INTEGER_DTYPES = (np.int8, np.int16, np.int32)
+    FLOAT_DTYPE = np.float32
+
+    def __init__(self, columns: list[str] | None = None, lossless: bool = False):
+        """
+        Args:
+            columns:
+                (Optional) List of the columns to downcast, for instance the train features.
+                Columns that are not present or not numeric are skipped.
+                If not supplied, all numeric columns are downcasted.
+            lossless:
+                (Optional) Only downcast integer columns, leaving all values unchanged.
+                Default: False.
+        """
+        self.columns = columns
+        self.lossless = lossless
+
+    def downcast(self, *datasets: pd.DataFrame) -> int:
+        """
+        Method to downcast the numeric columns of one or more datasets inplace, printing the
+        amount of memory saved.
+
+        Args:
+            *datasets:
+                The dataframes of which the columns should be downcasted. Each column is
+                downcasted to the smallest dtype that can hold its values in all datasets.
+
+        Returns:
+            int:
+                The amount of bytes saved.
+        """
+        before = sum(data.memory_usage(index=False, deep=False).sum() for data in datasets)
+        downcasted = 0
+        for column, dtype in self.plan(*datasets).items():
+            for data in datasets:
+                if column in data.columns:
+                    data[column] = data[column].astype(dtype)
+            downcasted += 1
+        saved = int(
+            before - sum(data.memory_usage(index=False, deep=False).sum() for data in datasets)
+        )
+        print(f'Downcasted {downcasted} columns, saving {saved / 1024 ** 2:.2f} MB.')
+        return saved
+
+    def plan(self, *datasets: pd.DataFrame) -> dict[str, np.dtype]:
+        """
+        Method to obtain the dtype each column of the datasets should be downcasted to.
+
+        Args:
+            *datasets:
+                The dataframes of which the columns should be downcasted.
+
+        Returns:
+            dict:
+                Dictionary of the downcasted dtype of each column that can be downcasted.
+        """
+        columns = pd.Index([]).append([data.columns for data in datasets]).unique()
+        if self.columns is not None:
+            columns = columns.intersection(self.columns, sort=False)
+        plan = {}
+        for column in columns:
+            dtype = self._downcast_dtype(
+                *(data[column] for data in datasets if column in data.columns)
+            )
+            if dtype is not None:
+                plan[column] = dtype
+        return plan
+
+    def _downcast_dtype(self, *columns: pd.Series) -> np.dtype | None:
+        """
+        Method to obtain the smallest dtype that can hold all values of columns.
+
+        Args:
+            *columns:
+                The column of each dataset to obtain the downcasted dtype for.
+
+        Returns:
+            numpy.dtype:
+                The downcasted dtype. None if a column is not numeric, if the columns are not
+                all integer or all float, or if the columns can not be downcasted.
+        """
+        if any(
+            pd.api.types.is_bool_dtype(column) or not pd.api.types.is_numeric_dtype(column)
+            for column in columns
+        ):
+            return None
+        itemsize = max(column.dtype.itemsize for column in columns)
+        if all(pd.api.types.is_integer_dtype(column) for column in columns):
+            values = [column.to_numpy() for column in columns if column.size > 0]
+            if len(values) == 0:
+                return None
+            minimum = min(value.min() for value in values)
+            maximum = max(value.max() for value in values)
+            for dtype in self.INTEGER_DTYPES:
+                if np.dtype(dtype).itemsize >= itemsize:
+                    return None
+                if np.iinfo(dtype).min <= minimum and maximum <= np.iinfo(dtype).max:
+                    return np.dtype(dtype)
+            return None
+        if self.lossless or not all(
+            pd.api.types.is_float_dtype(column) for column in columns
+        ) or itemsize <= np.dtype(self.FLOAT_DTYPE).itemsize:
+            return None
+        for column in columns:
+            values = column.to_numpy()
+            finite = np.abs(values[np.isfinite(values)])
+            if finite.size > 0 and finite.max() > np.finfo(self.FLOAT_DTYPE).max:
+                return None
+        return np.dtype(self.FLOAT_DTYPE)
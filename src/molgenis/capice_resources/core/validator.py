@@ -64,6 +64,51 @@ class InputValidator:
         self._validate_file(path_value, extension, can_be_optional)  # type: ignore
         return {path_key: path_value}  # type: ignore
 
+    def validate_input_command_line_interface_files(
+            self,
+            paths: dict[str, list[os.PathLike[str] | str] | None],
+            extension: tuple[str] | str,
+            can_be_optional: bool = False
+    ) -> dict[str, list[Path] | None]:
+        """
+        Validator for an Input Command Line Interface (icli) that accepts multiple files.
+
+        Args:
+            paths:
+                Argument containing the list of pathlike strings to the input files.
+            extension:
+                Required extension that each of the files should have.
+            can_be_optional:
+                Optional boolean if the Input CLI can be default "None" or not. Default: False.
+
+        Returns:
+            dict:
+                Dictionary of the argument key and a list of pathlib.Path().absolute() instances
+                of each of the input files (or None when the optional argument is not supplied).
+
+        Raises:
+            FileNotFoundError:
+                FileNotFoundError is raised when one of the "paths" is not a file.
+            IOError:
+                IOError is raised when one of the "paths" does not have the right "extension".
+
+                IOError is also raised when a non-optional argument is encountered as None.
+        """
+        paths_key = list(paths.keys())[0]
+        paths_value = paths[paths_key]
+        self._validate_path_is_none(paths_value, can_be_optional)  # type: ignore
+        if paths_value is None:
+            return {paths_key: None}
+        validated = []
+        for path in paths_value:
+            validated.append(
+                self.validate_input_command_line_interface_file(
+                    {paths_key: path},
+                    extension
+                )[paths_key]
+            )
+        return {paths_key: validated}
+
     def _validate_file(
             self,
             path: Path | None,
@@ -0,0 +1,322 @@
+import os
+import gzip
+from pathlib import Path
+from typing import NamedTuple
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class Release(NamedTuple):
+    """
+    The training variants of a single release.
+
+    Attributes:
+        keys:
+            Sorted and unique numpy.uint64 array of the packed variant keys.
+        variants:
+            Set of the "chromosome:position:ref:alt" strings of the variants that do not fit a
+            packed key (see VariantIndex.encode()).
+    """
+    keys: np.ndarray
+    variants: frozenset[str]
+
+
+class VariantIndex:
+    """
+    Persistent index of the variants a released CAPICE model was trained on.
+
+    Each variant (chromosome, position, reference and alternative allele) is packed into an exact
+    64-bit integer key, so that two different variants never share a key. The keys of one release
+    are stored sorted and unique in a numpy .npy file, which is memory-mapped when loaded, so that
+    querying a release does not require reading the full index into memory. The few variants
+    that do not fit a key (such as long indels) are stored as strings after the keys, in the same
+    file. Multiple releases can be loaded and queried at once.
+
+    Releases of which only the train-test VCF is available (such as the train_test.vcf.gz
+    published with each CAPICE release) can be loaded directly, in which case their index is
+    built while loading.
+    """
+    EXTENSION = '.npy'
+    VCF_EXTENSIONS = ('.vcf.gz', '.vcf')
+    INPUT_EXTENSIONS = (EXTENSION, *VCF_EXTENSIONS)
+    KEY_DTYPE = np.uint64
+    VCF_COLUMNS = ['#CHROM', 'POS', 'REF', 'ALT']
+    CONTIGS = {**{str(contig): contig for contig in range(1, 23)}, 'X': 23, 'Y': 24, 'MT': 25}
+    POSITION_BITS = 29
+    ALLELE_LENGTH_BITS = 4
+    PACKED_BASES = 11
+    BASE_CODES = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+    def __init__(self, *releases: Release):
+        """
+        Args:
+            *releases:
+                One or more Release tuples, each representing the training variants of a single
+                release.
+        """
+        self.releases = list(releases)
+
+    @classmethod
+    def from_variants(
+            cls,
+            chrom: Iterable,
+            pos: Iterable,
+            ref: Iterable,
+            alt: Iterable
+    ) -> 'VariantIndex':
+        """
+        Creates a (single release) VariantIndex out of the variant columns.
+
+        Args:
+            chrom:
+                Iterable of the chromosomes, with or without the "chr" prefix.
+            pos:
+                Iterable of the positions.
+            ref:
+                Iterable of the reference alleles.
+            alt:
+                Iterable of the alternative alleles.
+
+        Returns:
+            VariantIndex:
+                VariantIndex containing the sorted and unique keys of the supplied variants.
+        """
+        keys, variants = cls.encode(chrom, pos, ref, alt)
+        return cls(Release(np.unique(keys[keys > 0]), frozenset(variants)))
+
+    @classmethod
+    def from_vcf(cls, path: os.PathLike[str] | str | Path) -> 'VariantIndex':
+        """
+        Creates a (single release) VariantIndex out of the variants of a (gzipped) train-test
+        VCF, such as the train_test.vcf.gz of a previous release.
+
+        Args:
+            path:
+                Path to the (gzipped) VCF file.
+
+        Returns:
+            VariantIndex:
+                VariantIndex containing the sorted and unique keys of the variants of the VCF.
+
+        Raises:
+            IOError:
+                IOError is raised when the #CHROM, POS, REF or ALT column is not present in
+                the header of the VCF.
+        """
+        opener = gzip.open if str(path).endswith('.gz') else open
+        skiprows = 0
+        with opener(path, 'rt') as fh:  # type: ignore
+            for line in fh:
+                if not line.startswith('##'):
+                    break
+                skiprows += 1
+        try:
+            variants = pd.read_csv(
+                path,
+                sep='\t',
+                skiprows=skiprows,
+                usecols=cls.VCF_COLUMNS,
+                dtype={column: str for column in cls.VCF_COLUMNS}
+            )
+        except ValueError as error:
+            raise IOError(f'Input {path} is missing one or more of: {cls.VCF_COLUMNS}') from error
+        return cls.from_variants(*(variants[column] for column in cls.VCF_COLUMNS))
+
+    @classmethod
+    def load(cls, *paths: os.PathLike[str] | str | Path) -> 'VariantIndex':
+        """
+        Loads one or more stored variant indexes, of which the keys are memory-mapped (read
+        only). Train-test VCF files (see from_vcf()) are indexed while loading.
+
+        Args:
+            *paths:
+                Paths to the variant index (.npy) or train-test VCF files, one per release.
+
+        Returns:
+            VariantIndex:
+                VariantIndex that queries all supplied releases at once.
+
+        Raises:
+            IOError:
+                IOError is raised when a file is not a 1-dimensional array of 64-bit keys
+                followed by the variants that do not fit a key, or when a VCF file is missing
+                one of the variant columns.
+        """
+        releases = []
+        for path in paths:
+            if str(path).endswith(cls.VCF_EXTENSIONS):
+                releases.extend(cls.from_vcf(path).releases)
+                continue
+            keys = np.load(path, mmap_mode='r')
+            if not isinstance(keys, np.memmap) or keys.ndim != 1 or keys.dtype != cls.KEY_DTYPE:
+                raise IOError(f'Input {path} is not a valid variant index!')
+            with open(path, 'rb') as fh:
+                fh.seek(keys.offset + keys.nbytes)
+                try:
+                    variants = np.load(fh)
+                except (ValueError, EOFError) as error:
+                    raise IOError(f'Input {path} is not a valid variant index!') from error
+            variants = variants.tobytes().decode('ascii')
+            releases.append(Release(keys, frozenset(variants.split('\n') if variants else [])))
+        return cls(*releases)
+
+    def save(self, path: os.PathLike[str] | str | Path) -> None:
+        """
+        Stores the variant index to path. Only a single release can be stored per file.
+
+        Args:
+            path:
+                Full path, including the filename, to where the index should be stored.
+                Should end with the .npy extension.
+
+        Raises:
+            ValueError:
+                ValueError is raised when the index contains more than one release.
+        """
+        if len(self.releases) != 1:
+            raise ValueError('Only a variant index of a single release can be saved.')
+        keys, variants = self.releases[0]
+        with open(path, 'wb') as fh:
+            np.save(fh, np.asarray(keys, dtype=self.KEY_DTYPE))
+            np.save(fh, np.frombuffer('\n'.join(sorted(variants)).encode('ascii'), dtype=np.uint8))
+
+    def contains(
+            self,
+            chrom: Iterable,
+            pos: Iterable,
+            ref: Iterable,
+            alt: Iterable
+    ) -> np.ndarray:
+        """
+        Method to query which variants are present in any of the releases of the index.
+
+        Args:
+            chrom:
+                Iterable of the chromosomes, with or without the "chr" prefix.
+            pos:
+                Iterable of the positions.
+            ref:
+                Iterable of the reference alleles.
+            alt:
+                Iterable of the alternative alleles.
+
+        Returns:
+            numpy.ndarray:
+                Boolean array that is True for each variant that is present in at least one
+                release.
+        """
+        keys, variants = self.encode(chrom, pos, ref, alt)
+        packed = keys > 0
+        present = np.zeros(keys.shape[0], dtype=bool)
+        present[packed] = self.contains_keys(keys[packed])
+        present[~packed] = pd.Series(variants, dtype=object).isin(
+            frozenset().union(*(release.variants for release in self.releases))
+        ).to_numpy(dtype=bool)
+        return present
+
+    def contains_keys(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Method to query packed variant keys against all releases through a sorted lookup.
+
+        Args:
+            keys:
+                numpy.uint64 array of packed variant keys (see encode()).
+
+        Returns:
+            numpy.ndarray:
+                Boolean array that is True for each key present in at least one release.
+        """
+        present = np.zeros(keys.shape[0], dtype=bool)
+        for release in self.releases:
+            if release.keys.shape[0] == 0:
+                continue
+            positions = np.searchsorted(release.keys, keys)
+            positions[positions == release.keys.shape[0]] = 0
+            present |= release.keys[positions] == keys
+        return present
+
+    @classmethod
+    def encode(
+            cls,
+            chrom: Iterable,
+            pos: Iterable,
+            ref: Iterable,
+            alt: Iterable
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Packs variants into exact 64-bit integer keys. Chromosomes are normalized so that GRCh38
+        ("chr1", "chrM") and GRCh37 ("1", "MT") notation result in the same key.
+
+        From the most to the least significant bits, a key consists of the contig code (5 bits,
+        see CONTIGS), the position (29 bits), the length of the reference and of the
+        alternative allele (4 bits each) and the reference followed by the alternative allele (2
+        bits per base, 22 bits). Variants on other contigs, beyond the maximum position, or of
+        which the alleles are not made up of A, C, G and T or are together longer than
+        PACKED_BASES bases, do not fit a key.
+
+        Args:
+            chrom:
+                Iterable of the chromosomes.
+            pos:
+                Iterable of the positions.
+            ref:
+                Iterable of the reference alleles.
+            alt:
+                Iterable of the alternative alleles.
+
+        Returns:
+            tuple:
+                Tuple of [0] a numpy.uint64 array containing the key of each variant, which is
+                0 for the variants that do not fit a key, and [1] a numpy array of the
+                "chromosome:position:ref:alt" strings of those variants, in order.
+        """
+        chromosomes = pd.Series(np.asarray(chrom)).astype(str).str.removeprefix('chr')
+        chromosomes = chromosomes.replace('M', 'MT')
+        positions = pd.Series(np.asarray(pos)).astype(np.int64)
+        refs = pd.Series(np.asarray(ref)).astype(str)
+        alts = pd.Series(np.asarray(alt)).astype(str)
+        contigs = chromosomes.map(cls.CONTIGS).fillna(0).to_numpy(dtype=np.uint64)
+        ref_lengths = refs.str.len().to_numpy(dtype=np.uint64)
+        alt_lengths = alts.str.len().to_numpy(dtype=np.uint64)
+        alleles = refs + alts
+        packed = (
+            (contigs > 0) &
+            (positions.to_numpy() >= 0) &
+            (positions.to_numpy() < 2 ** cls.POSITION_BITS) &
+            (ref_lengths > 0) &
+            (alt_lengths > 0) &
+            (ref_lengths + alt_lengths <= cls.PACKED_BASES) &
+            alleles.str.fullmatch(f'[{"".join(cls.BASE_CODES)}]+').to_numpy(dtype=bool)
+        )
+        # Right pad the alleles to PACKED_BASES, so that all are encoded over the same bits
+        bases = np.frombuffer(
+            alleles[packed].str.ljust(cls.PACKED_BASES, 'A').str.cat().encode('ascii'),
+            dtype=np.uint8
+        ).reshape(-1, cls.PACKED_BASES)
+        base_codes = np.zeros(256, dtype=np.uint64)
+        for base, code in cls.BASE_CODES.items():
+            base_codes[ord(base)] = code
+        shifts = np.arange(cls.PACKED_BASES - 1, -1, -1, dtype=np.uint64) * np.uint64(2)
+        sequences = (base_codes[bases] << shifts).sum(axis=1, dtype=np.uint64)
+        alt_shift = np.uint64(2 * cls.PACKED_BASES)
+        ref_shift = np.uint64(2 * cls.PACKED_BASES + cls.ALLELE_LENGTH_BITS)
+        position_shift = np.uint64(2 * cls.PACKED_BASES + 2 * cls.ALLELE_LENGTH_BITS)
+        contig_shift = np.uint64(
+            2 * cls.PACKED_BASES + 2 * cls.ALLELE_LENGTH_BITS + cls.POSITION_BITS
+        )
+        keys = np.zeros(packed.shape[0], dtype=np.uint64)
+        keys[packed] = (
+            (contigs[packed] << contig_shift) |
+            (positions[packed].to_numpy(dtype=np.uint64) << position_shift) |
+            (ref_lengths[packed] << ref_shift) |
+            (alt_lengths[packed] << alt_shift) |
+            sequences
+        )
+        unpacked = ~packed
+        variants = (
+            chromosomes[unpacked] + ':' + positions[unpacked].astype(str) + ':' +
+            refs[unpacked] + ':' + alts[unpacked]
+        )
+        return keys, variants.to_numpy(dtype=object)
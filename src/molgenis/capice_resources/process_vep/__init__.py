@@ -7,6 +7,7 @@ class ProcessVEPEnums(Enum):
     """
     GNOMAD_HN = 'gnomAD_HN'
     SAMPLE_WEIGHTS = [0.8, 0.9, 1.0]
+    PREVIOUS_ITERATION_KEY = ['CHROM', 'POS', 'REF', 'ALT', 'Gene', 'SYMBOL_SOURCE']
 
 
 class CGDColumnEnums(Enum):
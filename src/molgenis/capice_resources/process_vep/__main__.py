@@ -1,11 +1,22 @@
 import json
 import os
-
+from io import StringIO
+from functools import partial
+from itertools import repeat
+from contextlib import redirect_stdout
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.core import Module, TSVFileEnums, ColumnEnums, \
     DatasetIdentifierEnums, VCFEnums
-from molgenis.capice_resources.utilities import merge_dataset_rows, add_dataset_source
+from molgenis.capice_resources.core.deduplicator import Deduplicator, StreamingDeduplicator, \
+    SharedDeduplicator
+from molgenis.capice_resources.core.downcaster import Downcaster
+from molgenis.capice_resources.core.variant_index import VariantIndex
+from molgenis.capice_resources.utilities import anti_join
 from molgenis.capice_resources.process_vep.vep_processer import VEPProcesser
 from molgenis.capice_resources.process_vep.progress_printer import ProgressPrinter
 from molgenis.capice_resources.process_vep import ProcessVEPEnums
@@ -77,6 +88,45 @@ class ProcessVEP(Module):
                  'perform comparison to. '
                  'If supplied, "validation_filtered.tsv.gz" will also be exported to -o / --output.'
         )
+        optional.add_argument(
+            '-i',
+            '--variant-index',
+            type=str,
+            nargs='+',
+            default=None,
+            help='One or more variant indexes (train_test.npy, exported by train-data-creator) or '
+                 'train-test VCF files (train_test.vcf.gz) of previously released models to '
+                 'perform comparison to. '
+                 'If supplied, "validation_filtered.tsv.gz" will also be exported to '
+                 '-o / --output, containing only validation variants that none of these models '
+                 'trained on.'
+        )
+        optional.add_argument(
+            '-c',
+            '--chunksize',
+            type=int,
+            default=None,
+            help='Process train-test and validation in chunks of this amount of samples, '
+                 'streaming the results to -o / --output. Limits memory usage to the chunk size '
+                 'rather than the dataset size.'
+        )
+        optional.add_argument(
+            '-w',
+            '--workers',
+            type=int,
+            default=1,
+            help='The amount of processes to divide the processing over, by chromosome. '
+                 'Can not be combined with -c / --chunksize. Default: 1.'
+        )
+        optional.add_argument(
+            '-d',
+            '--downcast',
+            action='store_true',
+            help='Downcast the numeric train features to the smallest dtype that fits their '
+                 'values in both train-test and validation (float32 for floats) before '
+                 'processing, reducing memory usage. '
+                 'Can not be combined with -c / --chunksize.'
+        )
         return parser
 
     def _validate_module_specific_arguments(self, parser):
@@ -105,7 +155,23 @@ class ProcessVEP(Module):
             TSVFileEnums.TSV_EXTENSIONS.value,
             can_be_optional=True
         )
+        variant_index_argument = self.input_validator.validate_input_command_line_interface_files(
+            parser.get_argument('variant_index'),
+            VariantIndex.INPUT_EXTENSIONS,
+            can_be_optional=True
+        )
         assembly_flag = parser.get_argument('assembly')
+        chunksize_argument = parser.get_argument('chunksize')
+        if chunksize_argument['chunksize'] is not None and chunksize_argument['chunksize'] < 1:
+            raise ValueError('Chunksize should be at least 1.')
+        workers_argument = parser.get_argument('workers')
+        if workers_argument['workers'] < 1:
+            raise ValueError('Workers should be at least 1.')
+        if workers_argument['workers'] > 1 and chunksize_argument['chunksize'] is not None:
+            raise ValueError('Workers can not be combined with chunksize.')
+        downcast_flag = parser.get_argument('downcast')
+        if downcast_flag['downcast'] and chunksize_argument['chunksize'] is not None:
+            raise ValueError('Downcast can not be combined with chunksize.')
         return {
             **train_test,
             **validation,
@@ -113,36 +179,99 @@ class ProcessVEP(Module):
             **genes_argument,
             **output_argument,
             **assembly_flag,
-            **pi_data_argument
+            **pi_data_argument,
+            **variant_index_argument,
+            **chunksize_argument,
+            **workers_argument,
+            **downcast_flag
         }
 
     def run_module(self, arguments):
-        train_test = self._read_vep_data(arguments['train_test'])
-        add_dataset_source(train_test, DatasetIdentifierEnums.TRAIN_TEST.value)
         output = arguments['output']
-        merged_datasets = self.merge_datasets(train_test, arguments['validation'])
-        train_features = self._read_train_features(arguments['features'])
-        cgd = self._read_cgd_data(arguments['genes'])
         build38 = arguments['assembly']
-        previous_iteration = arguments['train_test_previous_iteration']
-        if previous_iteration is not None:
-            previous_iteration_dataset = self._read_pandas_tsv(
-                previous_iteration,
-                ['CHROM', 'POS', 'REF', 'ALT', 'Gene', 'SYMBOL_SOURCE']
+        chunksize = arguments['chunksize']
+        streaming = chunksize is not None
+        inputs = self._prefetch_inputs(
+            {
+                'train_features': partial(self._read_train_features, arguments['features']),
+                'cgd': partial(self._read_cgd_data, arguments['genes']),
+                'previous_iteration': partial(
+                    self._read_previous_iteration,
+                    arguments['train_test_previous_iteration']
+                ),
+                'variant_index': None if arguments['variant_index'] is None else partial(
+                    VariantIndex.load,
+                    *arguments['variant_index']
+                ),
+                # Streamed datasets are read chunk by chunk while processing
+                DatasetIdentifierEnums.TRAIN_TEST.value: None if streaming else partial(
+                    self._read_vep_data,
+                    arguments['train_test']
+                ),
+                DatasetIdentifierEnums.VALIDATION.value: None if (
+                    streaming or arguments['validation'] is None
+                ) else partial(self._read_vep_data, arguments['validation'])
+            }
+        )
+        train_features = inputs['train_features']
+        cgd = inputs['cgd']
+        previous_iteration_dataset = inputs['previous_iteration']
+        variant_index = inputs['variant_index']
+        if streaming:
+            self._stream_vep(
+                arguments['train_test'],
+                arguments['validation'],
+                output,
+                chunksize,
+                build38,
+                train_features,
+                cgd,
+                previous_iteration_dataset,
+                variant_index
             )
-        else:
-            previous_iteration_dataset = None
-        self._process_vep(
-            merged_datasets,
+            return {
+                DatasetIdentifierEnums.TRAIN_TEST.value: None,
+                DatasetIdentifierEnums.VALIDATION.value: None,
+                DatasetIdentifierEnums.VALIDATION_FILTERED.value: None,
+                DatasetIdentifierEnums.OUTPUT.value: output
+            }
+        if arguments['downcast']:
+            # Both datasets share their dtypes, so that duplicates are found across datasets
+            Downcaster(train_features).downcast(
+                *(
+                    inputs[dataset] for dataset in [
+                        DatasetIdentifierEnums.TRAIN_TEST.value,
+                        DatasetIdentifierEnums.VALIDATION.value
+                    ] if inputs[dataset] is not None
+                )
+            )
+        features_deduplicator = SharedDeduplicator(train_features)
+        train_test = self._process_dataset(
+            DatasetIdentifierEnums.TRAIN_TEST.value,
+            inputs[DatasetIdentifierEnums.TRAIN_TEST.value],
             train_features,
             cgd,
-            build38
-        )
-        train_test, validation = self._split_data(merged_datasets)
-        validation_filtered = self._process_previous_iteration(
-            validation,
-            previous_iteration_dataset
+            build38,
+            features_deduplicator,
+            arguments['workers']
         )
+        validation = None
+        validation_filtered = None
+        if inputs[DatasetIdentifierEnums.VALIDATION.value] is not None:
+            validation = self._process_dataset(
+                DatasetIdentifierEnums.VALIDATION.value,
+                inputs[DatasetIdentifierEnums.VALIDATION.value],
+                train_features,
+                cgd,
+                build38,
+                features_deduplicator,
+                arguments['workers']
+            )
+            validation_filtered = self._filter_validation(
+                validation,
+                previous_iteration_dataset,
+                variant_index
+            )
         return {
             DatasetIdentifierEnums.TRAIN_TEST.value: train_test,
             DatasetIdentifierEnums.VALIDATION.value: validation,
@@ -150,35 +279,226 @@ class ProcessVEP(Module):
             DatasetIdentifierEnums.OUTPUT.value: output
         }
 
-    def merge_datasets(
+    def _process_dataset(
             self,
-            train_test: pd.DataFrame,
-            validation: os.PathLike[str] | None = None
+            dataset: str,
+            data: pd.DataFrame,
+            train_features: list[str],
+            cgd: list[str],
+            build38: bool,
+            features_deduplicator: SharedDeduplicator,
+            workers: int
     ) -> pd.DataFrame:
         """
-        Function to obtain the train_test dataframe and the CLI validation argument to create
-        the merged dataset. Checks if validation is None, and if False,
-        reads in the validation dataset, adds the source identifier and merges with train-test.
-        If True, just returns the train_test as "merged".
+        Method to process a single VEP dataset.
+
+        Train-test and validation are processed as separate dataframes, sharing the train
+        features duplicate detector. Train-test should therefore be processed before
+        validation, so that validation samples that are duplicates of train-test samples are
+        dropped.
+
+        Args:
+            dataset:
+                The name of the dataset (train_test or validation).
+            data:
+                The VEP dataset, as read by _read_vep_data().
+            train_features:
+                List of all the train_features that are going to be used in capice train.
+            cgd:
+                List of all the CGD AR containing genes.
+            build38:
+                Boolean if the VEP files are created for build 38 or not.
+            features_deduplicator:
+                The train features SharedDeduplicator of all datasets.
+            workers:
+                The amount of processes to shard the dataset over.
+
+        Returns:
+            dataframe:
+                The processed dataset.
+        """
+        progress_printer = ProgressPrinter(dataset, data.shape[0])
+        processed = self._process_vep(
+            data,
+            train_features,
+            cgd,
+            build38,
+            progress_printer,
+            deduplicators=(Deduplicator(), features_deduplicator),
+            workers=workers
+        )
+        progress_printer.print_final_shape()
+        return processed
+
+    def _stream_vep(
+            self,
+            train_test_path: os.PathLike[str],
+            validation_path: os.PathLike[str] | None,
+            output_path: os.PathLike[str],
+            chunksize: int,
+            build38: bool,
+            train_features: list[str],
+            cgd: list[str],
+            previous_iteration_dataset: pd.DataFrame | None,
+            variant_index: VariantIndex | None
+    ) -> None:
+        """
+        Method to process and export train-test and validation in chunks of -c / --chunksize
+        samples, so that memory usage scales with the chunk size rather than the dataset size.
+
+        Each dataset is read twice: first to infer the dtype of each column over all chunks of
+        both datasets (see Module._read_pandas_tsv_dtypes()), then to process its chunks with
+        those dtypes. Reading all chunks of both datasets with the same dtypes ensures that
+        train feature duplicates are found across chunks and datasets.
+
+        Duplicates are tracked across chunks through the hashes of all previously processed
+        samples: full duplicates within each dataset, train feature duplicates over both
+        datasets. Train-test is processed before validation, so that (like in the non-streaming
+        mode) validation samples that are duplicates of train-test samples are dropped.
+
+        Args:
+            train_test_path:
+                Pathlike object directing to the train-test VEP file.
+            validation_path:
+                (Optional) Pathlike object directing to the validation VEP file.
+            output_path:
+                Pathlike object directing to the output directory.
+            chunksize:
+                The (maximum) amount of samples per chunk.
+            build38:
+                Boolean if the VEP files are created for build 38 or not.
+            train_features:
+                List of all the train_features that are going to be used in capice train.
+            cgd:
+                List of all the CGD AR containing genes.
+            previous_iteration_dataset:
+                (Optional) Pandas DataFrame object of the VEP annotated dataset used to make the
+                previous iteration model.
+            variant_index:
+                (Optional) VariantIndex of one or more previously released models.
+        """
+        features_deduplicator = StreamingDeduplicator(train_features)
+        datasets = [(DatasetIdentifierEnums.TRAIN_TEST.value, train_test_path)]
+        if validation_path is not None:
+            datasets.append((DatasetIdentifierEnums.VALIDATION.value, validation_path))
+        filter_validation = previous_iteration_dataset is not None or variant_index is not None
+        dtypes = self._read_pandas_tsv_dtypes(*(path for _, path in datasets), chunksize=chunksize)
+        for dataset, path in datasets:
+            entries_deduplicator = StreamingDeduplicator()
+            remaining = 0
+            export_path = os.path.join(output_path, dataset + '.tsv.gz')
+            filtered_export_path = os.path.join(
+                output_path,
+                DatasetIdentifierEnums.VALIDATION_FILTERED.value + '.tsv.gz'
+            )
+            for n_chunk, chunk in enumerate(
+                self._read_pandas_tsv_chunks(
+                    path,
+                    [ProcessVEPEnums.GNOMAD_HN.value],
+                    chunksize,
+                    dtype=dtypes
+                )
+            ):
+                print(f'Processing chunk {n_chunk + 1} of {dataset}.')
+                progress_printer = ProgressPrinter(dataset, chunk.shape[0])
+                chunk = self._process_vep(
+                    chunk,
+                    train_features,
+                    cgd,
+                    build38,
+                    progress_printer,
+                    deduplicators=(entries_deduplicator, features_deduplicator)
+                )
+                remaining += progress_printer.remaining_samples()
+                self._export_chunk(export_path, chunk, n_chunk == 0)
+                if dataset == DatasetIdentifierEnums.VALIDATION.value and filter_validation:
+                    self._export_chunk(
+                        filtered_export_path,
+                        self._filter_validation(chunk, previous_iteration_dataset, variant_index),
+                        n_chunk == 0
+                    )
+            progress_printer.print_final_shape(remaining)
+
+    def _export_chunk(self, path: str, chunk: pd.DataFrame, first_chunk: bool) -> None:
+        """
+        Method to export a chunk to path. The first chunk (over)writes path including the header,
+        further chunks are appended to it.
+
+        Args:
+            path:
+                Full path, including the filename, to where the chunk should be exported.
+            chunk:
+                The pandas.DataFrame chunk that should be exported.
+            first_chunk:
+                Boolean if chunk is the first chunk to be exported to path.
+        """
+        self.exporter.export_pandas_file(
+            path=path,
+            pandas_object=chunk,
+            mode='w' if first_chunk else 'a',
+            header=first_chunk,
+            compression='gzip'
+        )
+
+    def _filter_validation(
+            self,
+            validation: pd.DataFrame,
+            previous_iteration_dataset: pd.DataFrame | None,
+            variant_index: VariantIndex | None
+    ) -> pd.DataFrame | None:
+        """
+        Method to generate the validation_filtered dataset out of the previous iteration
+        train-test and/or the variant indexes of previously released models.
 
         Args:
-            train_test:
-                pandas.DataFrame object of the train-test dataset.
             validation:
-                Optional pathlike object of the validation cli argument.
+                Pandas DataFrame object of the (semi) final validation dataset.
+            previous_iteration_dataset:
+                (Optional) Pandas DataFrame object of the VEP annotated dataset used to make the
+                previous iteration model.
+            variant_index:
+                (Optional) VariantIndex of one or more previously released models.
+
+        Returns:
+            validation_filtered:
+                Pandas DataFrame object of validation filtered on previous_iteration_dataset
+                and variant_index. None if both are None.
+        """
+        validation_filtered = self._process_previous_iteration(
+            validation,
+            previous_iteration_dataset
+        )
+        if variant_index is not None:
+            validation_filtered = self._process_variant_index(
+                validation if validation_filtered is None else validation_filtered,
+                variant_index
+            )
+        return validation_filtered
+
+    def _read_previous_iteration(
+            self,
+            previous_iteration_argument: os.PathLike[str] | None
+    ) -> pd.DataFrame | None:
+        """
+        Method to read in only the key columns of the previous iteration train-test dataset.
+
+        Args:
+            previous_iteration_argument:
+                (Optional) Pathlike object directing to the VEP annotated train-test dataset of
+                the previous iteration model.
 
         Returns:
             dataframe:
-                Merged dataframe between train_test and validation (if validation is not None,
-                if validation is None just returns train_test).
-                Does set the dataset identifier for validation.
+                Loaded in pandas.DataFrame containing only the key columns of the previous
+                iteration train-test dataset. None if previous_iteration_argument is None.
         """
-        merged_dataset = train_test
-        if validation is not None:
-            validation = self._read_vep_data(validation)
-            add_dataset_source(validation, DatasetIdentifierEnums.VALIDATION.value)
-            merged_dataset = merge_dataset_rows(train_test, validation)
-        return merged_dataset
+        if previous_iteration_argument is None:
+            return None
+        return self._read_pandas_tsv(
+            previous_iteration_argument,
+            ProcessVEPEnums.PREVIOUS_ITERATION_KEY.value,
+            usecols=ProcessVEPEnums.PREVIOUS_ITERATION_KEY.value
+        )
 
     @staticmethod
     def _process_previous_iteration(
@@ -192,10 +512,11 @@ class ProcessVEP(Module):
             validation_dataset:
                 Pandas DataFrame object of the (semi) final validation dataset that is in need of
                 being filtered on the train-test of the previous iteration model, for an unbiased
-                comparison plots.
+                comparison plots. Is not altered.
             previous_iteration_dataset:
-                (Optional) Pandas DataFrame object of the VEP annotated dataset used to make the
-                previous iteration model to compare the new iteration model to.
+                (Optional) Pandas DataFrame object of (the key columns of) the VEP annotated
+                dataset used to make the previous iteration model to compare the new iteration
+                model to.
 
         Returns:
             validation_filtered:
@@ -205,41 +526,41 @@ class ProcessVEP(Module):
         """
         if previous_iteration_dataset is None:
             return None
-        else:
-            validation_dataset[
-                ColumnEnums.DATASET_SOURCE.value
-            ] = DatasetIdentifierEnums.VALIDATION.value
-            validation_dataset[
-                ColumnEnums.PROCESSING_COLUMN.value
-            ] = validation_dataset[
-                ['CHROM', 'POS', 'REF', 'ALT', 'Gene', 'SYMBOL_SOURCE']
-            ].astype(str).agg('!'.join, axis=1)
-            previous_iteration_dataset[
-                ColumnEnums.DATASET_SOURCE.value
-            ] = DatasetIdentifierEnums.TRAIN_TEST.value
-            previous_iteration_dataset[
-                ColumnEnums.PROCESSING_COLUMN.value
-            ] = previous_iteration_dataset[
-                ['CHROM', 'POS', 'REF', 'ALT', 'Gene', 'SYMBOL_SOURCE']
-            ].astype(str).agg('!'.join, axis=1)
-            merge = merge_dataset_rows(validation_dataset, previous_iteration_dataset)
-            merge.drop_duplicates(
-                subset=ColumnEnums.PROCESSING_COLUMN.value,
-                inplace=True,
-                keep=False
-            )
-            validation_filtered = merge.loc[
-                merge[
-                    merge[
-                        ColumnEnums.DATASET_SOURCE.value
-                    ] == DatasetIdentifierEnums.VALIDATION.value].index,
-                :
-            ].reset_index(drop=True)
-            validation_filtered.drop(
-                columns=[ColumnEnums.PROCESSING_COLUMN.value, ColumnEnums.DATASET_SOURCE.value],
-                inplace=True
-            )
-            return validation_filtered
+        not_previously_trained = anti_join(
+            validation_dataset,
+            previous_iteration_dataset,
+            ProcessVEPEnums.PREVIOUS_ITERATION_KEY.value
+        )
+        return validation_dataset[not_previously_trained].reset_index(drop=True)
+
+    @staticmethod
+    def _process_variant_index(
+            validation_dataset: pd.DataFrame,
+            variant_index: VariantIndex
+    ) -> pd.DataFrame:
+        """
+        Method to filter the validation dataset on the variants that previously released models
+        have been trained on.
+
+        Args:
+            validation_dataset:
+                Pandas DataFrame object of the (semi) final validation dataset that is in need of
+                being filtered on the variants of the previously released models.
+            variant_index:
+                VariantIndex of one or more previously released models.
+
+        Returns:
+            validation_filtered:
+                Pandas DataFrame object of the input validation_dataset, containing only the
+                variants that are not present in variant_index.
+        """
+        previously_trained = variant_index.contains(
+            validation_dataset[VCFEnums.CHROM.processed_name],
+            validation_dataset[VCFEnums.POS.value],
+            validation_dataset[VCFEnums.REF.value],
+            validation_dataset[VCFEnums.ALT.value]
+        )
+        return validation_dataset[~previously_trained].reset_index(drop=True)
 
     @staticmethod
     def _read_train_features(train_features_argument: os.PathLike[str]) -> list[str]:
@@ -321,51 +642,275 @@ class ProcessVEP(Module):
             data: pd.DataFrame,
             train_features: list[str],
             cgd: list[str],
-            build38: bool
-    ):
+            build38: bool,
+            progress_printer: ProgressPrinter,
+            deduplicators: tuple[Deduplicator, Deduplicator] | None = None,
+            workers: int = 1
+    ) -> pd.DataFrame:
         """
         Object Orientated function to call each of the processors that correct the processed VEP
         data.
 
+        Each processor returns a mask of the samples it drops. All masks are evaluated on the
+        same (unfiltered) data and combined, so that data only has to be subset once. The order
+        of the processors is kept for the accounting of the dropped samples: a sample is only
+        accounted to the first processor that drops it.
+
         Args:
             data:
                 Merged pandas.DataFrame between train-test and validation that should be
                 processed upon.
-                Please note that this method is performed inplace.
             train_features:
                 List of all the train_features that are going to be used in capice train.
             cgd:
                 List of all the CGD AR containing genes.
             build38:
                 Boolean if the VEP files are created for build 38 or not.
+            progress_printer:
+                ProgressPrinter of data, to which the drop mask of each processor is supplied.
+            deduplicators:
+                (Optional) Tuple containing [0] the full-row and [1] the train features
+                Deduplicator, for instance StreamingDeduplicators when data is a chunk.
+                When combined with workers, only the train features Deduplicator is used.
+            workers:
+                (Optional) The amount of processes to shard data over. Default: 1.
 
+        Returns:
+            dataframe:
+                The processed data, without the dropped samples and without the ID column.
         """
-        progress_printer = ProgressPrinter(data)
+        if workers > 1:
+            masks = self._evaluate_processors_sharded(
+                data,
+                train_features,
+                cgd,
+                build38,
+                workers,
+                None if deduplicators is None else deduplicators[1]
+            )
+        else:
+            masks = self._evaluate_processors(
+                data,
+                train_features,
+                cgd,
+                build38,
+                deduplicators
+            )
+        for mask in masks:
+            progress_printer.new_mask(mask)
+        return data.loc[
+            ~progress_printer.dropped,
+            data.columns[data.columns != VCFEnums.ID.value]
+        ]
+
+    @staticmethod
+    def _evaluate_processors(
+            data: pd.DataFrame,
+            train_features: list[str],
+            cgd: list[str],
+            build38: bool,
+            deduplicators: tuple[Deduplicator, Deduplicator] | None = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Generator that evaluates each of the processors on data, in order.
+
+        Args:
+            data:
+                Merged pandas.DataFrame between train-test and validation that should be
+                processed upon. The GRCh38 chromosome processing and the binarized_label and
+                sample_weight extraction are performed inplace.
+            train_features:
+                List of all the train_features that are going to be used in capice train.
+            cgd:
+                List of all the CGD AR containing genes.
+            build38:
+                Boolean if the VEP files are created for build 38 or not.
+            deduplicators:
+                (Optional) Tuple containing [0] the full-row and [1] the train features
+                Deduplicator.
+
+        Yields:
+            numpy.ndarray:
+                The drop mask of each of the processors.
+        """
+        entries_deduplicator, features_deduplicator = None, None
+        if deduplicators is not None:
+            entries_deduplicator, features_deduplicator = deduplicators
 
         processer = VEPProcesser()
-        processer.drop_duplicate_entries(data)
-        progress_printer.new_shape(data)
+        yield processer.drop_duplicate_entries(data, entries_deduplicator)
 
-        processer.drop_duplicates(data, train_features)
-        progress_printer.new_shape(data)
+        yield processer.drop_duplicates(data, train_features, features_deduplicator)
 
-        processer.drop_genes_empty(data)
-        progress_printer.new_shape(data)
+        yield processer.drop_genes_empty(data)
 
         if build38:
-            processer.process_grch38(data)
-            progress_printer.new_shape(data)
+            yield processer.process_grch38(data)
 
-        processer.drop_mismatching_genes(data)
-        progress_printer.new_shape(data)
+        yield processer.drop_mismatching_genes(data)
 
-        processer.drop_heterozygous_variants_in_ar_genes(data, cgd)
-        progress_printer.new_shape(data)
+        yield processer.drop_heterozygous_variants_in_ar_genes(data, cgd)
 
-        self.extract_label_and_weight(data)
-        processer.drop_variants_incorrect_label_or_weight(data)
-        progress_printer.new_shape(data)
-        progress_printer.print_final_shape()
+        ProcessVEP.extract_label_and_weight(data)
+        yield processer.drop_variants_incorrect_label_or_weight(data)
+
+    def _evaluate_processors_sharded(
+            self,
+            data: pd.DataFrame,
+            train_features: list[str],
+            cgd: list[str],
+            build38: bool,
+            workers: int,
+            features_deduplicator: Deduplicator | None = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Generator that evaluates each of the processors on data, sharded by contig over a pool
+        of workers processes.
+
+        All processors, apart from the train features duplicates, only require samples of the
+        same contig (full duplicates share their contig). For the train features duplicates, each
+        shard returns the hashes of its train features, so that the duplicates over all shards
+        are determined on the combined hashes. The results of all shards are placed back into
+        the order of data, so that the masks are equal to the non-sharded masks.
+
+        Args:
+            data:
+                Merged pandas.DataFrame between train-test and validation that should be
+                processed upon. The GRCh38 chromosome processing and the binarized_label and
+                sample_weight extraction are performed inplace.
+            train_features:
+                List of all the train_features that are going to be used in capice train.
+            cgd:
+                List of all the CGD AR containing genes.
+            build38:
+                Boolean if the VEP files are created for build 38 or not.
+            workers:
+                The amount of processes to shard data over.
+            features_deduplicator:
+                (Optional) The train features Deduplicator to determine the train features
+                duplicates over all shards with.
+
+        Yields:
+            numpy.ndarray:
+                The drop mask of each of the processors.
+        """
+        shards = self._shard_by_contig(data, workers)
+        print(f'Processing {len(shards)} shards over {workers} workers.')
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    self._process_shard,
+                    [data.iloc[positions] for positions in shards],
+                    repeat(train_features),
+                    repeat(cgd),
+                    repeat(build38)
+                )
+            )
+        messages = results[0][1]
+        masks = np.zeros((len(messages), data.shape[0]), dtype=bool)
+        hashes = np.empty(data.shape[0], dtype=np.uint64)
+        transformed = {}
+        for positions, (shard_masks, _, shard_hashes, shard_transformed) in zip(shards, results):
+            masks[:, positions] = shard_masks
+            hashes[positions] = shard_hashes
+            for column in shard_transformed.columns:
+                if column not in transformed:
+                    transformed[column] = np.empty(
+                        data.shape[0],
+                        dtype=shard_transformed[column].dtype
+                    )
+                transformed[column][positions] = shard_transformed[column].to_numpy()
+        for column, values in transformed.items():
+            data[column] = values
+        # Train features duplicates can occur between shards
+        if features_deduplicator is None:
+            features_deduplicator = Deduplicator(train_features)
+        masks[1] = features_deduplicator.duplicated(data, hashes)
+        for message, mask in zip(messages, masks):
+            print(message, end='')
+            yield mask
+
+    @staticmethod
+    def _shard_by_contig(data: pd.DataFrame, shards: int) -> list[np.ndarray]:
+        """
+        Method to divide the samples of data over (at most) shards shards, keeping all samples of
+        a contig within the same shard. Contigs are divided from largest to smallest, each to the
+        shard with the least samples so far.
+
+        Args:
+            data:
+                Merged pandas.DataFrame between train-test and validation.
+            shards:
+                The maximum amount of shards.
+
+        Returns:
+            list:
+                List containing a sorted array of the positions of the samples of each
+                (non-empty) shard.
+        """
+        codes, _ = pd.factorize(data[VCFEnums.CHROM.processed_name], use_na_sentinel=False)
+        contig_sizes = np.bincount(codes)
+        shard_of_contig = np.zeros(contig_sizes.size, dtype=np.int64)
+        shard_sizes = np.zeros(shards, dtype=np.int64)
+        for contig in np.argsort(-contig_sizes, kind='stable'):
+            shard = np.argmin(shard_sizes)
+            shard_of_contig[contig] = shard
+            shard_sizes[shard] += contig_sizes[contig]
+        shard_codes = shard_of_contig[codes]
+        return [
+            np.flatnonzero(shard_codes == shard)
+            for shard in range(shards) if shard_sizes[shard] > 0
+        ]
+
+    @staticmethod
+    def _process_shard(
+            shard: pd.DataFrame,
+            train_features: list[str],
+            cgd: list[str],
+            build38: bool
+    ) -> tuple[np.ndarray, list[str], np.ndarray, pd.DataFrame]:
+        """
+        Worker method to evaluate each of the processors on a single shard.
+
+        Args:
+            shard:
+                The samples of the merged pandas.DataFrame that are part of the shard.
+            train_features:
+                List of all the train_features that are going to be used in capice train.
+            cgd:
+                List of all the CGD AR containing genes.
+            build38:
+                Boolean if the VEP files are created for build 38 or not.
+
+        Returns:
+            tuple:
+                Tuple containing [0] the drop masks of each processor (train features
+                duplicates only within the shard), [1] the messages printed by each processor,
+                [2] the train features hashes of each sample and [3] the columns that have been
+                processed or added inplace.
+        """
+        hashes = Deduplicator.hash_rows(shard[train_features])
+        columns = shard.columns
+        masks = []
+        messages = []
+        processors = ProcessVEP._evaluate_processors(
+            shard,
+            train_features,
+            cgd,
+            build38,
+            deduplicators=(Deduplicator(), Deduplicator(train_features))
+        )
+        while True:
+            with redirect_stdout(StringIO()) as message:
+                mask = next(processors, None)
+            if mask is None:
+                break
+            masks.append(mask)
+            messages.append(message.getvalue())
+        transformed = shard.columns.difference(columns, sort=False)
+        if build38:
+            transformed = transformed.append(pd.Index([VCFEnums.CHROM.processed_name]))
+        return np.stack(masks), messages, hashes, shard[transformed]
 
     @staticmethod
     def extract_label_and_weight(data: pd.DataFrame):
@@ -385,50 +930,6 @@ class ProcessVEP(Module):
         data[ColumnEnums.SAMPLE_WEIGHT.value] = data[VCFEnums.ID.value].str.split(
             VCFEnums.ID_SEPARATOR.value, expand=True)[6].astype(float)
 
-    @staticmethod
-    def _split_data(
-            merged_data: pd.DataFrame
-    ) -> tuple[pd.DataFrame, pd.DataFrame | None]:
-        """
-        Method to split the merged train-test and validation back to the 2 separate datasets.
-        Self checks if validation is present within the dataset or not.
-
-        Args:
-            merged_data:
-                Merged pandas.DataFrame between train-test and (optionally) validation.
-
-        Returns:
-            tuple:
-                Tuple containing [0] the train-test dataframe and [1] the validation dataframe (
-                if validation is present in merged_data, else None).
-        """
-        train_test = merged_data.loc[
-                     merged_data[
-                         merged_data[
-                             ColumnEnums.DATASET_SOURCE.value
-                         ] == DatasetIdentifierEnums.TRAIN_TEST.value
-                         ].index, :
-                     ]
-        train_test.reset_index(drop=True, inplace=True)
-        train_test.drop(columns=ColumnEnums.DATASET_SOURCE.value, inplace=True)
-        if (
-                DatasetIdentifierEnums.VALIDATION.value
-                in
-                merged_data[ColumnEnums.DATASET_SOURCE.value].values
-        ):
-            validation = merged_data.loc[
-                         merged_data[
-                             merged_data[
-                                 ColumnEnums.DATASET_SOURCE.value
-                             ] == DatasetIdentifierEnums.VALIDATION.value
-                             ].index, :
-                         ]
-            validation.reset_index(drop=True, inplace=True)
-            validation.drop(columns=ColumnEnums.DATASET_SOURCE.value, inplace=True)
-        else:
-            validation = None
-        return train_test, validation
-
     def export(self, output: dict[str, str | pd.DataFrame | os.PathLike[str]]) -> None:
         """
         Main exporting function to call the separate exporters for train-test and validation.
@@ -440,10 +941,11 @@ class ProcessVEP(Module):
 
         """
         output_path = output[DatasetIdentifierEnums.OUTPUT.value]
-        self.exporter.export_pandas_file(
-            path=os.path.join(output_path, 'train_test.tsv.gz'),
-            pandas_object=output[DatasetIdentifierEnums.TRAIN_TEST.value]
-        )
+        if output[DatasetIdentifierEnums.TRAIN_TEST.value] is not None:
+            self.exporter.export_pandas_file(
+                path=os.path.join(output_path, 'train_test.tsv.gz'),
+                pandas_object=output[DatasetIdentifierEnums.TRAIN_TEST.value]
+            )
         if output[DatasetIdentifierEnums.VALIDATION.value] is not None:
             self.exporter.export_pandas_file(
                 path=os.path.join(output_path, 'validation.tsv.gz'),
@@ -1,43 +1,58 @@
-import pandas as pd
-
-from molgenis.capice_resources.core import ColumnEnums
+import numpy as np
 
 
 class ProgressPrinter:
-    def __init__(self, dataset: pd.DataFrame):
+    def __init__(self, dataset: str, sample_size: int):
         """
         Class to house the ProgressPrinter to backtrack how many samples have been filtered out
-        with each processing step.
+        of a dataset with each processing step.
 
-        After initialization, ProgressPrinter().new_shape()
-        should be called to update the sample size of each of the dataset sources.
+        After initialization, ProgressPrinter().new_mask()
+        should be called with the drop mask of each of the processing steps.
 
         Args:
             dataset:
-                Merged dataset containing both train-test and validation.
-                Should also contain the dataset source column.
+                The name of the dataset (for instance train_test or validation).
+            sample_size:
+                The amount of samples of the dataset before processing.
         """
-        self.grouped_save = dataset.groupby(ColumnEnums.DATASET_SOURCE.value).size()
+        self.dataset = dataset
+        self.dropped = np.zeros(sample_size, dtype=bool)
 
-    def new_shape(self, dataset: pd.DataFrame):
+    def new_mask(self, mask: np.ndarray) -> None:
         """
-        Method to set a new sample size for each of the dataset sources.
+        Method to print the amount of newly dropped samples of the dataset. Samples that have
+        already been dropped by a previous processing step are not counted again.
 
         Args:
-            dataset:
-                Merged dataset containing both train-test and validation. Should be called after
-                each of the processing steps.
+            mask:
+                Boolean mask of the processing step, True for each sample that is dropped.
+                Should be called after each of the processing steps.
+
+        """
+        print(f'Dropped {np.count_nonzero(mask & ~self.dropped)} variants from {self.dataset}')
+        self.dropped |= mask
 
+    def remaining_samples(self) -> int:
         """
-        new_save = dataset.groupby(ColumnEnums.DATASET_SOURCE.value).size()
-        dropped = self.grouped_save - new_save
-        for group, counts in zip(dropped.index, dropped.values):
-            print(f'Dropped {counts} variants from {group}')
-        self.grouped_save = new_save
+        Method to obtain the sample size of the dataset that remains after all processing steps
+        so far.
 
-    def print_final_shape(self):
+        Returns:
+            int:
+                The remaining sample size.
         """
-        Method to print out the final sample sizes of each of the dataset sources.
+        return self.dropped.size - np.count_nonzero(self.dropped)
+
+    def print_final_shape(self, remaining: int | None = None):
+        """
+        Method to print out the final sample size of the dataset.
+
+        Args:
+            remaining:
+                (Optional) Sample size to print instead, for instance the summed
+                remaining_samples() of multiple chunks.
         """
-        for group, counts in zip(self.grouped_save.index, self.grouped_save.values):
-            print(f'Final number of samples in {group}: {counts}')
+        if remaining is None:
+            remaining = self.remaining_samples()
+        print(f'Final number of samples in {self.dataset}: {remaining}')
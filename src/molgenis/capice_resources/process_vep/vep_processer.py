@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.core import ColumnEnums, VCFEnums
+from molgenis.capice_resources.core.deduplicator import Deduplicator
 from molgenis.capice_resources.process_vep import ProcessVEPEnums
 
 
@@ -9,133 +10,160 @@ class VEPProcesser:
     """
     Class to house all VEP processors.
 
+    Each processor does not drop any samples itself, but returns a boolean mask that is True for
+    each sample that should be dropped. This way all processors can be evaluated on the same
+    dataframe and be combined, so that the dataframe only has to be subset once.
+
     Please note that a print statement should be made what the processor is processing, as the
     progress printer does not know what each of these processors do.
     """
     @staticmethod
-    def drop_genes_empty(data: pd.DataFrame) -> None:
+    def drop_genes_empty(data: pd.DataFrame) -> np.ndarray:
         """
-        Method to drop all entries where the VEP output GENE column does not contain any entries.
+        Method to mark all entries where the VEP output GENE column does not contain any entries.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
 
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping empty genes.')
-        data.drop(index=data[data[ColumnEnums.SYMBOL.value].isnull()].index, inplace=True)
+        return data[ColumnEnums.SYMBOL.value].isnull().to_numpy()
 
     @staticmethod
-    def process_grch38(data: pd.DataFrame) -> None:
+    def process_grch38(data: pd.DataFrame) -> np.ndarray:
         """
-        Method to process all GRCh38 entries and their alternative contigs.
+        Method to process all GRCh38 entries and mark their alternative contigs.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
+                The "chr" prefix is removed from the chromosome column inplace.
 
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample located on an alternative contig.
         """
         print('Processing GRCh38.')
         data[VCFEnums.CHROM.processed_name] = data[VCFEnums.CHROM.processed_name].str.split(
             VCFEnums.CHROM.shortened_name, expand=True)[1]
         y = np.append(np.arange(1, 23).astype(str), ['X', 'Y', 'MT'])
-        data.drop(data[~data[VCFEnums.CHROM.processed_name].isin(y)].index, inplace=True)
+        return ~data[VCFEnums.CHROM.processed_name].isin(y).to_numpy()
 
     @staticmethod
-    def drop_duplicate_entries(data: pd.DataFrame) -> None:
+    def drop_duplicate_entries(
+            data: pd.DataFrame,
+            deduplicator: Deduplicator | None = None
+    ) -> np.ndarray:
         """
-        Method drop fully duplicated entries, regardless of the train features or not.
+        Method to mark fully duplicated entries, regardless of the train features or not.
+        The first occurrence of each entry is kept.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
+            deduplicator:
+                (Optional) Full-row mode Deduplicator to use, for instance a
+                StreamingDeduplicator when data is processed in chunks.
 
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping duplicated variants.')
-        data.drop_duplicates(inplace=True)
+        if deduplicator is None:
+            deduplicator = Deduplicator()
+        return deduplicator.duplicated(data)
 
     @staticmethod
-    def drop_mismatching_genes(data: pd.DataFrame) -> None:
+    def drop_mismatching_genes(data: pd.DataFrame) -> np.ndarray:
         """
-        Method to drop entries where the ID gene does not match the SYMBOL gene.
+        Method to mark entries where the ID gene does not match the SYMBOL gene.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
 
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping variants with mismatching genes.')
-        data.drop(
-            index=data[data[VCFEnums.ID.value].str.split(
-                VCFEnums.ID_SEPARATOR.value, expand=True
-            )[4] != data[ColumnEnums.SYMBOL.value]].index,
-            inplace=True
-        )
+        return (
+            data[VCFEnums.ID.value].str.split(VCFEnums.ID_SEPARATOR.value, expand=True)[4] !=
+            data[ColumnEnums.SYMBOL.value]
+        ).to_numpy()
 
     @staticmethod
-    def drop_heterozygous_variants_in_ar_genes(data: pd.DataFrame, cgd: list) -> None:
+    def drop_heterozygous_variants_in_ar_genes(data: pd.DataFrame, cgd: list) -> np.ndarray:
         """
-        Method to drop variants that have only been observed heterozygous in Autosomal Recessive
+        Method to mark variants that have only been observed heterozygous in Autosomal Recessive
         genes.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
             cgd:
                 List of all the CGD AR genes.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping heterozygous variants in AR genes.')
-        data.drop(
-            data[
-                (data[ProcessVEPEnums.GNOMAD_HN.value].notnull()) &
-                (data[ProcessVEPEnums.GNOMAD_HN.value] == 0) &
-                (data[ColumnEnums.SYMBOL.value].isin(cgd))
-                ].index, inplace=True
-        )
+        return (
+            (data[ProcessVEPEnums.GNOMAD_HN.value].notnull()) &
+            (data[ProcessVEPEnums.GNOMAD_HN.value] == 0) &
+            (data[ColumnEnums.SYMBOL.value].isin(cgd))
+        ).to_numpy()
 
     @staticmethod
-    def drop_variants_incorrect_label_or_weight(data: pd.DataFrame) -> None:
+    def drop_variants_incorrect_label_or_weight(data: pd.DataFrame) -> np.ndarray:
         """
-        Method to drop samples where the label or sample weight does not adhere to standards.
+        Method to mark samples where the label or sample weight does not adhere to standards.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
 
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping variants with an incorrect label or weight')
-        data.drop(
-            index=data[data[ColumnEnums.BINARIZED_LABEL.value].isnull()].index,
-            columns=[VCFEnums.ID.value],
-            inplace=True
-        )
-        data.drop(
-            index=data[~data[ColumnEnums.BINARIZED_LABEL.value].isin([0.0, 1.0])].index,
-            inplace=True
-        )
-        data.drop(
-            index=data[~data[ColumnEnums.SAMPLE_WEIGHT.value].isin(
-                ProcessVEPEnums.SAMPLE_WEIGHTS.value)].index,
-            inplace=True
-        )
+        return (
+            data[ColumnEnums.BINARIZED_LABEL.value].isnull() |
+            ~data[ColumnEnums.BINARIZED_LABEL.value].isin([0.0, 1.0]) |
+            ~data[ColumnEnums.SAMPLE_WEIGHT.value].isin(ProcessVEPEnums.SAMPLE_WEIGHTS.value)
+        ).to_numpy()
 
     @staticmethod
-    def drop_duplicates(data: pd.DataFrame, features: list) -> None:
+    def drop_duplicates(
+            data: pd.DataFrame,
+            features: list,
+            deduplicator: Deduplicator | None = None
+    ) -> np.ndarray:
         """
-        Method drop fully duplicated entries according to the training features.
+        Method to mark fully duplicated entries according to the training features.
+        The first occurrence of each entry is kept.
 
         Args:
             data:
                 Merged dataframe between train-test and validation.
-                It is performed inplace and does not return anything.
             features:
                 List of all the features that are going to be used in capice train.
+            deduplicator:
+                (Optional) Deduplicator on features to use, for instance a
+                StreamingDeduplicator when data is processed in chunks.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample that should be dropped.
         """
         print('Dropping duplicates according to train features.')
-        data.drop_duplicates(subset=features, inplace=True)
+        if deduplicator is None:
+            deduplicator = Deduplicator(features)
+        return deduplicator.duplicated(data)
@@ -5,7 +5,6 @@ class ThresholdEnums(Enum):
     """
     Enums specific to the Threshold calculator.
     """
-    CALCULATED_THRESHOLD = 'calculated_threshold'
     RECALL = 'Recall_score'
     INRANGE = 'in_range'
     THRESHOLD = 'Threshold'
@@ -13,3 +12,13 @@ class ThresholdEnums(Enum):
     F1 = 'F1_score'
     THRESHOLDS = 'thresholds'
     FIGURE = 'figure'
+    BOOTSTRAP = 'bootstrap'
+    STATISTIC = 'Statistic'
+    OPTIMAL = 'Optimal'
+    CI_LOWER = 'CI_lower'
+    CI_UPPER = 'CI_upper'
+    GROUPED_THRESHOLDS = 'thresholds_grouped'
+    AF_BIN_GROUP = 'af_bin'
+    AF_BIN = 'gnomAD_AF_bin'
+    N_PATHOGENIC = 'n_pathogenic'
+    N_BENIGN = 'n_benign'
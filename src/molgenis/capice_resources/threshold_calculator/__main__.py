@@ -1,10 +1,12 @@
 import os
+from itertools import zip_longest
 
 import pandas as pd
 
 from molgenis.capice_resources.core import Module, TSVFileEnums, ColumnEnums, DatasetIdentifierEnums
 from molgenis.capice_resources.threshold_calculator import ThresholdEnums
 from molgenis.capice_resources.threshold_calculator.calculator import Calculator
+from molgenis.capice_resources.threshold_calculator.histogram import ScoreHistogram
 from molgenis.capice_resources.threshold_calculator.plotter import ThresholdPlotter
 
 
@@ -19,6 +21,7 @@ class ThresholdCalculator(Module):
     @staticmethod
     def _create_module_specific_arguments(parser):
         required = parser.add_argument_group('Required arguments')
+        optional = parser.add_argument_group('Optional arguments')
 
         required.add_argument(
             '-v',
@@ -44,6 +47,61 @@ class ThresholdCalculator(Module):
             help='Output directory where the output plot and thresholds TSV should be placed.'
         )
 
+        optional.add_argument(
+            '-b',
+            '--bootstrap',
+            type=int,
+            help='The amount of bootstrap resamples of the validation dataset to obtain the '
+                 f'{int(Calculator.CONFIDENCE_LEVEL * 100)}% confidence intervals of the optimal '
+                 'threshold and its recall, precision and F1 score from. The confidence intervals '
+                 'are printed and exported to bootstrap.tsv.gz. '
+                 'Can not be combined with -c / --chunksize.'
+        )
+
+        optional.add_argument(
+            '-c',
+            '--chunksize',
+            type=int,
+            default=None,
+            help='Read the validation and score datasets in lockstep chunks of this amount of '
+                 'samples, accumulating score histograms of the benign and pathogenic samples '
+                 'instead of keeping the datasets in memory. The optimal threshold is then '
+                 'obtained out of the bin edges and the plot shows the histograms.'
+        )
+
+        optional.add_argument(
+            '-n',
+            '--n-bins',
+            type=int,
+            default=ScoreHistogram.N_BINS,
+            help='The amount of equal width score histogram bins between 0 and 1 used with '
+                 '-c / --chunksize or -d / --density. With -c / --chunksize, a multiple of 100 '
+                 'results in the same thresholds TSV as without. '
+                 f'Default: {ScoreHistogram.N_BINS}.'
+        )
+
+        optional.add_argument(
+            '-d',
+            '--density',
+            action='store_true',
+            help='Plot the score histograms of the benign and pathogenic samples instead of a '
+                 'marker for every sample, so that plotting time and size do not grow with the '
+                 'validation dataset. Always enabled with -c / --chunksize.'
+        )
+
+        optional.add_argument(
+            '-g',
+            '--group-by',
+            type=str,
+            default=None,
+            help=f'Comma separated list of "{ColumnEnums.CONSEQUENCE.value}" and/or '
+                 f'"{ThresholdEnums.AF_BIN_GROUP.value}" (gnomAD allele frequency bin) to also '
+                 f'obtain the optimal threshold of each (split) consequence and/or allele '
+                 f'frequency bin of the validation dataset, exported to '
+                 f'{ThresholdEnums.GROUPED_THRESHOLDS.value}.tsv.gz. '
+                 f'Can not be combined with -c / --chunksize.'
+        )
+
         return parser
 
     def _validate_module_specific_arguments(self, parser):
@@ -58,31 +116,202 @@ class ThresholdCalculator(Module):
         output = self.input_validator.validate_output_command_line_interface_path(
             parser.get_argument('output')
         )
+        bootstrap = parser.get_argument('bootstrap')
+        if bootstrap['bootstrap'] is not None and bootstrap['bootstrap'] < 1:
+            raise ValueError('Bootstrap should be at least 1.')
+        chunksize = parser.get_argument('chunksize')
+        if chunksize['chunksize'] is not None and chunksize['chunksize'] < 1:
+            raise ValueError('Chunksize should be at least 1.')
+        if chunksize['chunksize'] is not None and bootstrap['bootstrap'] is not None:
+            raise ValueError('Bootstrap can not be combined with chunksize.')
+        n_bins = parser.get_argument('n_bins')
+        if n_bins['n_bins'] < 1:
+            raise ValueError('The amount of bins should be at least 1.')
+        density = parser.get_argument('density')
+        group_by = parser.get_argument('group_by')
+        if group_by['group_by'] is not None:
+            group_by['group_by'] = self._validate_group_by(group_by['group_by'])
+            if chunksize['chunksize'] is not None:
+                raise ValueError('Group by can not be combined with chunksize.')
         return {
             **validation,
             **score,
-            **output
+            **output,
+            **bootstrap,
+            **chunksize,
+            **n_bins,
+            **density,
+            **group_by
         }
 
+    @staticmethod
+    def _validate_group_by(group_by: str) -> list[str]:
+        """
+        Method to split and validate the comma separated -g / --group-by argument.
+
+        Args:
+            group_by:
+                The -g / --group-by argument.
+
+        Returns:
+            list:
+                List of the columns to group on.
+
+        Raises:
+            ValueError:
+                ValueError is raised when a column can not be grouped on or is supplied twice.
+        """
+        columns = [column.strip() for column in group_by.split(',')]
+        allowed = [ColumnEnums.CONSEQUENCE.value, ThresholdEnums.AF_BIN_GROUP.value]
+        for column in columns:
+            if column not in allowed:
+                raise ValueError(
+                    f'Can not group by {column}, should be one of: {", ".join(allowed)}.'
+                )
+        if len(set(columns)) != len(columns):
+            raise ValueError('Group by columns should be unique.')
+        return columns
+
     def run_module(self, arguments):
-        validation = self._read_pandas_tsv(
-            arguments['validation'],
-            [ColumnEnums.BINARIZED_LABEL.value]
-        )
-        score = self._read_pandas_tsv(
-            arguments['score'],
-            [ColumnEnums.SCORE.value]
-        )
-        merge = pd.concat([validation, score], axis=1)
-        thresholds = Calculator().calculate_threshold(merge)
-        plotter = ThresholdPlotter(thresholds)
-        figure = plotter.plot_threshold(merge)
+        if arguments['chunksize'] is not None:
+            merge = self._accumulate_histogram(
+                arguments['validation'],
+                arguments['score'],
+                arguments['chunksize'],
+                arguments['n_bins']
+            )
+        else:
+            validation = self._read_pandas_tsv(
+                arguments['validation'],
+                self._get_validation_columns(arguments['group_by'])
+            )
+            score = self._read_pandas_tsv(
+                arguments['score'],
+                [ColumnEnums.SCORE.value]
+            )
+            merge = pd.concat([validation, score], axis=1)
+        calculator = Calculator()
+        thresholds = calculator.calculate_threshold(merge)
+        optimal_threshold = calculator.calculate_optimal_threshold(merge)
+        print(
+            f'Optimal threshold: {optimal_threshold[ThresholdEnums.THRESHOLD.value]} '
+            f'(Recall: {optimal_threshold[ThresholdEnums.RECALL.value]}, '
+            f'Precision: {optimal_threshold[ThresholdEnums.PRECISION.value]}, '
+            f'F1: {optimal_threshold[ThresholdEnums.F1.value]})'
+        )
+        confidence_intervals = None
+        if arguments['bootstrap'] is not None:
+            confidence_intervals = calculator.calculate_confidence_intervals(
+                optimal_threshold,
+                calculator.bootstrap(merge, arguments['bootstrap'])
+            )
+            print(
+                f'{int(Calculator.CONFIDENCE_LEVEL * 100)}% confidence intervals over '
+                f'{arguments["bootstrap"]} bootstrap resamples:'
+            )
+            print(confidence_intervals.to_string(index=False))
+        grouped_thresholds = None
+        if arguments['group_by'] is not None:
+            grouped_thresholds = calculator.calculate_grouped_optimal_thresholds(
+                merge,
+                arguments['group_by']
+            )
+        plotter = ThresholdPlotter(optimal_threshold)
+        if isinstance(merge, ScoreHistogram):
+            figure = plotter.plot_threshold_histogram(merge)
+        elif arguments['density']:
+            histogram = ScoreHistogram(arguments['n_bins'])
+            histogram.add(
+                merge[ColumnEnums.BINARIZED_LABEL.value],
+                merge[ColumnEnums.SCORE.value]
+            )
+            figure = plotter.plot_threshold_histogram(histogram)
+        else:
+            figure = plotter.plot_threshold(merge)
         return {
             DatasetIdentifierEnums.OUTPUT.value: arguments['output'],
             ThresholdEnums.THRESHOLDS.value: thresholds,
+            ThresholdEnums.BOOTSTRAP.value: confidence_intervals,
+            ThresholdEnums.GROUPED_THRESHOLDS.value: grouped_thresholds,
             ThresholdEnums.FIGURE.value: figure
         }
 
+    @staticmethod
+    def _get_validation_columns(group_by: list[str] | None) -> list[str]:
+        """
+        Method to obtain the columns the validation dataset requires.
+
+        Args:
+            group_by:
+                (Optional) List of the columns to group on.
+
+        Returns:
+            list:
+                List of the required validation columns.
+        """
+        columns = [ColumnEnums.BINARIZED_LABEL.value]
+        if group_by is not None and ColumnEnums.CONSEQUENCE.value in group_by:
+            columns.append(ColumnEnums.CONSEQUENCE.value)
+        if group_by is not None and ThresholdEnums.AF_BIN_GROUP.value in group_by:
+            columns.append(ColumnEnums.GNOMAD_AF.value)
+        return columns
+
+    def _accumulate_histogram(
+            self,
+            validation_path: os.PathLike[str] | str,
+            score_path: os.PathLike[str] | str,
+            chunksize: int,
+            n_bins: int
+    ) -> ScoreHistogram:
+        """
+        Method to read the validation and score datasets in lockstep chunks, reading only the
+        binarized label and score columns, and to accumulate their score histograms.
+
+        Args:
+            validation_path:
+                Path to the validation dataset.
+            score_path:
+                Path to the scores dataset.
+            chunksize:
+                The (maximum) amount of samples per chunk.
+            n_bins:
+                The amount of histogram bins.
+
+        Returns:
+            ScoreHistogram:
+                The score histograms of the benign and pathogenic validation samples.
+
+        Raises:
+            ValueError:
+                ValueError is raised when the validation and scores datasets do not contain the
+                same amount of samples.
+        """
+        histogram = ScoreHistogram(n_bins)
+        chunks = zip_longest(
+            self._read_pandas_tsv_chunks(
+                validation_path,
+                [ColumnEnums.BINARIZED_LABEL.value],
+                chunksize,
+                usecols=lambda column: column == ColumnEnums.BINARIZED_LABEL.value
+            ),
+            self._read_pandas_tsv_chunks(
+                score_path,
+                [ColumnEnums.SCORE.value],
+                chunksize,
+                usecols=lambda column: column == ColumnEnums.SCORE.value
+            )
+        )
+        for validation, score in chunks:
+            if validation is None or score is None or validation.shape[0] != score.shape[0]:
+                raise ValueError(
+                    'Validation and scores datasets do not contain the same amount of samples.'
+                )
+            histogram.add(
+                validation[ColumnEnums.BINARIZED_LABEL.value],
+                score[ColumnEnums.SCORE.value]
+            )
+        return histogram
+
     def export(self, output):
         self.exporter.export_pandas_file(
             os.path.join(  # type: ignore
@@ -91,6 +320,22 @@ class ThresholdCalculator(Module):
             ),
             output[ThresholdEnums.THRESHOLDS.value]
         )
+        if output[ThresholdEnums.GROUPED_THRESHOLDS.value] is not None:
+            self.exporter.export_pandas_file(
+                os.path.join(  # type: ignore
+                    output[DatasetIdentifierEnums.OUTPUT.value],
+                    ThresholdEnums.GROUPED_THRESHOLDS.value + '.tsv.gz'
+                ),
+                output[ThresholdEnums.GROUPED_THRESHOLDS.value]
+            )
+        if output[ThresholdEnums.BOOTSTRAP.value] is not None:
+            self.exporter.export_pandas_file(
+                os.path.join(  # type: ignore
+                    output[DatasetIdentifierEnums.OUTPUT.value],
+                    ThresholdEnums.BOOTSTRAP.value + '.tsv.gz'
+                ),
+                output[ThresholdEnums.BOOTSTRAP.value]
+            )
         output[ThresholdEnums.FIGURE.value].savefig(  # type: ignore
             os.path.join(  # type: ignore
                 output[DatasetIdentifierEnums.OUTPUT.value],
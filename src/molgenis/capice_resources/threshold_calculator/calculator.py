@@ -1,16 +1,22 @@
 import numpy as np
 import pandas as pd
-from sklearn.metrics import recall_score, precision_score, f1_score
 
-from molgenis.capice_resources.core import ColumnEnums
+from molgenis.capice_resources.core import ColumnEnums, AlleleFrequencyEnums
+from molgenis.capice_resources.utilities import af_bin_codes
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
 from molgenis.capice_resources.threshold_calculator import ThresholdEnums
+from molgenis.capice_resources.threshold_calculator.histogram import ScoreHistogram
 
 
 class Calculator:
     RECALL_UPPER_VALUE = 0.96
     RECALL_LOWER_VALUE = 0.94
+    CONFIDENCE_LEVEL = 0.95
+    RANDOM_STATE = 5
+    # Maximum amount of sampled indices or counts per bootstrap batch, bounding memory usage
+    BOOTSTRAP_BATCH_CELLS = 10_000_000
 
-    def calculate_threshold(self, dataset: pd.DataFrame) -> pd.DataFrame:
+    def calculate_threshold(self, dataset: pd.DataFrame | ScoreHistogram) -> pd.DataFrame:
         """
         Method to calculate the statistics for each threshold, sort the best threshold between
         0.94 and 0.96 recall and return the statistics dataframe.
@@ -20,7 +26,8 @@ class Calculator:
 
         Args:
             dataset:
-                Merged dataset between score and validation.
+                Merged dataset between score and validation, or the ScoreHistogram of the
+                validation samples.
 
         Returns:
             dataframe:
@@ -28,45 +35,419 @@ class Calculator:
                 attempted threshold. Please note that the return dataframe is sorted
                 by threshold between recall 0.94 and 0.96, then sorted by remainder recall scores.
         """
-        threshold_store = []
-        recall_store = []
-        precision_store = []
-        f1_store = []
-        self._reset_threshold(dataset)
-
-        for i in np.arange(0, 1, 0.01):
-            i = round(i, 2)
-            dataset.loc[
-                dataset[ColumnEnums.SCORE.value] >= i,
-                ThresholdEnums.CALCULATED_THRESHOLD.value
-            ] = 1
-            recall = recall_score(
-                y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
-                y_pred=dataset[ThresholdEnums.CALCULATED_THRESHOLD.value]
+        out = self._sweep(dataset, np.array([round(i, 2) for i in np.arange(0, 1, 0.01)]))
+        self._sort_thresholds(out)
+        return out.reset_index(drop=True)
+
+    def calculate_optimal_threshold(self, dataset: pd.DataFrame | ScoreHistogram) -> pd.Series:
+        """
+        Method to obtain the exact optimal threshold: out of all distinct scores (or all bin
+        edges of a ScoreHistogram), the threshold with the highest recall between 0.94 and 0.96
+        (if none lies in between, the highest recall overall). Of thresholds with the same
+        recall, the highest threshold is optimal.
+
+        Args:
+            dataset:
+                Merged dataset between score and validation, or the ScoreHistogram of the
+                validation samples.
+
+        Returns:
+            series:
+                The Threshold, Recall, Precision and F1 score of the optimal threshold.
+        """
+        out = self._sweep(dataset)
+        optimal = self._optimal_positions(
+            out[ThresholdEnums.RECALL.value].to_numpy()[np.newaxis, :]
+        )[0]
+        return out.loc[optimal]
+
+    def calculate_grouped_optimal_thresholds(
+            self,
+            dataset: pd.DataFrame,
+            group_by: list[str]
+    ) -> pd.DataFrame:
+        """
+        Method to obtain the optimal threshold (see calculate_optimal_threshold()) of each
+        (split) consequence and/or gnomAD allele frequency bin in a single pass.
+
+        Each sample is assigned to its groups (a sample containing multiple consequences belongs
+        to the group of each of them). All (group, sample) pairs are sorted once by group and
+        score, after which the true and false positives of every distinct score of every group
+        follow from segmented cumulative sums. The allele frequency bins are those of
+        AlleleFrequencyEnums, with a missing allele frequency binned as 0 (like balance-dataset
+        does).
+
+        Args:
+            dataset:
+                Merged dataset between score and validation. Requires the Consequence column
+                when grouping on Consequence and the gnomAD_AF column when grouping on af_bin.
+            group_by:
+                List containing "Consequence" and/or "af_bin", in the order of the group columns
+                in the output.
+
+        Returns:
+            dataframe:
+                Dataframe containing for each group containing scored samples: the group
+                column(s), the amount of pathogenic and benign samples, and the Threshold,
+                Recall, Precision and F1 score of the optimal threshold. For groups without
+                pathogenic samples, no threshold is optimal: their Threshold, Recall, Precision
+                and F1 score are NaN.
+        """
+        samples = np.arange(dataset.shape[0])
+        groups = np.zeros(dataset.shape[0], dtype=np.int64)
+        group_values = {}
+        if ColumnEnums.CONSEQUENCE.value in group_by:
+            consequence_index = ConsequenceIndex(dataset[ColumnEnums.CONSEQUENCE.value])
+            consequences = np.array(consequence_index.consequences, dtype=object)
+            samples = consequence_index.positions
+            groups = np.repeat(
+                np.arange(consequences.size),
+                np.diff(consequence_index.pointers)
             )
-            precision = precision_score(
-                y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
-                y_pred=dataset[ThresholdEnums.CALCULATED_THRESHOLD.value]
+            group_values[ColumnEnums.CONSEQUENCE.value] = consequences
+        if ThresholdEnums.AF_BIN_GROUP.value in group_by:
+            intervals = pd.IntervalIndex.from_breaks(
+                AlleleFrequencyEnums.AF_BINS.value,
+                closed='left'
+            ).astype(str)
+            codes = af_bin_codes(dataset[ColumnEnums.GNOMAD_AF.value].fillna(0))[samples]
+            within_bin = codes >= 0
+            samples = samples[within_bin]
+            groups = groups[within_bin] * intervals.size + codes[within_bin]
+            group_values[ThresholdEnums.AF_BIN_GROUP.value] = np.array(intervals, dtype=object)
+        n_groups = int(np.prod([values.size for values in group_values.values()]))
+        labels = (dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy() == 1)[samples]
+        scores = dataset[ColumnEnums.SCORE.value].to_numpy(dtype=np.float64)[samples]
+        true_sum = np.bincount(groups[labels], minlength=n_groups)
+        false_sum = np.bincount(groups[~labels], minlength=n_groups)
+        # Samples without score are never positive, so they are not thresholds either
+        scored = ~np.isnan(scores)
+        order = np.lexsort((scores[scored], groups[scored]))
+        groups = groups[scored][order]
+        scores = scores[scored][order]
+        labels = labels[scored][order]
+        # Positives of each pair are all pairs of the same group from its position onwards
+        segment_end = np.searchsorted(groups, groups, side='right')
+        suffix_tp = np.append(np.cumsum(labels[::-1])[::-1], 0)
+        tp = suffix_tp[:-1] - suffix_tp[segment_end]
+        fp = segment_end - np.arange(groups.size) - tp
+        # Each distinct score of a group is a threshold, at its first pair
+        first = np.ones(groups.size, dtype=bool)
+        first[1:] = (groups[1:] != groups[:-1]) | (scores[1:] != scores[:-1])
+        thresholds = np.flatnonzero(first)
+        recall = self._divide(tp[thresholds], true_sum[groups[thresholds]])
+        in_range = (recall >= self.RECALL_LOWER_VALUE) & (recall <= self.RECALL_UPPER_VALUE)
+        group_in_range = np.bincount(groups[thresholds][in_range], minlength=n_groups) > 0
+        candidates = in_range | ~group_in_range[groups[thresholds]]
+        thresholds = thresholds[candidates]
+        recall = recall[candidates]
+        # Sorting by group, recall and threshold: the last of each group is optimal
+        thresholds = thresholds[np.lexsort((scores[thresholds], recall, groups[thresholds]))]
+        last = np.ones(thresholds.size, dtype=bool)
+        last[:-1] = groups[thresholds][1:] != groups[thresholds][:-1]
+        optimal = thresholds[last]
+        # Groups are numbered with the last group column varying fastest
+        codes = dict(
+            zip(
+                group_values.keys(),
+                np.unravel_index(
+                    groups[optimal],
+                    [values.size for values in group_values.values()]
+                )
             )
-            f1 = f1_score(
-                y_true=dataset[ColumnEnums.BINARIZED_LABEL.value],
-                y_pred=dataset[ThresholdEnums.CALCULATED_THRESHOLD.value]
+        )
+        # Ordering the groups by the group columns, in the order of group_by
+        order = np.lexsort([codes[column] for column in reversed(group_by)])
+        optimal = optimal[order]
+        optimal_groups = groups[optimal]
+        out = self._metrics(
+            scores[optimal],
+            tp[optimal],
+            fp[optimal],
+            true_sum[optimal_groups]
+        )
+        out.loc[
+            true_sum[optimal_groups] == 0,
+            [
+                ThresholdEnums.THRESHOLD.value,
+                ThresholdEnums.RECALL.value,
+                ThresholdEnums.PRECISION.value,
+                ThresholdEnums.F1.value
+            ]
+        ] = np.NaN
+        out.insert(0, ThresholdEnums.N_BENIGN.value, false_sum[optimal_groups])
+        out.insert(0, ThresholdEnums.N_PATHOGENIC.value, true_sum[optimal_groups])
+        for column in reversed(group_by):
+            name = ThresholdEnums.AF_BIN.value if (
+                column == ThresholdEnums.AF_BIN_GROUP.value
+            ) else column
+            out.insert(0, name, group_values[column][codes[column][order]])
+        return out
+
+    def bootstrap(
+            self,
+            dataset: pd.DataFrame,
+            n_resamples: int,
+            random_state: int = RANDOM_STATE
+    ) -> pd.DataFrame:
+        """
+        Method to obtain the optimal threshold (see calculate_optimal_threshold()) of bootstrap
+        resamples of the dataset.
+
+        Resamples are drawn and evaluated in batches. Each sample is mapped once to the rank of
+        its score among the distinct scores, after which the amount of pathogenic and benign
+        samples per rank of all resamples of a batch follows from a single bincount. A reversed
+        cumulative sum over the ranks then results in the true and false positives of every
+        threshold of every resample at once. Scores absent from a resample result in the same
+        counts as the next higher score present, so the optimal threshold is always a score of
+        the resample.
+
+        Args:
+            dataset:
+                Merged dataset between score and validation.
+            n_resamples:
+                The amount of bootstrap resamples.
+            random_state:
+                (Optional) The seed of the random number generator the resamples are drawn with.
+
+        Returns:
+            dataframe:
+                Dataframe containing the Threshold, Recall, Precision and F1 score of the optimal
+                threshold of each resample.
+        """
+        pathogenic = (dataset[ColumnEnums.BINARIZED_LABEL.value].to_numpy() == 1).astype(np.intp)
+        scores = dataset[ColumnEnums.SCORE.value].to_numpy(dtype=np.float64)
+        thresholds = np.unique(scores[~np.isnan(scores)])
+        n_thresholds = thresholds.size
+        # Samples without score get an extra rank past the highest threshold, so they are never
+        # positive
+        ranks = np.where(
+            np.isnan(scores),
+            n_thresholds,
+            np.searchsorted(thresholds, scores)
+        )
+        n_ranks = n_thresholds + 1
+        # Each cell of a (batch, label, rank) count array is a bincount bin
+        codes = pathogenic * n_ranks + ranks
+        batch_size = max(1, self.BOOTSTRAP_BATCH_CELLS // max(scores.size, 2 * n_ranks))
+        generator = np.random.default_rng(random_state)
+        optima = []
+        for start in range(0, n_resamples, batch_size):
+            size = min(batch_size, n_resamples - start)
+            resamples = generator.integers(0, scores.size, size=(size, scores.size))
+            offsets = np.arange(size)[:, np.newaxis] * 2 * n_ranks
+            counts = np.bincount(
+                (codes[resamples] + offsets).ravel(),
+                minlength=size * 2 * n_ranks
+            ).reshape(size, 2, n_ranks)
+            true_sum = counts[:, 1].sum(axis=1)
+            # Positives of a threshold are all samples with a rank greater than or equal to it
+            positives = np.cumsum(counts[:, :, n_thresholds - 1::-1], axis=2)[:, :, ::-1]
+            fp = positives[:, 0]
+            tp = positives[:, 1]
+            optimal = self._optimal_positions(self._divide(tp, true_sum[:, np.newaxis]))
+            resample = np.arange(size)
+            optima.append(
+                self._metrics(
+                    thresholds[optimal],
+                    tp[resample, optimal],
+                    fp[resample, optimal],
+                    true_sum
+                )
             )
-            threshold_store.append(i)
-            recall_store.append(recall)
-            precision_store.append(precision)
-            f1_store.append(f1)
-            self._reset_threshold(dataset)
-        out = pd.DataFrame(
+        return pd.concat(optima, ignore_index=True)
+
+    def calculate_confidence_intervals(
+            self,
+            optimal_threshold: pd.Series,
+            bootstrap: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Method to obtain the percentile confidence intervals of the optimal threshold and its
+        scores from the bootstrap resamples.
+
+        Args:
+            optimal_threshold:
+                The optimal threshold as obtained from calculate_optimal_threshold().
+            bootstrap:
+                The optimal threshold of each resample as obtained from bootstrap().
+
+        Returns:
+            dataframe:
+                Dataframe containing the optimal value and the lower and upper bound of the
+                confidence interval of the Threshold, Recall, Precision and F1 score.
+        """
+        alpha = (1 - self.CONFIDENCE_LEVEL) / 2
+        statistics = [
+            ThresholdEnums.THRESHOLD.value,
+            ThresholdEnums.RECALL.value,
+            ThresholdEnums.PRECISION.value,
+            ThresholdEnums.F1.value
+        ]
+        return pd.DataFrame(
             {
-                ThresholdEnums.THRESHOLD.value: threshold_store,
-                ThresholdEnums.RECALL.value: recall_store,
-                ThresholdEnums.PRECISION.value: precision_store,
-                ThresholdEnums.F1.value: f1_store
+                ThresholdEnums.STATISTIC.value: statistics,
+                ThresholdEnums.OPTIMAL.value: optimal_threshold[statistics].to_numpy(
+                    dtype=np.float64
+                ),
+                ThresholdEnums.CI_LOWER.value: bootstrap[statistics].quantile(alpha).to_numpy(),
+                ThresholdEnums.CI_UPPER.value: bootstrap[statistics].quantile(1 - alpha).to_numpy()
             }
         )
-        self._sort_thresholds(out)
-        return out.reset_index(drop=True)
+
+    def _optimal_positions(self, recall: np.ndarray) -> np.ndarray:
+        """
+        Method to obtain the position of the optimal threshold in each row of recall scores:
+        the highest recall between 0.94 and 0.96 (if none lies in between, the highest recall
+        overall). Of thresholds with the same recall, the highest threshold is optimal.
+
+        Args:
+            recall:
+                2D array of the recall score of each ascending threshold (columns) for each set
+                of scores (rows).
+
+        Returns:
+            numpy.ndarray:
+                The position of the optimal threshold of each row.
+        """
+        in_range = (recall >= self.RECALL_LOWER_VALUE) & (recall <= self.RECALL_UPPER_VALUE)
+        candidates = in_range | ~in_range.any(axis=1, keepdims=True)
+        recall = np.where(candidates, recall, -1)
+        # Thresholds are sorted ascending, so the last of the highest recall is the highest
+        return recall.shape[1] - 1 - recall[:, ::-1].argmax(axis=1)
+
+    @staticmethod
+    def sweep(
+            labels: pd.Series | np.ndarray,
+            scores: pd.Series | np.ndarray,
+            thresholds: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """
+        Method to calculate the Recall, Precision and F1 score of a range of thresholds at once.
+
+        The scores of the pathogenic and benign samples are sorted once, after which the amount
+        of true and false positives (samples with a score greater than or equal to the threshold)
+        of each threshold follows from a binary search. Samples without score are never
+        positive. Scores are equal to sklearn's recall_score, precision_score and f1_score,
+        including a score of 0 when undefined.
+
+        Args:
+            labels:
+                The binarized label of each sample.
+            scores:
+                The score of each sample.
+            thresholds:
+                (Optional) The thresholds to calculate the scores of. If not supplied, all
+                distinct scores are used.
+
+        Returns:
+            dataframe:
+                Dataframe containing the Threshold, Recall, Precision and F1 score for each of the
+                thresholds.
+        """
+        labels = np.asarray(labels)
+        scores = np.asarray(scores, dtype=np.float64)
+        has_score = ~np.isnan(scores)
+        pathogenic = labels == 1
+        if thresholds is None:
+            thresholds = np.unique(scores[has_score])
+        pathogenic_scores = np.sort(scores[pathogenic & has_score])
+        benign_scores = np.sort(scores[~pathogenic & has_score])
+        true_sum = np.count_nonzero(pathogenic)
+        tp = pathogenic_scores.size - np.searchsorted(pathogenic_scores, thresholds, side='left')
+        fp = benign_scores.size - np.searchsorted(benign_scores, thresholds, side='left')
+        return Calculator._metrics(thresholds, tp, fp, true_sum)
+
+    def _sweep(
+            self,
+            dataset: pd.DataFrame | ScoreHistogram,
+            thresholds: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """
+        Method to calculate the Recall, Precision and F1 score of a range of thresholds of
+        either a dataset (see sweep()) or a ScoreHistogram.
+
+        Args:
+            dataset:
+                Merged dataset between score and validation, or the ScoreHistogram of the
+                validation samples.
+            thresholds:
+                (Optional) The thresholds to calculate the scores of. If not supplied, all
+                distinct scores of the dataset or all bin edges of the histogram are used.
+
+        Returns:
+            dataframe:
+                Dataframe containing the Threshold, Recall, Precision and F1 score for each of the
+                thresholds.
+        """
+        if isinstance(dataset, ScoreHistogram):
+            if thresholds is None:
+                thresholds = dataset.edges
+            tp, fp = dataset.positives(thresholds)
+            return self._metrics(thresholds, tp, fp, dataset.true_sum)
+        return self.sweep(
+            dataset[ColumnEnums.BINARIZED_LABEL.value],
+            dataset[ColumnEnums.SCORE.value],
+            thresholds
+        )
+
+    @staticmethod
+    def _metrics(
+            thresholds: np.ndarray,
+            tp: np.ndarray,
+            fp: np.ndarray,
+            true_sum: int | np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Method to calculate the Recall, Precision and F1 score from the true and false positives
+        of each threshold.
+
+        Args:
+            thresholds:
+                The thresholds.
+            tp:
+                The amount of true positives of each threshold.
+            fp:
+                The amount of false positives of each threshold.
+            true_sum:
+                The amount of pathogenic samples (of each threshold).
+
+        Returns:
+            dataframe:
+                Dataframe containing the Threshold, Recall, Precision and F1 score for each of the
+                thresholds.
+        """
+        true_sum = np.broadcast_to(true_sum, np.shape(tp))
+        return pd.DataFrame(
+            {
+                ThresholdEnums.THRESHOLD.value: thresholds,
+                ThresholdEnums.RECALL.value: Calculator._divide(tp, true_sum),
+                ThresholdEnums.PRECISION.value: Calculator._divide(tp, tp + fp),
+                ThresholdEnums.F1.value: Calculator._divide(2 * tp, tp + fp + true_sum)
+            }
+        )
+
+    @staticmethod
+    def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        """
+        Method to divide numerator by denominator, resulting in 0 where the denominator is 0.
+
+        Args:
+            numerator:
+                Array of the numerators.
+            denominator:
+                Array of the denominators.
+
+        Returns:
+            numpy.ndarray:
+                Float array of the division.
+        """
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.zeros(np.shape(numerator), dtype=np.float64),
+            where=denominator > 0
+        )
 
     def _sort_thresholds(self, dataset: pd.DataFrame) -> None:
         """
@@ -94,16 +475,3 @@ class Calculator:
                 ThresholdEnums.RECALL.value
             ], ascending=False, inplace=True)
         dataset.drop(columns=[ThresholdEnums.INRANGE.value], inplace=True)
-
-    @staticmethod
-    def _reset_threshold(dataset: pd.DataFrame) -> None:
-        """
-        Reset function for the threshold to reset all "calculated threshold" values to 0.
-
-        Args:
-            dataset:
-                The input dataset over which thresholds should be calculated.
-                Please note that this method is performed inplace.
-
-        """
-        dataset[ThresholdEnums.CALCULATED_THRESHOLD.value] = 0
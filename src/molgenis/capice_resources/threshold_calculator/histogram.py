@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+
+class ScoreHistogram:
+    N_BINS = 10_000
+
+    def __init__(self, n_bins: int = N_BINS):
+        """
+        Accumulator of the score histograms of the benign and pathogenic samples, so that the
+        true and false positives of a threshold can be obtained without keeping the scores in
+        memory.
+
+        The scores (expected between 0 and 1) are binned into n_bins bins of equal width, of
+        which the left edge is inclusive, plus a last bin for scores of 1. Thresholds that are a
+        bin edge (for instance a threshold of 0.01 when n_bins is a multiple of 100) therefore
+        result in exactly the same true and false positives as the unbinned scores would.
+
+        Args:
+            n_bins:
+                (Optional) The amount of bins between a score of 0 and 1.
+        """
+        self.n_bins = n_bins
+        self.edges = np.arange(n_bins + 1) / n_bins
+        # Row 0 contains the benign samples, row 1 the pathogenic samples
+        self.counts = np.zeros((2, n_bins + 1), dtype=np.int64)
+        self.unscored = np.zeros(2, dtype=np.int64)
+
+    @property
+    def true_sum(self) -> int:
+        """
+        The amount of pathogenic samples added, including those without score.
+        """
+        return int(self.counts[1].sum() + self.unscored[1])
+
+    def add(self, labels: pd.Series | np.ndarray, scores: pd.Series | np.ndarray) -> None:
+        """
+        Method to add the scores of a chunk of samples to the histograms.
+
+        Args:
+            labels:
+                The binarized label of each sample. Samples with a label other than 1 are
+                considered benign.
+            scores:
+                The score of each sample. Samples without score are never positive, scores
+                below 0 are added to the first bin and scores above 1 to the last bin.
+        """
+        pathogenic = (np.asarray(labels, dtype=np.float64) == 1).astype(np.intp)
+        scores = np.asarray(scores, dtype=np.float64)
+        has_score = ~np.isnan(scores)
+        self.unscored += np.bincount(pathogenic[~has_score], minlength=2)
+        bins = np.clip(
+            np.searchsorted(self.edges, scores[has_score], side='right') - 1,
+            0,
+            self.n_bins
+        )
+        self.counts += np.bincount(
+            pathogenic[has_score] * (self.n_bins + 1) + bins,
+            minlength=2 * (self.n_bins + 1)
+        ).reshape(2, self.n_bins + 1)
+
+    def positives(self, thresholds: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Method to obtain the amount of true and false positives of each threshold: the samples
+        in all bins of which the left edge is greater than or equal to the threshold.
+
+        Args:
+            thresholds:
+                The thresholds to obtain the positives of.
+
+        Returns:
+            tuple:
+                Tuple containing the true positives [0] and false positives [1] of each
+                threshold.
+        """
+        # Positives of every bin edge, with 0 positives past the last bin
+        cumulative = np.zeros((2, self.n_bins + 2), dtype=np.int64)
+        cumulative[:, :-1] = np.cumsum(self.counts[:, ::-1], axis=1)[:, ::-1]
+        first_bin = np.searchsorted(self.edges, thresholds, side='left')
+        return cumulative[1, first_bin], cumulative[0, first_bin]
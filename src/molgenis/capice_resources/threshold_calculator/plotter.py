@@ -3,24 +3,27 @@ from matplotlib import pyplot as plt
 
 from molgenis.capice_resources.core import ColumnEnums, PlottingEnums
 from molgenis.capice_resources.threshold_calculator import ThresholdEnums
+from molgenis.capice_resources.threshold_calculator.histogram import ScoreHistogram
 
 
 class ThresholdPlotter:
-    def __init__(self, recall_data: pd.DataFrame):
+    HISTOGRAM_PLOT_BINS = 100
+
+    def __init__(self, optimal_threshold: pd.Series):
         """
         Main plotter function of ThresholdCalculator.
 
         Initializes the best scores according to the  "calculator.py"
 
         Args:
-            recall_data:
-                Full output dataframe from the ThresholdCalculator, containing all the recall,
-                F1 and precision scores.
+            optimal_threshold:
+                The optimal threshold as obtained from the Calculator, containing the threshold
+                and its recall, F1 and precision scores.
         """
-        self.best_threshold = recall_data.loc[0, ThresholdEnums.THRESHOLD.value]
-        self.recall = recall_data.loc[0, ThresholdEnums.RECALL.value]
-        self.precision = recall_data.loc[0, ThresholdEnums.F1.value]
-        self.f1 = recall_data.loc[0, ThresholdEnums.RECALL.value]
+        self.best_threshold = optimal_threshold[ThresholdEnums.THRESHOLD.value]
+        self.recall = optimal_threshold[ThresholdEnums.RECALL.value]
+        self.precision = optimal_threshold[ThresholdEnums.PRECISION.value]
+        self.f1 = optimal_threshold[ThresholdEnums.F1.value]
         self.figure = plt.figure()
         # Retina displays overwrite DPI after initialization
         self.figure.set_dpi(PlottingEnums.DPI.value)
@@ -67,6 +70,67 @@ class ThresholdPlotter:
             color='red',
             label=f'N pathogenic: {subset_pathogenic.shape[0]}'
         )
+        ax_plot.set_xticks([])
+        ax_plot.set_xlabel('Variants')
+        self._plot_threshold_line(ax_plot)
+        return self.figure
+
+    def plot_threshold_histogram(self, histogram: ScoreHistogram) -> plt.Figure:
+        """
+        Plotting function of the plotting class for streamed validation and score data.
+
+        Instead of the scores of all variants, plots the benign and pathogenic score histograms
+        (horizontally, so that like in plot_threshold() the score is on the y-axis, and merged
+        to about 100 bins), followed by a horizontal line of the threshold, with in the legend
+        the scores.
+
+        Args:
+            histogram:
+                The ScoreHistogram of the validation samples.
+
+        Returns:
+            figure:
+                matplotlib.pyplot.Figure object of the plot containing the score histograms and
+                the optimal threshold (horizontal line).
+        """
+        ax_plot = self.figure.add_subplot(1, 1, 1)
+        # Merge neighbouring bins for readability, as long as they divide the bins evenly
+        merge = max(1, histogram.n_bins // self.HISTOGRAM_PLOT_BINS)
+        if histogram.n_bins % merge != 0:
+            merge = 1
+        # Scores of 1 are plotted in the last bin
+        counts = histogram.counts[:, :-1].copy()
+        counts[:, -1] += histogram.counts[:, -1]
+        counts = counts.reshape(2, -1, merge).sum(axis=2)
+        edges = histogram.edges[::merge]
+        ax_plot.stairs(
+            counts[0],
+            edges,
+            orientation='horizontal',
+            color='green',
+            label=f'N benign: {histogram.counts[0].sum() + histogram.unscored[0]}'
+        )
+        ax_plot.stairs(
+            counts[1],
+            edges,
+            orientation='horizontal',
+            color='red',
+            label=f'N pathogenic: {histogram.true_sum}'
+        )
+        ax_plot.set_xscale('symlog')
+        ax_plot.set_xlabel('Variants per bin')
+        self._plot_threshold_line(ax_plot)
+        return self.figure
+
+    def _plot_threshold_line(self, ax_plot: plt.Axes) -> None:
+        """
+        Function to plot the horizontal line of the threshold over the full width of ax_plot,
+        with the scores in the legend, and to set the remaining labels and limits.
+
+        Args:
+            ax_plot:
+                The axes on which the variants have been plotted.
+        """
         xmin, xmax = ax_plot.get_xlim()
         ax_plot.hlines(
             self.best_threshold,
@@ -78,8 +142,6 @@ class ThresholdPlotter:
                   f'Precision: {round(self.precision, 4)}\n'
                   f'F1: {round(self.f1, 4)}'
         )
-        ax_plot.set_xticks([])
-        ax_plot.set_xlabel('Variants')
         ax_plot.set_ylabel('CAPICE score')
         ax_plot.set_title('Optimal recall threshold')
         ax_plot.legend(
@@ -89,4 +151,3 @@ class ThresholdPlotter:
         )
         ax_plot.set_xlim(xmin, xmax)
         ax_plot.set_ylim(0, 1)
-        return self.figure
@@ -2,13 +2,16 @@ import gc
 import os
 import gzip
 from datetime import datetime
+from functools import partial
 from importlib.resources import files
 
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources import __version__
 from molgenis.capice_resources.core import Module, TSVFileEnums, DatasetIdentifierEnums, VCFEnums, \
     ColumnEnums
+from molgenis.capice_resources.core.variant_index import VariantIndex
 from molgenis.capice_resources.utilities import merge_dataset_rows
 from molgenis.capice_resources.train_data_creator.filter import SVFilter
 from molgenis.capice_resources.train_data_creator.data_parsers.vkgl import VKGLParser
@@ -32,6 +35,7 @@ class TrainDataCreator(Module):
     @staticmethod
     def _create_module_specific_arguments(parser):
         required = parser.add_argument_group('Required arguments')
+        optional = parser.add_argument_group('Optional arguments')
         required.add_argument(
             '-v',
             '--input-vkgl',
@@ -53,6 +57,17 @@ class TrainDataCreator(Module):
             required=True,
             help='Output directory where the files should be placed.'
         )
+        optional.add_argument(
+            '-i',
+            '--variant-index',
+            type=str,
+            nargs='+',
+            default=None,
+            help='One or more variant indexes (train_test.npy) or train-test VCF files '
+                 '(train_test.vcf.gz) of previously released models. '
+                 'Variants present in any of these will not be sampled into the '
+                 'validation dataset, but are kept in the train-test dataset.'
+        )
         return parser
 
     def _validate_module_specific_arguments(self, parser):
@@ -67,10 +82,16 @@ class TrainDataCreator(Module):
         output = self.input_validator.validate_output_command_line_interface_path(
             parser.get_argument('output')
         )
+        variant_index = self.input_validator.validate_input_command_line_interface_files(
+            parser.get_argument('variant_index'),
+            VariantIndex.INPUT_EXTENSIONS,
+            can_be_optional=True
+        )
         return {
             **vkgl,
             **clinvar,
-            **output
+            **output,
+            **variant_index
         }
 
     def run_module(self, arguments):
@@ -83,20 +104,26 @@ class TrainDataCreator(Module):
         self._validate_clinvar_date()
 
         # Parsing
-        vkgl = self._read_pandas_tsv(
-            vkgl_arg,
-            [  # type: ignore
-                TrainDataCreatorEnums.CHROMOSOME.value,
-                TrainDataCreatorEnums.START.value,
-                TrainDataCreatorEnums.SUPPORT.value,
-                TrainDataCreatorEnums.CLASSIFICATION.value
-            ]
+        inputs = self._prefetch_inputs(
+            {
+                'vkgl': partial(
+                    self._read_pandas_tsv,
+                    vkgl_arg,
+                    [  # type: ignore
+                        TrainDataCreatorEnums.CHROMOSOME.value,
+                        TrainDataCreatorEnums.START.value,
+                        TrainDataCreatorEnums.SUPPORT.value,
+                        TrainDataCreatorEnums.CLASSIFICATION.value
+                    ]
+                ),
+                'clinvar': partial(self._read_vcf_file, clinvar_arg)
+            }
         )
+        vkgl = inputs['vkgl']
+        clinvar = inputs['clinvar']
+        del inputs
         parsed_vkgl = VKGLParser().parse(vkgl)
 
-        clinvar = self._read_vcf_file(
-            clinvar_arg  # type: ignore
-        )
         parsed_clinvar = ClinVarParser().parse(clinvar)
         merge = merge_dataset_rows(parsed_clinvar, parsed_vkgl)
         del clinvar, parsed_clinvar, vkgl, parsed_vkgl
@@ -110,7 +137,9 @@ class TrainDataCreator(Module):
 
         SVFilter().filter(merge)
 
-        train_test, validation = SplitDatasets().split(merge)
+        previously_trained = self._query_variant_index(merge, arguments['variant_index'])
+
+        train_test, validation = SplitDatasets().split(merge, previously_trained)
 
         del merge
         gc.collect()
@@ -121,6 +150,38 @@ class TrainDataCreator(Module):
             DatasetIdentifierEnums.VALIDATION.value: validation
         }
 
+    @staticmethod
+    def _query_variant_index(
+            merged_frame: pd.DataFrame,
+            variant_index_argument: list[os.PathLike[str]] | None
+    ) -> np.ndarray | None:
+        """
+        Method to query the variants of merged_frame against the variant indexes of previously
+        released models.
+
+        Args:
+            merged_frame:
+                The merged dataframe between VKGL and ClinVar.
+            variant_index_argument:
+                (Optional) List of paths to the variant indexes or train-test VCF files of
+                previously released models.
+
+        Returns:
+            numpy.ndarray:
+                Boolean array that is True for each variant of merged_frame that has been trained
+                on by any of the previously released models. None if no variant index is supplied.
+        """
+        if variant_index_argument is None:
+            return None
+        previously_trained = VariantIndex.load(*variant_index_argument).contains(
+            merged_frame[VCFEnums.CHROM.vcf_name],
+            merged_frame[VCFEnums.POS.value],
+            merged_frame[VCFEnums.REF.value],
+            merged_frame[VCFEnums.ALT.value]
+        )
+        print(f'Variants trained on by previous models: {previously_trained.sum()}')
+        return previously_trained
+
     def _validate_vkgl_date(self) -> None:
         """
         Method to validate that the supplied VKGL file contains the file date.
@@ -237,6 +298,31 @@ class TrainDataCreator(Module):
                 ], mode='a', compression='gzip', na_rep=TSVFileEnums.NA_VALUES.value
             )
 
+        self._export_variant_index(output)
+
+    @staticmethod
+    def _export_variant_index(output: dict) -> None:
+        """
+        Method to export the variant index of the train-test dataset, so that future releases can
+        exclude these variants from their validation dataset.
+
+        Args:
+            output:
+                Dictionary obtained from run_module().
+        """
+        train_test: pd.DataFrame = output[DatasetIdentifierEnums.TRAIN_TEST.value]
+        VariantIndex.from_variants(
+            train_test[VCFEnums.CHROM.vcf_name],
+            train_test[VCFEnums.POS.value],
+            train_test[VCFEnums.REF.value],
+            train_test[VCFEnums.ALT.value]
+        ).save(
+            os.path.join(
+                output[DatasetIdentifierEnums.OUTPUT.value],
+                DatasetIdentifierEnums.TRAIN_TEST.value + VariantIndex.EXTENSION
+            )
+        )
+
 
 def main():
     TrainDataCreator().run()
@@ -1,5 +1,6 @@
 import gc
 
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.core import ColumnEnums
@@ -11,7 +12,11 @@ class SplitDatasets:
     FRACTION_TO_VALIDATION = 0.5
     HIGH_QUALITY_WEIGHT = 0.9
 
-    def split(self, merged_frame: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    def split(
+            self,
+            merged_frame: pd.DataFrame,
+            previously_trained: np.ndarray | None = None
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
         """
         Main splitting function of the train-test and validation datasets splitter.
 
@@ -26,15 +31,26 @@ class SplitDatasets:
             merged_frame:
                 The merged dataframe between VKGL and Clinvar of which a train-test and
                 validation dataset should be made.
+            previously_trained:
+                (Optional) Boolean array that is True for each sample of merged_frame that has
+                been trained on by a previously released model. These samples are not sampled
+                into the validation dataset, but do remain in train-test.
 
         Returns:
             tuple:
                 Tuple containing the [0] train-test dataframe and [1] validation dataframe.
         """
         print('Splitting into validation and training.')
-        pathogenic_set = merged_frame[merged_frame[ColumnEnums.BINARIZED_LABEL.value] == 1]
+        validation_candidates = merged_frame
+        if previously_trained is not None:
+            validation_candidates = merged_frame[~previously_trained]
+        pathogenic_set = validation_candidates[
+            validation_candidates[ColumnEnums.BINARIZED_LABEL.value] == 1
+            ]
         print(f'Amount of pathogenic variants:{pathogenic_set.shape[0]}')
-        benign_set = merged_frame[merged_frame[ColumnEnums.BINARIZED_LABEL.value] == 0]
+        benign_set = validation_candidates[
+            validation_candidates[ColumnEnums.BINARIZED_LABEL.value] == 0
+            ]
         print(f'Amount of benign variants:{benign_set.shape[0]}')
         validation = pathogenic_set[
             pathogenic_set[ColumnEnums.SAMPLE_WEIGHT.value] >= self.HIGH_QUALITY_WEIGHT
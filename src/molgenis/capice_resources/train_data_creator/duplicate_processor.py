@@ -1,5 +1,6 @@
 import pandas as pd
 
+from molgenis.capice_resources.core.deduplicator import Deduplicator
 from molgenis.capice_resources.train_data_creator import TrainDataCreatorEnums
 
 
@@ -16,7 +17,7 @@ class DuplicateProcessor:
 
         """
         print('Dropping duplicates.')
-        merged_frame.drop_duplicates(
-            subset=TrainDataCreatorEnums.further_processing_columns(),
-            inplace=True
-        )
+        duplicated = Deduplicator(
+            TrainDataCreatorEnums.further_processing_columns()
+        ).duplicated(merged_frame)
+        merged_frame.drop(index=merged_frame.index[duplicated], inplace=True)
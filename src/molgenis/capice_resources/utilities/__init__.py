@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
 
-from molgenis.capice_resources.core import ColumnEnums
+from molgenis.capice_resources.core import ColumnEnums, AlleleFrequencyEnums
+from molgenis.capice_resources.core.deduplicator import Deduplicator
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
 
 
 def add_dataset_source(frame: pd.DataFrame, name: str) -> None:
@@ -51,11 +53,105 @@ def split_consequences(consequence_column: pd.Series | list[str] | np.ndarray) -
             List of all unique consequences from consequence_column. Even the ones hidden
             inside a singular sample.
     """
-    if not isinstance(consequence_column, pd.Series):
-        consequence_column = pd.Series(consequence_column)
-    splitted_consequences = consequence_column.str.split('&', expand=True)
-    return list(
-        pd.Series(
-            splitted_consequences.values.ravel()
-        ).dropna().sort_values(ignore_index=True).unique()
-    )
+    return ConsequenceIndex(consequence_column).consequences
+
+
+def af_bin_codes(gnomad_af: pd.Series | np.ndarray) -> np.ndarray:
+    """
+    Function to obtain the (left inclusive) allele frequency bin of each sample, according to
+    the bins defined in AlleleFrequencyEnums, through a binary search on the bin edges.
+
+    Args:
+        gnomad_af:
+            The pandas series or numpy ndarray of the gnomAD allele frequency column.
+
+    Returns:
+        numpy.ndarray:
+            The code (position) of the allele frequency bin of each sample. Samples outside the
+            bin edges (or without allele frequency) have code -1.
+    """
+    edges = np.array(AlleleFrequencyEnums.AF_BINS.value)
+    codes = np.searchsorted(edges, np.asarray(gnomad_af, dtype=np.float64), side='right') - 1
+    codes[(codes < 0) | (codes >= edges.size - 1)] = -1
+    return codes.astype(np.int8)
+
+
+def normalize_keys(frame: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    """
+    Function to convert the key columns of a dataset to string, so that keys can be compared
+    between datasets regardless of the dtype the columns have been read in as. Float columns
+    that only contain whole numbers (integer columns that contain missing values) are written
+    without decimals, so that they match their integer notation.
+
+    Args:
+        frame:
+            The dataframe containing the key columns.
+        columns:
+            List of the columns that together make up the key.
+
+    Returns:
+        pandas.DataFrame:
+            New dataframe containing the string representation of each of the key columns.
+    """
+    keys = {}
+    for column in columns:
+        values = frame[column]
+        if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+            values = values.astype('Int64')
+        keys[column] = values.astype(str)
+    return pd.DataFrame(keys, index=frame.index)
+
+
+def encode_keys(frame: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Function to encode the key columns of each sample of a dataset into a 64-bit integer.
+
+    Args:
+        frame:
+            The dataframe containing the key columns.
+        columns:
+            List of the columns that together make up the key.
+
+    Returns:
+        numpy.ndarray:
+            numpy.uint64 array containing the encoded key of each sample.
+    """
+    return Deduplicator.hash_rows(normalize_keys(frame, columns))
+
+
+def anti_join(left: pd.DataFrame, right: pd.DataFrame, columns: list[str]) -> np.ndarray:
+    """
+    Function to obtain the samples of left of which the key is not present in right.
+
+    Keys are first compared on their encoding (see encode_keys()). Only the samples of which
+    the encoded key is present in both datasets are compared on their full key, to confirm that
+    they truly match.
+
+    Args:
+        left:
+            The dataframe of which the samples should be filtered.
+        right:
+            The dataframe containing the keys that should be filtered out of left.
+        columns:
+            List of the columns that together make up the key. Should be present in both
+            left and right.
+
+    Returns:
+        numpy.ndarray:
+            Boolean mask that is True for each sample of left of which the key is not present in
+            right.
+    """
+    left_keys = normalize_keys(left, columns)
+    right_keys = normalize_keys(right, columns)
+    left_encoded = Deduplicator.hash_rows(left_keys)
+    right_encoded = Deduplicator.hash_rows(right_keys)
+    left_candidates = np.flatnonzero(np.isin(left_encoded, right_encoded))
+    keep = np.ones(left.shape[0], dtype=bool)
+    if left_candidates.size > 0:
+        right_candidates = np.isin(right_encoded, left_encoded[left_candidates])
+        keep[left_candidates] = ~pd.MultiIndex.from_frame(
+            left_keys.iloc[left_candidates]
+        ).isin(
+            pd.MultiIndex.from_frame(right_keys[right_candidates])
+        )
+    return keep
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+
+class ConsequenceIndex:
+    """
+    Membership index between the samples and the (split) consequences of a Consequence column.
+
+    Samples can contain multiple consequences, separated by "&". The column is split once, on
+    its unique values only, into a sorted token dictionary of all consequences and a sparse
+    consequence-by-sample membership matrix (in compressed sparse column layout: the positions
+    of the samples containing consequence i are positions[pointers[i]:pointers[i + 1]]).
+    Consequences are matched on the full consequence name, so that a consequence is not matched
+    with samples of which a consequence merely contains its name.
+    """
+    SEPARATOR = '&'
+
+    def __init__(self, consequence_column: pd.Series | list[str] | np.ndarray):
+        """
+        Args:
+            consequence_column:
+                The pandas series, list or numpy ndarray of the Consequence column to index.
+        """
+        codes, uniques = pd.factorize(pd.Series(consequence_column, dtype=object))
+        # Splitting only the unique values of the column, each consequence only once per value
+        unique_tokens = [sorted(set(value.split(self.SEPARATOR))) for value in uniques]
+        self.consequences: list[str] = sorted(
+            set(token for tokens in unique_tokens for token in tokens)
+        )
+        token_ids = {consequence: i for i, consequence in enumerate(self.consequences)}
+        unique_lengths = np.array([len(tokens) for tokens in unique_tokens], dtype=np.int64)
+        unique_offsets = np.concatenate([[0], np.cumsum(unique_lengths)])
+        unique_token_ids = np.array(
+            [token_ids[token] for tokens in unique_tokens for token in tokens],
+            dtype=np.int64
+        )
+        present = np.flatnonzero(codes >= 0)
+        lengths = unique_lengths[codes[present]]
+        samples = np.repeat(present, lengths)
+        # Position of each (sample, consequence) pair within the tokens of its unique value
+        within = np.arange(samples.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        tokens = unique_token_ids[np.repeat(unique_offsets[codes[present]], lengths) + within]
+        order = np.argsort(tokens, kind='stable')
+        self.positions = samples[order]
+        self.pointers = np.concatenate(
+            [[0], np.cumsum(np.bincount(tokens, minlength=len(self.consequences)))]
+        )
+        self.size = codes.size
+        self._token_ids = token_ids
+
+    def rows(self, consequence: str) -> np.ndarray:
+        """
+        Method to obtain the samples that contain consequence.
+
+        Args:
+            consequence:
+                The (full) name of the consequence.
+
+        Returns:
+            numpy.ndarray:
+                Sorted array of the positions of all samples containing consequence. Empty if
+                consequence is not present in the column.
+        """
+        token_id = self._token_ids.get(consequence)
+        if token_id is None:
+            return np.empty(0, dtype=np.int64)
+        return self.positions[self.pointers[token_id]:self.pointers[token_id + 1]]
+
+    def mask(self, consequence: str) -> np.ndarray:
+        """
+        Method to obtain a boolean mask of the samples that contain consequence.
+
+        Args:
+            consequence:
+                The (full) name of the consequence.
+
+        Returns:
+            numpy.ndarray:
+                Boolean mask that is True for each sample containing consequence.
+        """
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.rows(consequence)] = True
+        return mask
+
+    def count(self, consequence: str) -> int:
+        """
+        Method to obtain the amount of samples that contain consequence.
+
+        Args:
+            consequence:
+                The (full) name of the consequence.
+
+        Returns:
+            int:
+                The amount of samples containing consequence.
+        """
+        return self.rows(consequence).size
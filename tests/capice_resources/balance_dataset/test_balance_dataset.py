@@ -1,4 +1,5 @@
 import os
+import gzip
 import unittest
 from unittest.mock import patch
 
@@ -7,6 +8,7 @@ import pandas as pd
 from tests.capice_resources.testing_utilities import get_testing_resources_dir, \
     check_and_remove_directory
 from molgenis.capice_resources.balance_dataset.__main__ import BalanceDataset
+from molgenis.capice_resources.balance_dataset.balancer import Balancer
 
 
 class TestBalanceDataset(unittest.TestCase):
@@ -24,6 +26,11 @@ class TestBalanceDataset(unittest.TestCase):
         check_and_remove_directory(
             os.path.join(cls.output_directory, 'remainder.tsv.gz')
         )
+        for replicate in [1, 2]:
+            for dataset in ['balanced', 'remainder']:
+                check_and_remove_directory(
+                    os.path.join(cls.output_directory, f'{dataset}_replicate_{replicate}.tsv.gz')
+                )
 
     @patch(
         'sys.argv',
@@ -70,6 +77,63 @@ class TestBalanceDataset(unittest.TestCase):
             balanced.shape[0]
         )
 
+    @patch(
+        'sys.argv',
+        [
+            __file__,
+            '-i', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-o', output_directory,
+            '-r', '2',
+            '-s', '5'
+        ]
+    )
+    def test_component_replicates(self):
+        """
+        Component test of balancing multiple replicates. Tests if the first replicate is equal
+        to balancing with the same seed, and if the replicates differ from each other.
+        """
+        BalanceDataset().run()
+        replicates = [
+            pd.read_csv(  # type: ignore
+                os.path.join(self.output_directory, f'balanced_replicate_{replicate}.tsv.gz'),
+                sep='\t',
+                na_values='.'
+            ) for replicate in [1, 2]
+        ]
+        dataset = pd.read_csv(  # type: ignore
+            os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            sep='\t',
+            na_values='.',
+            low_memory=False
+        )
+        expected, _ = Balancer(False, 5).balance(dataset)
+        self.assertEqual(replicates[0].shape[0], expected.shape[0])
+        key = ['CHROM', 'POS', 'REF', 'ALT', 'balanced_on']
+        self.assertListEqual(
+            replicates[0][key].values.tolist(),
+            expected[key].values.tolist()
+        )
+        self.assertFalse(replicates[0].equals(replicates[1]))
+
+    def test_component_downcast(self):
+        """
+        Component test of the downcast flag. Tests if the exported balanced and remainder
+        datasets are equal to those exported without downcasting.
+        """
+        arguments = [
+            __file__,
+            '-i', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-o', self.output_directory
+        ]
+        exported = []
+        for downcast in [[], ['-d']]:
+            with patch('sys.argv', arguments + downcast):
+                BalanceDataset().run()
+            for filename in ['balanced.tsv.gz', 'remainder.tsv.gz']:
+                with gzip.open(os.path.join(self.output_directory, filename), 'rt') as fh:
+                    exported.append(fh.read())
+        self.assertListEqual(exported[:2], exported[2:])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,8 +1,10 @@
 import os
 import unittest
 
+import numpy as np
 import pandas as pd
 
+from molgenis.capice_resources.core import AlleleFrequencyEnums
 from molgenis.capice_resources.utilities import split_consequences
 from molgenis.capice_resources.balance_dataset.balancer import Balancer
 from tests.capice_resources.testing_utilities import get_testing_resources_dir
@@ -42,37 +44,61 @@ class TestBalancer(unittest.TestCase):
                 ['variant_4', 'consequence_2', 0.01, 1]
             ], columns=self.hardcoded_columns  # type: ignore
         )
+        self.counts = np.array([[1, 0], [2, 1]])
+        self.generator = np.random.default_rng(Balancer.RANDOM_STATE)
         self.balancer_nonverbose = Balancer(False)
 
     def test_sampler_unchanged_input_smaller_than_required(self):
         """
-        Test to see if a greater amount of "n_required" than the sample size of "dataset" does
-        not change "dataset".
+        Test to see if a greater amount of "n_required" than the sample size of "counts" does
+        not change "counts".
         """
-        self.assertEqual(self.balancer_nonverbose._sample_variants(self.test_set, 5).shape[0], 4)
+        np.testing.assert_array_equal(
+            self.balancer_nonverbose._sample_counts(self.counts, 5, self.generator),
+            self.counts
+        )
 
     def test_sampler_unchanged_input_equal_required(self):
         """
-        Test to see if an equal amount of "n_required" to the sample size of "dataset" does not
-        change "dataset".
+        Test to see if an equal amount of "n_required" to the sample size of "counts" does not
+        change "counts".
         """
-        self.assertEqual(self.balancer_nonverbose._sample_variants(self.test_set, 4).shape[0], 4)
+        np.testing.assert_array_equal(
+            self.balancer_nonverbose._sample_counts(self.counts, 4, self.generator),
+            self.counts
+        )
 
     def test_sampler_changed_input_bigger_than_required(self):
         """
-        Test to see if a lower amount of "n_required" to the sample size of "dataset" does in fact
-        change the sample size to "n_required".
+        Test to see if a lower amount of "n_required" to the sample size of "counts" does in
+        fact change the sample size to "n_required", without exceeding any stratum.
         """
-        self.assertEqual(self.balancer_nonverbose._sample_variants(self.test_set, 2).shape[0], 2)
+        observed = self.balancer_nonverbose._sample_counts(self.counts, 2, self.generator)
+        self.assertEqual(observed.sum(), 2)
+        self.assertTrue((observed <= self.counts).all())
+        self.assertTupleEqual(observed.shape, self.counts.shape)
 
     def test_sampler_changed_zero_required(self):
         """
-        Test to see if a "n_required" of 0 does not cause errors in terms of amount of samples and
-        if the column names are still correctly applied.
+        Test to see if a "n_required" of 0 does not cause errors in terms of amount of samples.
         """
-        observed = self.balancer_nonverbose._sample_variants(self.test_set, 0)
-        self.assertEqual(observed.shape[0], 0)
-        self.assertListEqual(list(observed.columns), self.hardcoded_columns)
+        observed = self.balancer_nonverbose._sample_counts(self.counts, 0, self.generator)
+        self.assertEqual(observed.sum(), 0)
+
+    def test_sampler_reproducible(self):
+        """
+        Test to see if the sampled counts are equal when sampled with the same random state, so
+        that balanced datasets are reproducible.
+        """
+        counts = np.arange(20).reshape(4, 5)
+        observed = [
+            self.balancer_nonverbose._sample_counts(
+                counts,
+                50,
+                np.random.default_rng(Balancer.RANDOM_STATE)
+            ) for _ in range(2)
+        ]
+        np.testing.assert_array_equal(observed[0], observed[1])
 
     def test_set_columns(self):
         """
@@ -143,6 +169,54 @@ class TestBalancer(unittest.TestCase):
                 axis=0
             ).duplicated().any())
 
+    def test_plan(self):
+        """
+        Test to see if the plan counts the samples of each consequence and AF bin and if the
+        planned amount of balanced samples of each consequence and AF bin is equal to the
+        balanced dataset of balance() with the same random state.
+        """
+        plan = self.balancer_nonverbose.plan(self.dataset.copy(deep=True))
+        balanced, _ = Balancer(False).balance(self.dataset)
+        self.assertEqual(plan['n_balanced'].sum(), balanced.shape[0])
+        balanced_counts = balanced.groupby(
+            [
+                'balanced_on',
+                pd.cut(
+                    balanced['gnomAD_AF'].fillna(0),
+                    AlleleFrequencyEnums.AF_BINS.value,
+                    right=False
+                ).astype(str)
+            ]
+        ).size()
+        planned_counts = plan[plan['n_balanced'] > 0].set_index(
+            ['Consequence', 'gnomAD_AF_bin']
+        )['n_balanced']
+        self.assertDictEqual(balanced_counts.to_dict(), planned_counts.to_dict())
+        self.assertTrue(
+            (plan['n_balanced'] <= 2 * plan[['n_pathogenic', 'n_benign']].min(axis=1)).all()
+        )
+        observed = self.balancer_nonverbose.plan(self.test_set)
+        self.assertListEqual(
+            observed.values.tolist(),
+            [
+                ['consequence_1', '[0.01, 1.0)', 1, 1, 2],
+                ['consequence_2', '[0.01, 1.0)', 1, 1, 2]
+            ]
+        )
+
+    def test_set_bins(self):
+        """
+        Test to see if each sample is assigned the code of its (left inclusive) allele frequency
+        bin, and samples outside of the bins are not assigned any bin.
+        """
+        gnomad_af = pd.Series([0.0, 1e-6, 5e-4, 0.01, 0.5, 1.0, -1.0], index=[3, 4, 5, 6, 7, 8, 9])
+        self.balancer_nonverbose._set_bins(gnomad_af)
+        np.testing.assert_array_equal(
+            self.balancer_nonverbose.af_bin_codes,
+            np.array([0, 1, 3, 5, 5, -1, -1], dtype=np.int8)
+        )
+        self.assertListEqual(self.balancer_nonverbose.bins, [0, 1, 3, 5])
+
     def _test_consequence(self, test_set: pd.DataFrame, expected_rows: dict) -> None:
         """
         Function to check "test_set" according to the amount of "expected_rows".
@@ -151,31 +225,32 @@ class TestBalancer(unittest.TestCase):
         self.balancer_nonverbose._set_bins(test_set['gnomAD_AF'])
         self.balancer_nonverbose._set_columns(test_set.columns)
         consequences = split_consequences(test_set['Consequence'])
+        n_bins = len(AlleleFrequencyEnums.AF_BINS.value)
         for consequence in consequences:
-            observed = self.balancer_nonverbose._process_consequence(
-                test_set[
-                    (test_set['Consequence'].str.contains(
-                        consequence, regex=False)) &
-                    (test_set['binarized_label'] == 1)
+            containing = test_set['Consequence'].str.contains(consequence, regex=False)
+            pathogenic, benign = [
+                np.bincount(
+                    self.balancer_nonverbose.af_bin_codes[
+                        containing & (test_set['binarized_label'] == label)
                     ],
-                test_set[
-                    (test_set['Consequence'].str.contains(
-                        consequence, regex=False)) &
-                    (test_set['binarized_label'] == 0)
-                    ]
+                    minlength=n_bins
+                ).reshape(1, n_bins) for label in [1, 0]
+            ]
+            n_pathogenic, n_benign = self.balancer_nonverbose._process_consequence(
+                pathogenic,
+                benign,
+                self.generator
             )
             self.assertEqual(
-                observed.shape[0],
+                n_pathogenic.sum() + n_benign.sum(),
                 expected_rows[consequence],
                 msg=f'Test failed on consequence: {consequence}'
             )
-            n_benign = observed[observed['binarized_label'] == 0].shape[0]
-            n_patho = observed[observed['binarized_label'] == 1].shape[0]
-            self.assertEqual(
+            np.testing.assert_array_equal(
                 n_benign,
-                n_patho,
-                msg=f'Test failed on consequence: {consequence} for n_benign: {n_benign} and '
-                    f'n_pathogenic: {n_patho}'
+                n_pathogenic,
+                err_msg=f'Test failed on consequence: {consequence} for n_benign: {n_benign} '
+                        f'and n_pathogenic: {n_pathogenic}'
             )
 
     def test_process_consequence_equal(self):
@@ -1,10 +1,13 @@
 import os
+import sys
 import unittest
+import subprocess
 from unittest.mock import patch
 
 import pandas as pd
 from matplotlib import pyplot as plt
 
+from molgenis.capice_resources.core import Module
 from molgenis.capice_resources.core.errors import SampleSizeMismatchError
 from tests.capice_resources.testing_utilities import get_testing_resources_dir, \
     check_and_remove_directory
@@ -59,6 +62,59 @@ class TestCompareModelPerformance(unittest.TestCase):
         CompareModelPerformance().run()
         for figure in self.expected_figures:
             self.assertIn(figure + '.png', os.listdir(self.output_directory))
+        self.assertIn('metrics.tsv.gz', os.listdir(self.output_directory))
+        auc_per_gene = pd.read_csv(
+            os.path.join(self.output_directory, 'auc_per_gene.tsv.gz'),
+            sep='\t'
+        )
+        self.assertListEqual(
+            auc_per_gene.columns.tolist(),
+            ['dataset_source', 'gene_name', 'n_samples', 'n_pathogenic', 'n_benign', 'auc']
+        )
+        self.assertListEqual(
+            auc_per_gene['dataset_source'].unique().tolist(),
+            ['model_1', 'model_2']
+        )
+        pd.testing.assert_frame_equal(
+            auc_per_gene[auc_per_gene['dataset_source'] == 'model_1'].iloc[:, 1:],
+            auc_per_gene[auc_per_gene['dataset_source'] == 'model_2'].iloc[:, 1:].reset_index(
+                drop=True
+            )
+        )
+
+    def test_component_metrics_only(self):
+        """
+        Full component testing of the compare-model-performance from CLI to export with
+        --metrics-only, in a separate process to test that matplotlib is not imported. Only the
+        metrics and AUC per gene tables should be exported.
+        """
+        output_directory = os.path.join(self.output_directory, 'metrics_only')
+        arguments = [
+            __file__,
+            '-a', os.path.join(get_testing_resources_dir(), 'scores.tsv.gz'),
+            '-l', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-o', output_directory,
+            '--metrics-only'
+        ]
+        script = (
+            'import sys\n'
+            'from molgenis.capice_resources.compare_model_performance.__main__ import '
+            'CompareModelPerformance\n'
+            f'sys.argv = {arguments}\n'
+            'CompareModelPerformance().run()\n'
+            'print([module for module in sys.modules if module.startswith("matplotlib")])\n'
+        )
+        process = subprocess.run(
+            [sys.executable, '-c', script],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(process.stdout.splitlines()[-1], '[]')
+        exported = os.listdir(output_directory)
+        for file in exported:
+            check_and_remove_directory(os.path.join(output_directory, file))
+        self.assertListEqual(sorted(exported), ['auc_per_gene.tsv.gz', 'metrics.tsv.gz'])
 
     @patch(
         'sys.argv',
@@ -190,6 +246,101 @@ class TestCompareModelPerformance(unittest.TestCase):
             'Model 2 label argument is supplied, while model 2 score argument is not.'
         )
 
+    def test_component_multiple_models(self):
+        """
+        Full component test (metrics only) to see if the metrics of any amount of models are
+        exported and if a label file supplied for multiple models is only loaded once.
+        """
+        output_directory = os.path.join(self.output_directory, 'multiple_models')
+        scores = os.path.join(get_testing_resources_dir(), 'scores.tsv.gz')
+        labels = os.path.join(get_testing_resources_dir(), 'labels.tsv.gz')
+        arguments = [
+            __file__, '-a', scores, scores, '-a', scores, '-l', labels, '-b', scores,
+            '--metrics-only',
+            '-o', output_directory
+        ]
+        with patch('sys.argv', arguments), patch.object(
+                CompareModelPerformance,
+                '_read_pandas_tsv',
+                autospec=True,
+                side_effect=Module._read_pandas_tsv
+        ) as read:
+            CompareModelPerformance().run()
+        self.assertEqual(read.call_count, 5)
+        metrics = pd.read_csv(os.path.join(output_directory, 'metrics.tsv.gz'), sep='\t')
+        auc_per_gene = pd.read_csv(os.path.join(output_directory, 'auc_per_gene.tsv.gz'), sep='\t')
+        for file in os.listdir(output_directory):
+            check_and_remove_directory(os.path.join(output_directory, file))
+        models = ['model_1', 'model_2', 'model_3', 'model_4']
+        self.assertListEqual(metrics['dataset_source'].unique().tolist(), models)
+        self.assertListEqual(auc_per_gene['dataset_source'].unique().tolist(), models)
+        for model in models[1:]:
+            self.assertListEqual(
+                metrics.loc[metrics['dataset_source'] == model, 'auc'].fillna(-1).tolist(),
+                metrics.loc[metrics['dataset_source'] == 'model_1', 'auc'].fillna(-1).tolist()
+            )
+
+    def test_get_model_paths(self):
+        """
+        Test to see if a single label file is used for all models, if a label file per score
+        file is used for each model and if the model of -b/--scores-model-2 is added after the
+        models of -a/--scores, by default with the label file of model 1.
+        """
+        module = CompareModelPerformance()
+        self.assertTupleEqual(
+            module._get_model_paths(['s1', 's2', 's3'], ['l1'], None, None),
+            (['s1', 's2', 's3'], ['l1', 'l1', 'l1'])
+        )
+        self.assertTupleEqual(
+            module._get_model_paths(['s1', 's2'], ['l1', 'l2'], None, None),
+            (['s1', 's2'], ['l1', 'l2'])
+        )
+        self.assertTupleEqual(
+            module._get_model_paths(['s1'], ['l1'], 's2', None),
+            (['s1', 's2'], ['l1', 'l1'])
+        )
+        self.assertTupleEqual(
+            module._get_model_paths(['s1', 's3'], ['l1'], 's2', 'l2'),
+            (['s1', 's3', 's2'], ['l1', 'l1', 'l2'])
+        )
+        self.assertTupleEqual(
+            module._get_model_paths(['s1', 's3'], ['l1', 'l3'], 's2', None),
+            (['s1', 's3', 's2'], ['l1', 'l3', 'l1'])
+        )
+
+    def test_get_model_paths_incorrect_cli(self):
+        """
+        Test to see if IOError is raised when the amount of label files does not match the
+        amount of score files.
+        """
+        module = CompareModelPerformance()
+        with self.assertRaises(IOError) as e:
+            module._get_model_paths(['s1', 's2', 's3'], ['l1', 'l2'], None, None)
+        self.assertEqual(
+            str(e.exception),
+            'Amount of label files should be 1 or equal to the amount of score files.'
+        )
+        with self.assertRaises(IOError):
+            module._get_model_paths(['s1'], ['l1', 'l2'], 's2', None)
+
+    @patch(
+        'sys.argv',
+        [
+            __file__,
+            '-a', os.path.join(get_testing_resources_dir(), 'scores.tsv.gz'),
+            '-l', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-w', '0',
+            '-o', output_directory
+        ]
+    )
+    def test_raise_valueerror_workers(self):
+        """
+        Test to see if ValueError is raised when less than 1 worker is supplied.
+        """
+        with self.assertRaises(ValueError) as e:
+            CompareModelPerformance().run()
+        self.assertEqual(str(e.exception), 'Workers should be at least 1.')
+
     def test_attempt_mismatch_merge_fail(self):
         """
         Test to see if the "_merge_scores_and_labels" function raises the SampleSizeMismatchError as
@@ -0,0 +1,119 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+
+from molgenis.capice_resources.compare_model_performance.distribution_summaries import \
+    DistributionSummaries
+
+
+class TestDistributionSummaries(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = np.random.default_rng(1)
+        cls.dataset = pd.DataFrame(  # type: ignore
+            {
+                'binarized_label': generator.integers(0, 2, 500).astype(float),
+                'score': np.round(generator.beta(0.5, 2, 500), 4)
+            }
+        )
+        cls.dataset.loc[0, 'binarized_label'] = np.NaN  # type: ignore
+        cls.dataset.loc[1, 'score'] = np.NaN  # type: ignore
+        # Group 0 contains all samples, group 1 the first 100 and group 2 none
+        cls.positions = np.concatenate([np.arange(500), np.arange(100)])  # type: ignore
+        cls.groups = np.concatenate(  # type: ignore
+            [np.zeros(500, dtype=np.intp), np.ones(100, dtype=np.intp)]
+        )
+        cls.summaries = DistributionSummaries(  # type: ignore
+            cls.dataset,  # type: ignore
+            'score',
+            cls.positions,  # type: ignore
+            cls.groups,  # type: ignore
+            3
+        )
+
+    def _subset(self, group: int, label: int) -> np.ndarray:
+        subset = self.dataset.iloc[self.positions[self.groups == group]]
+        subset = subset[subset['binarized_label'] == label]
+        return subset['score'].dropna().to_numpy()
+
+    def test_boxplot_stats(self):
+        """
+        Tests if the box plot statistics of each subset are equal to those of matplotlib,
+        including all (sorted) outliers.
+        """
+        n_fliers = 0
+        for group in [0, 1]:
+            for label in [0, 1]:
+                expected = cbook.boxplot_stats(self._subset(group, label))[0]
+                observed = self.summaries.boxplot_stats(group, label)
+                for statistic in ['mean', 'med', 'q1', 'q3', 'whislo', 'whishi']:
+                    self.assertAlmostEqual(observed[statistic], expected[statistic])
+                np.testing.assert_array_equal(observed['fliers'], np.sort(expected['fliers']))
+                n_fliers += expected['fliers'].size
+        self.assertGreater(n_fliers, 0)
+
+    def test_violin_stats(self):
+        """
+        Tests if the kernel density estimate of each subset is close to a gaussian kernel with
+        a bandwidth of 0.1 times the standard deviation, on a grid up to 2 bandwidths beyond the
+        values of the subset.
+        """
+        for group in [0, 1]:
+            for label in [0, 1]:
+                values = self._subset(group, label)
+                observed = self.summaries.violin_stats(group, label)
+                bandwidth = values.std(ddof=1) * 0.1
+                coords = np.linspace(
+                    values.min() - 2 * bandwidth,
+                    values.max() + 2 * bandwidth,
+                    100
+                )
+                expected = np.exp(
+                    -0.5 * ((coords[:, np.newaxis] - values[np.newaxis, :]) / bandwidth) ** 2
+                ).sum(axis=1) / (values.size * bandwidth * np.sqrt(2 * np.pi))
+                np.testing.assert_allclose(observed['coords'], coords)
+                # Binned into 10000 bins, close at the resolution of the plot
+                np.testing.assert_allclose(
+                    observed['vals'],
+                    expected,
+                    rtol=0,
+                    atol=1e-3 * expected.max()
+                )
+                self.assertEqual(observed['min'], values.min())
+                self.assertEqual(observed['max'], values.max())
+                self.assertAlmostEqual(observed['median'], np.median(values))
+
+    def test_empty_subset(self):
+        """
+        Tests if a subset without samples has all NaN box plot statistics and no violin plot
+        statistics.
+        """
+        observed = self.summaries.boxplot_stats(2, 1)
+        for statistic in ['mean', 'med', 'q1', 'q3', 'whislo', 'whishi']:
+            self.assertTrue(np.isnan(observed[statistic]))
+        self.assertEqual(observed['fliers'].size, 0)
+        self.assertIsNone(self.summaries.violin_stats(2, 1))
+
+    def test_equal_values(self):
+        """
+        Tests if the violin plot grid of a subset of which all values are equal is its single
+        value.
+        """
+        dataset = pd.DataFrame({'binarized_label': [0, 0, 1], 'score': [0.5, 0.5, 0.2]})
+        summaries = DistributionSummaries(
+            dataset,
+            'score',
+            np.arange(3),
+            np.zeros(3, dtype=np.intp),
+            1
+        )
+        for label, value in [(0, 0.5), (1, 0.2)]:
+            observed = summaries.violin_stats(0, label)
+            np.testing.assert_array_equal(observed['coords'], [value])
+            self.assertEqual(summaries.boxplot_stats(0, label)['whishi'], value)
+
+
+if __name__ == '__main__':
+    unittest.main()
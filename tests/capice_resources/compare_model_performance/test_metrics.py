@@ -0,0 +1,156 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import roc_auc_score
+
+from molgenis.capice_resources.compare_model_performance.metrics import MetricsCalculator
+
+
+class TestMetricsCalculator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.model_1 = pd.DataFrame(  # type: ignore
+            {
+                'binarized_label': [1, 0, 1, 0, 1, 0],
+                'score': [0.9, 0.2, 0.4, 0.6, 0.8, 0.1],
+                'gnomAD_AF': [0, 0, 1e-6, 0.5, 0.5, 1],
+                'is_imputed': [True, False, False, False, False, False],
+                'Consequence': [
+                    'missense_variant',
+                    'missense_variant&splice_region_variant',
+                    'splice_region_variant',
+                    'missense_variant',
+                    'stop_gained',
+                    'stop_gained'
+                ],
+                'dataset_source': 'model_1'
+            }
+        )
+        cls.model_1['score_diff'] = abs(  # type: ignore
+            cls.model_1['score'] - cls.model_1['binarized_label']  # type: ignore
+        )
+
+    def test_calculate(self):
+        """
+        Tests if the metrics of the global dataset, of each consequence to process and of each
+        allele frequency bin of each model are equal to their subset.
+        """
+        model_2 = self.model_1.copy(deep=True)
+        model_2['dataset_source'] = 'model_2'
+        model_2['score'] = 1 - model_2['score']
+        model_2['score_diff'] = abs(model_2['score'] - model_2['binarized_label'])
+        consequences = ['missense_variant', 'splice_region_variant', 'synonymous_variant']
+        observed = MetricsCalculator(consequences).calculate([self.model_1, model_2])
+        self.assertListEqual(
+            observed.columns.tolist(),
+            [
+                'dataset_source', 'subset_type', 'subset', 'n_samples', 'n_pathogenic',
+                'n_benign', 'auc', 'score_diff_mean', 'score_diff_q1', 'score_diff_median',
+                'score_diff_q3'
+            ]
+        )
+        af_bins = ['0', '0-1e-06', '1e-06-1e-05', '1e-05-0.0001', '0.0001-0.001', '0.001-0.01',
+                   '0.01-1']
+        self.assertListEqual(
+            observed['subset'].tolist(),
+            (['Global'] + consequences + af_bins) * 2
+        )
+        self.assertListEqual(
+            observed['subset_type'].unique().tolist(),
+            ['Global', 'Consequence', 'allele_frequency_bin']
+        )
+        expected_subsets = {
+            'Global': [0, 1, 2, 3, 4, 5],
+            'missense_variant': [0, 1, 3],
+            'splice_region_variant': [1, 2],
+            '0': [0, 1],
+            '0-1e-06': [1],
+            '1e-06-1e-05': [2],
+            '0.01-1': [3, 4, 5]
+        }
+        for model in [self.model_1, model_2]:
+            model_metrics = observed[
+                observed['dataset_source'] == model['dataset_source'].iloc[0]
+            ].set_index('subset')
+            for subset, positions in expected_subsets.items():
+                expected = model.iloc[positions]
+                self.assertEqual(model_metrics.loc[subset, 'n_samples'], len(positions))
+                self.assertEqual(
+                    model_metrics.loc[subset, 'n_pathogenic'],
+                    expected['binarized_label'].sum()
+                )
+                self.assertEqual(
+                    model_metrics.loc[subset, 'score_diff_median'],
+                    expected['score_diff'].median()
+                )
+                if expected['binarized_label'].nunique() == 2:
+                    self.assertEqual(
+                        model_metrics.loc[subset, 'auc'],
+                        round(roc_auc_score(expected['binarized_label'], expected['score']), 4)
+                    )
+                else:
+                    self.assertTrue(np.isnan(model_metrics.loc[subset, 'auc']))
+            # Consequences and bins without samples
+            for subset in ['synonymous_variant', '1e-05-0.0001']:
+                self.assertEqual(model_metrics.loc[subset, 'n_samples'], 0)
+                self.assertTrue(np.isnan(model_metrics.loc[subset, 'auc']))
+                self.assertTrue(np.isnan(model_metrics.loc[subset, 'score_diff_mean']))
+
+    def test_calculate_no_consequences_single_model(self):
+        """
+        Tests if only the global dataset and allele frequency bins of model 1 are present when
+        no consequences are processed and model 1 is the only model.
+        """
+        observed = MetricsCalculator(False).calculate([self.model_1])
+        self.assertEqual(observed.shape[0], 8)
+        self.assertListEqual(observed['dataset_source'].unique().tolist(), ['model_1'])
+        self.assertNotIn('Consequence', observed['subset_type'].tolist())
+
+    def test_consequences_to_process(self):
+        """
+        Test to see if the consequences to process are the list of consequences, or empty when
+        no consequences are processed.
+        """
+        self.assertListEqual(
+            MetricsCalculator.consequences_to_process(['missense_variant']),
+            ['missense_variant']
+        )
+        self.assertListEqual(MetricsCalculator.consequences_to_process(False), [])
+
+    def test_subset_groups(self):
+        """
+        Test to see if all samples are assigned to the Global group (0) and to the group of
+        each consequence to process they contain, in the order of the consequences to process.
+        """
+        positions, groups = MetricsCalculator.subset_groups(
+            self.model_1,
+            ['splice_region_variant', 'missense_variant', 'synonymous_variant']
+        )
+        self.assertListEqual(
+            sorted(zip(positions.tolist(), groups.tolist())),
+            [(0, 0), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (3, 0), (3, 2), (4, 0),
+             (5, 0)]
+        )
+
+    def test_af_bin_groups(self):
+        """
+        Test to see if samples with an allele frequency of 0 are assigned to bin 0 (imputed or
+        not), and non-imputed samples to the left inclusive allele frequency bin (right
+        inclusive for the last bin).
+        """
+        dataset = pd.DataFrame(
+            {
+                'gnomAD_AF': [0, 0, 1e-6, 5e-4, 0.01, 1],
+                'is_imputed': [True, False, False, True, False, False]
+            }
+        )
+        positions, groups = MetricsCalculator.af_bin_groups(dataset)
+        self.assertListEqual(
+            sorted(zip(positions.tolist(), groups.tolist())),
+            [(0, 0), (1, 0), (1, 1), (2, 2), (4, 6), (5, 6)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
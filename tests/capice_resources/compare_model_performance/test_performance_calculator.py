@@ -3,6 +3,7 @@ import math
 
 import numpy as np
 import pandas as pd
+from sklearn.metrics import roc_curve, roc_auc_score
 
 from molgenis.capice_resources.compare_model_performance.performance_calculator import \
     PerformanceCalculator
@@ -121,6 +122,94 @@ class TestPerformanceCalculator(unittest.TestCase):
         observed = calculator.calculate_auc(testcase)
         self.assertTrue(math.isnan(observed))
 
+    def test_calculate_roc_equal_to_sklearn(self):
+        """
+        Tests if the ROC curve and AUC obtained from a single ROC curve are equal to
+        sklearn.metrics.roc_curve and sklearn.metrics.roc_auc_score.
+        """
+        random = np.random.RandomState(5)
+        dataset = pd.DataFrame(
+            {
+                'binarized_label': random.randint(0, 2, 200),
+                'score': random.random_sample(200).round(2)
+            }
+        )
+        fpr, tpr, auc = PerformanceCalculator().calculate_roc(dataset)
+        expected_fpr, expected_tpr, _ = roc_curve(dataset['binarized_label'], dataset['score'])
+        np.testing.assert_array_equal(fpr, expected_fpr)
+        np.testing.assert_array_equal(tpr, expected_tpr)
+        self.assertEqual(
+            auc,
+            round(roc_auc_score(dataset['binarized_label'], dataset['score']), 4)
+        )
+
+    def test_calculate_auc_cached(self):
+        """
+        Tests if the ROC curve and AUC are only calculated once for each key, and are shared
+        between calculate_roc and calculate_auc.
+        """
+        calculator = PerformanceCalculator()
+        perfect = pd.DataFrame({'binarized_label': [1, 0], 'score': [0.9, 0.1]})
+        roc = calculator.calculate_roc(self.dataset, ('model_1', 'Global'))
+        self.assertEqual(calculator.calculate_auc(perfect, ('model_1', 'Global')), roc[2])
+        self.assertEqual(calculator.calculate_auc(perfect, ('model_2', 'Global')), 1.0)
+        self.assertEqual(calculator.calculate_auc(perfect), 1.0)
+
+    def test_calculate_auc_one_class(self):
+        """
+        Tests if, like sklearn.metrics.roc_auc_score, a ValueError is raised when only one class
+        is present, also when ignore_zero_sample_error is set to True.
+        """
+        testcase = pd.DataFrame({'binarized_label': [1, 1], 'score': [0.1, 0.2]})
+        for calculator in [PerformanceCalculator(), PerformanceCalculator(True)]:
+            with self.assertRaises(ValueError) as e:
+                calculator.calculate_auc(testcase)
+            self.assertEqual(
+                str(e.exception),
+                'Only one class present in y_true. ROC AUC score is not defined in that case.'
+            )
+
+    def test_calculate_grouped_auc(self):
+        """
+        Tests if the grouped (Mann-Whitney) AUC of each of many overlapping groups is equal to
+        sklearn.metrics.roc_auc_score of the group, and NaN for groups without both classes or
+        with a missing label.
+        """
+        random = np.random.RandomState(5)
+        dataset = pd.DataFrame(
+            {
+                'binarized_label': random.randint(0, 2, 500).astype(float),
+                'score': random.random_sample(500).round(2)
+            }
+        )
+        dataset.loc[0, 'binarized_label'] = np.nan
+        positions = np.concatenate([np.arange(500), random.randint(1, 500, 500), [1, 2]])
+        groups = np.concatenate([random.randint(0, 20, 1000), [20, 20]])
+        dataset.loc[[1, 2], 'binarized_label'] = 1
+        observed = PerformanceCalculator.calculate_grouped_auc(dataset, positions, groups, 22)
+        self.assertListEqual(
+            observed.columns.tolist(),
+            ['n_samples', 'n_pathogenic', 'n_benign', 'auc']
+        )
+        group_with_missing_label = groups[np.flatnonzero(positions == 0)[0]]
+        for group in range(20):
+            subset = dataset.iloc[positions[groups == group]]
+            self.assertEqual(observed.loc[group, 'n_samples'], subset.shape[0])
+            if group == group_with_missing_label:
+                self.assertTrue(math.isnan(observed.loc[group, 'auc']))
+                continue
+            self.assertEqual(
+                observed.loc[group, 'n_pathogenic'],
+                (subset['binarized_label'] == 1).sum()
+            )
+            self.assertEqual(
+                observed.loc[group, 'auc'],
+                round(roc_auc_score(subset['binarized_label'], subset['score']), 4)
+            )
+        # Only pathogenic samples and no samples at all
+        self.assertTrue(observed.loc[[20, 21], 'auc'].isnull().all())
+        self.assertListEqual(observed.loc[[20, 21], 'n_samples'].tolist(), [2, 0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
+import os
 import unittest
+import tempfile
 
-import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 
@@ -28,11 +29,8 @@ class TestPlotter(unittest.TestCase):
                 ]
         plotter = Plotter(
             consequences,
-            'path_model_1_scores',
-            'path_model_1_labels',
-            True,
-            'path_model_2_scores',
-            'path_model_2_labels'
+            ['path_model_1_scores', 'path_model_2_scores'],
+            ['path_model_1_labels', 'path_model_2_labels']
         )
         self.assertEqual(2, plotter.n_rows)
         self.assertEqual(3, plotter.n_cols)
@@ -59,11 +57,8 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             False,
-            'path_model_1_scores',
-            'path_model_1_labels',
-            True,
-            'path_model_2_scores',
-            'path_model_2_labels'
+            ['path_model_1_scores', 'path_model_2_scores'],
+            ['path_model_1_labels', 'path_model_2_labels']
         )
         self.assertEqual(1, plotter.n_rows)
         self.assertEqual(1, plotter.n_cols)
@@ -114,13 +109,85 @@ class TestPlotter(unittest.TestCase):
         )
         plotter = Plotter(
             ['Foo', 'Bar'],
-            'path1',
-            'path2',
-            True,
-            'path3',
-            'path4'
+            ['path1', 'path3'],
+            ['path2', 'path4']
         )
-        plotter.plot(test_case_model1, test_case_model2)
+        plotter.plot([test_case_model1, test_case_model2])
+
+    def test_plot_multiple_models(self):
+        """
+        Test to see if more than 2 models are each plotted in a color of their own, and are
+        named in the figure supertitles.
+        """
+        model = pd.DataFrame(
+            {
+                "binarized_label": [1, 0, 1, 0],
+                "score": [0.9, 0.1, 0.6, 0.3],
+                "gnomAD_AF": [0.01, 0.02, 0.03, 0.0],
+                "Consequence": ['Foo', 'Foo', 'Bar', 'Bar'],
+                "is_imputed": [False, False, False, True]
+            }
+        )
+        model['score_diff'] = abs(model['score'] - model['binarized_label'])
+        models = []
+        for i in range(3):
+            models.append(model.assign(dataset_source=f'model_{i + 1}'))
+        plotter = Plotter(['Foo', 'Bar'], ['s1', 's2', 's3'], ['l1', 'l1', 'l1'])
+        figures = plotter.plot(models)
+        self.assertEqual(
+            figures['roc']._suptitle.get_text(),
+            'Model 1 vs Model 2 vs Model 3 Receiver Operator Curves\n'
+            'Model 1 scores: s1\nModel 1 labels: l1\n'
+            'Model 2 scores: s2\nModel 2 labels: l1\n'
+            'Model 3 scores: s3\nModel 3 labels: l1\n'
+        )
+        lines = figures['roc'].axes[0].get_lines()
+        self.assertListEqual(
+            [line.get_color() for line in lines[:3]],
+            ['red', 'blue', 'green']
+        )
+        self.assertListEqual(
+            [line.get_label() for line in lines[:3]],
+            ['Model 1 (AUC=1.0)', 'Model 2 (AUC=1.0)', 'Model 3 (AUC=1.0)']
+        )
+        # Global, Foo and Bar, each with a bar per model
+        self.assertListEqual(
+            [len(ax.patches) for ax in figures['auc'].axes],
+            [3, 3, 3]
+        )
+
+    def test_save_figures_workers(self):
+        """
+        Test to see if figures drawn and saved by multiple worker processes are equal to figures
+        drawn and saved in the main process.
+        """
+        model = pd.DataFrame(
+            {
+                "binarized_label": [1, 0, 1, 0],
+                "score": [0.9, 0.1, 0.6, 0.3],
+                "gnomAD_AF": [0.01, 0.02, 0.03, 0.0],
+                "Consequence": ['Foo', 'Foo', 'Bar', 'Bar'],
+                "is_imputed": [False, False, False, True],
+                "dataset_source": 'model_1'
+            }
+        )
+        model['score_diff'] = abs(model['score'] - model['binarized_label'])
+        serial_plotter = Plotter(['Foo', 'Bar'], ['s1'], ['l1'])
+        serial_plotter.summarize([model])
+        parallel_plotter = Plotter(['Foo', 'Bar'], ['s1'], ['l1'])
+        parallel_plotter.summarize([model])
+        with tempfile.TemporaryDirectory() as serial, tempfile.TemporaryDirectory() as parallel:
+            serial_plotter.save_figures(serial)
+            parallel_plotter.save_figures(parallel, workers=2)
+            self.assertListEqual(
+                sorted(os.listdir(parallel)),
+                sorted(name + '.png' for name in Plotter.FIGURE_NAMES)
+            )
+            self.assertListEqual(sorted(os.listdir(parallel)), sorted(os.listdir(serial)))
+            for filename in os.listdir(serial):
+                with open(os.path.join(serial, filename), 'rb') as expected, \
+                        open(os.path.join(parallel, filename), 'rb') as observed:
+                    self.assertEqual(observed.read(), expected.read())
 
     def test_plotter_init_supertitle_model_2_not_present(self):
         """
@@ -128,11 +195,8 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            False,
-            None,
-            None
+            ['path1'],
+            ['path2']
         )
         self.assertEqual(
             'Model 1 Receiver Operator Curves\n'
@@ -147,19 +211,10 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            True,
-            'path3',
-            'path4'
-        )
-        observed = plotter._create_af_bins_plotlabels(
-            'testing_purpose',
-            0,
-            1.0,
-            0,
-            1.0
+            ['path1', 'path3'],
+            ['path2', 'path4']
         )
+        observed = plotter._create_af_bins_plotlabels('testing_purpose', [0, 0], [1.0, 1.0])
         self.assertEqual(
             'testing_purpose\nModel 1: 1.0\nModel 2: 1.0\nn: 0',
             observed
@@ -172,19 +227,10 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            True,
-            'path3',
-            'path4'
-        )
-        observed = plotter._create_af_bins_plotlabels(
-            'testing_purpose',
-            5,
-            1.0,
-            4,
-            1.0
+            ['path1', 'path3'],
+            ['path2', 'path4']
         )
+        observed = plotter._create_af_bins_plotlabels('testing_purpose', [5, 4], [1.0, 1.0])
         self.assertEqual(
             'testing_purpose\nModel 1: 1.0 (n: 5)\nModel 2: 1.0 (n: 4)',
             observed
@@ -197,19 +243,10 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            False,
-            None,
-            None
-        )
-        observed = plotter._create_af_bins_plotlabels(
-            'testing_purpose',
-            5,
-            1.0,
-            0,
-            np.nan
+            ['path1'],
+            ['path2']
         )
+        observed = plotter._create_af_bins_plotlabels('testing_purpose', [5], [1.0])
         self.assertEqual(
             'testing_purpose\nModel 1: 1.0\nn: 5',
             observed
@@ -221,37 +258,19 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            True,
-            'path3',
-            'path4'
-        )
-        fake_data = pd.DataFrame(
-            columns=['binarized_label']
+            ['path1', 'path3'],
+            ['path2', 'path4']
         )
         expected = [
             'Model 1:\nT: 0\nB: 0\nP: 0',
             'Model 2:\nT: 0\nB: 0\nP: 0'
         ]
-        observed_noniterable = plotter._create_boxplot_label(
-            fake_data,
-            0,
-            fake_data,
-            0,
-            False
-        )
+        observed_noniterable = plotter._create_boxplot_label([0, 0], [(0, 0), (0, 0)], False)
         self.assertEqual(
             '\n\n'.join(expected),
             observed_noniterable
         )
-        observed_iterable = plotter._create_boxplot_label(
-            fake_data,
-            0,
-            fake_data,
-            0,
-            True
-        )
+        observed_iterable = plotter._create_boxplot_label([0, 0], [(0, 0), (0, 0)], True)
         self.assertEqual(
             expected,
             observed_iterable
@@ -263,34 +282,16 @@ class TestPlotter(unittest.TestCase):
         """
         plotter = Plotter(
             ['foo', 'bar'],
-            'path1',
-            'path2',
-            False,
-            None,
-            None
-        )
-        fake_data = pd.DataFrame(
-            columns=['binarized_label']
+            ['path1'],
+            ['path2']
         )
         expected = 'Model 1:\nT: 0\nB: 0\nP: 0'
-        observed_noniterable = plotter._create_boxplot_label(
-            fake_data,
-            0,
-            fake_data,
-            0,
-            False
-        )
+        observed_noniterable = plotter._create_boxplot_label([0], [(0, 0)], False)
         self.assertEqual(
             expected,
             observed_noniterable
         )
-        observed_iterable = plotter._create_boxplot_label(
-            fake_data,
-            0,
-            fake_data,
-            0,
-            True
-        )
+        observed_iterable = plotter._create_boxplot_label([0], [(0, 0)], True)
         self.assertEqual(
             [expected],
             observed_iterable
@@ -1,11 +1,15 @@
+import os
 import unittest
+import threading
+from functools import partial
 from unittest.mock import patch
 from argparse import ArgumentParser
 
+import numpy as np
 import pandas as pd
 
 from tests.capice_resources.testing_utilities import temp_output_file_path_and_name, \
-    check_and_remove_directory
+    check_and_remove_directory, get_testing_resources_dir
 from molgenis.capice_resources.core import Module, CommandLineInterface, ColumnEnums, VCFEnums, \
     TSVFileEnums
 
@@ -96,6 +100,105 @@ class TestModule(unittest.TestCase):
         check_and_remove_directory(temp_output_file_path_and_name())
         pd.testing.assert_frame_equal(observed, expected)
 
+    def test_prefetch_inputs(self):
+        """
+        Test to see if all inputs are loaded concurrently, in the order of the loaders, and if
+        inputs without loader result in None.
+        """
+        barrier = threading.Barrier(2, timeout=10)
+
+        def load(value):
+            # Both loaders have to be running at the same time to pass the barrier
+            barrier.wait()
+            return value
+
+        observed = Module._prefetch_inputs(
+            {
+                'foo': partial(load, 'foo'),
+                'optional': None,
+                'bar': partial(load, 'bar')
+            }
+        )
+        self.assertDictEqual(observed, {'foo': 'foo', 'optional': None, 'bar': 'bar'})
+        self.assertListEqual(list(observed.keys()), ['foo', 'optional', 'bar'])
+
+    def test_read_pandas_tsv_dtypes(self):
+        """
+        Test to see if the dtypes inferred over chunks are equal to the dtypes inferred reading
+        the TSV in full, including integer columns that only contain NaN in later chunks. Mixed
+        columns are read as string, so that these are exported the same.
+        """
+        frame = pd.DataFrame(
+            {
+                'integer': [1, 2, 3, 4],
+                'integer_nan': [1, 2, 3, None],
+                'float': [1, 2, 3, 4.5],
+                'string': [1, 2, 3, 'foo'],
+                'boolean': [True, False, True, True],
+                'boolean_nan': [True, False, True, None],
+                'nan': [None] * 4
+            }
+        )
+        frame.to_csv(temp_output_file_path_and_name(), sep='\t', index=False)
+        module = ModuleMetaclassTest()
+        expected = module._read_pandas_tsv(temp_output_file_path_and_name(), [])
+        dtypes = module._read_pandas_tsv_dtypes(temp_output_file_path_and_name(), chunksize=3)
+        observed = pd.concat(
+            module._read_pandas_tsv_chunks(temp_output_file_path_and_name(), [], 3, dtypes),
+            ignore_index=True
+        )
+        check_and_remove_directory(temp_output_file_path_and_name())
+        self.assertIs(dtypes['boolean_nan'], str)
+        pd.testing.assert_frame_equal(
+            observed.drop(columns='boolean_nan'),
+            expected.drop(columns='boolean_nan')
+        )
+        self.assertEqual(
+            observed.to_csv(sep='\t', index=False),
+            expected.to_csv(sep='\t', index=False)
+        )
+
+    def test_read_pandas_tsv_dtypes_multiple_files(self):
+        """
+        Test to see if the dtypes are inferred over all TSVs, so that a column that is integer
+        in one TSV and float (because of NaN) in the other is read as float from both.
+        """
+        other_path = os.path.join(get_testing_resources_dir(), 'temp_other_output.tsv.gz')
+        pd.DataFrame({'feature': [1, 2, 3], 'string': ['a', 'b', 'c']}).to_csv(
+            temp_output_file_path_and_name(), sep='\t', index=False
+        )
+        pd.DataFrame({'feature': [1.5, None], 'string': ['d', 1]}).to_csv(
+            other_path, sep='\t', index=False
+        )
+        module = ModuleMetaclassTest()
+        dtypes = module._read_pandas_tsv_dtypes(
+            temp_output_file_path_and_name(),
+            other_path,
+            chunksize=2
+        )
+        observed = pd.concat(
+            module._read_pandas_tsv_chunks(temp_output_file_path_and_name(), [], 2, dtypes),
+            ignore_index=True
+        )
+        check_and_remove_directory(temp_output_file_path_and_name())
+        check_and_remove_directory(other_path)
+        self.assertEqual(dtypes['feature'], np.float64)
+        self.assertIs(dtypes['string'], str)
+        self.assertEqual(observed['feature'].dtype, np.float64)
+
+    def test_prefetch_inputs_error(self):
+        """
+        Test to see if an error of loading or validating an input is raised.
+        """
+        def fail():
+            raise KeyError('Missing required column')
+
+        self.assertRaises(
+            KeyError,
+            Module._prefetch_inputs,
+            {'foo': partial(str, 'foo'), 'bar': fail}
+        )
+
 
 class TestEnums(unittest.TestCase):
     def test_column_enum_value(self):
@@ -0,0 +1,153 @@
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.core.deduplicator import Deduplicator, StreamingDeduplicator, \
+    SharedDeduplicator
+
+
+class TestDeduplicator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dataset = pd.DataFrame(
+            {
+                'variant': ['var1', 'var2', 'var1', 'var3', 'var1', 'var4'],
+                'feature_1': [1.0, 2.0, 1.0, np.nan, 1.0, np.nan],
+                'feature_2': ['a', 'b', 'a', None, 'c', None],
+                'feature_3': [0.0, 1.0, -0.0, 2.0, 0.0, 2.0]
+            }
+        )
+
+    def test_full_row(self):
+        """
+        Test to see if the full-row mode marks the same rows as pandas duplicated, including
+        equal NaN and signed zero values.
+        """
+        observed = Deduplicator().duplicated(self.dataset)
+        np.testing.assert_array_equal(observed, self.dataset.duplicated().to_numpy())
+        np.testing.assert_array_equal(
+            observed,
+            np.array([False, False, True, False, False, False])
+        )
+
+    def test_feature_subset(self):
+        """
+        Test to see if the feature-subset mode only considers the supplied columns.
+        """
+        columns = ['feature_1', 'feature_2', 'feature_3']
+        observed = Deduplicator(columns).duplicated(self.dataset)
+        np.testing.assert_array_equal(
+            observed,
+            self.dataset.duplicated(subset=columns).to_numpy()
+        )
+        np.testing.assert_array_equal(
+            observed,
+            np.array([False, False, True, False, False, True])
+        )
+
+    def test_hash_collision(self):
+        """
+        Test to see if rows that share their hash, but are not equal, are not marked.
+        """
+        with patch.object(
+                Deduplicator,
+                'hash_rows',
+                return_value=np.zeros(self.dataset.shape[0], dtype=np.uint64)
+        ):
+            observed = Deduplicator(['feature_2']).duplicated(self.dataset)
+        np.testing.assert_array_equal(
+            observed,
+            self.dataset.duplicated(subset=['feature_2']).to_numpy()
+        )
+
+    def test_empty(self):
+        """
+        Test to see if an empty dataframe results in an empty mask.
+        """
+        observed = Deduplicator().duplicated(self.dataset.iloc[0:0])
+        self.assertEqual(observed.shape[0], 0)
+
+    def test_streaming(self):
+        """
+        Test to see if the streaming deduplicator marks duplicates within and across chunks
+        equal to the non-streaming deduplicator on the full dataframe.
+        """
+        columns = ['feature_1', 'feature_2', 'feature_3']
+        deduplicator = StreamingDeduplicator(columns)
+        observed = np.concatenate(
+            [
+                deduplicator.duplicated(self.dataset.iloc[0:2]),
+                deduplicator.duplicated(self.dataset.iloc[2:3]),
+                deduplicator.duplicated(self.dataset.iloc[3:6])
+            ]
+        )
+        np.testing.assert_array_equal(
+            observed,
+            Deduplicator(columns).duplicated(self.dataset)
+        )
+        self.assertEqual(deduplicator.seen.shape[0], 4)
+
+    def test_shared(self):
+        """
+        Test to see if the shared deduplicator marks duplicates within and across datasets
+        equal to the non-shared deduplicator on the combined datasets, including rows that only
+        share their hash with a row of a previous dataset.
+        """
+        columns = ['feature_1', 'feature_2', 'feature_3']
+        deduplicator = SharedDeduplicator(columns)
+        observed = np.concatenate(
+            [
+                deduplicator.duplicated(self.dataset.iloc[0:3]),
+                deduplicator.duplicated(self.dataset.iloc[3:6])
+            ]
+        )
+        np.testing.assert_array_equal(
+            observed,
+            Deduplicator(columns).duplicated(self.dataset)
+        )
+        with patch.object(
+                Deduplicator,
+                'hash_rows',
+                side_effect=lambda frame: np.zeros(frame.shape[0], dtype=np.uint64)
+        ):
+            deduplicator = SharedDeduplicator(['feature_2'])
+            observed = np.concatenate(
+                [
+                    deduplicator.duplicated(self.dataset.iloc[0:2]),
+                    deduplicator.duplicated(self.dataset.iloc[2:6])
+                ]
+            )
+        np.testing.assert_array_equal(
+            observed,
+            self.dataset.duplicated(subset=['feature_2']).to_numpy()
+        )
+
+    def test_shared_different_dtypes(self):
+        """
+        Test to see if rows of a previous dataset are found when a column has a different
+        (numeric) dtype in each dataset, such as an integer column in train-test that is a
+        float column in validation because of missing values.
+        """
+        deduplicator = SharedDeduplicator(['a'])
+        deduplicator.duplicated(pd.DataFrame({'a': [1, 2, 3]}))
+        observed = deduplicator.duplicated(pd.DataFrame({'a': [1.0, np.nan, 5.0]}))
+        np.testing.assert_array_equal(observed, np.array([True, False, False]))
+        deduplicator = SharedDeduplicator(['a'])
+        deduplicator.duplicated(pd.DataFrame({'a': np.array([1, 2, 3], dtype=np.int8)}))
+        observed = deduplicator.duplicated(pd.DataFrame({'a': np.array([3, 300], dtype=np.int64)}))
+        np.testing.assert_array_equal(observed, np.array([True, False]))
+
+    def test_streaming_different_dtypes(self):
+        """
+        Test to see if rows of a previous chunk are found when a column has a different
+        (numeric) dtype in each chunk.
+        """
+        deduplicator = StreamingDeduplicator(['a'])
+        deduplicator.duplicated(pd.DataFrame({'a': [1, 2, 3]}))
+        observed = deduplicator.duplicated(pd.DataFrame({'a': [1.0, np.nan, 5.0]}))
+        np.testing.assert_array_equal(observed, np.array([True, False, False]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from io import StringIO
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.core.downcaster import Downcaster
+
+
+class TestDowncaster(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dataset = pd.DataFrame(
+            {
+                'small_int': np.array([0, 1, -5], dtype=np.int64),
+                'medium_int': np.array([0, 1000, -5], dtype=np.int64),
+                'large_int': np.array([0, 2 ** 40, -5], dtype=np.int64),
+                'float': [0.5, np.nan, 1e-6],
+                'huge_float': [1e300, 0.0, np.nan],
+                'string': ['foo', 'bar', 'baz'],
+                'boolean': [True, False, True]
+            }
+        )
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_downcast(self, stdout):
+        """
+        Test to see if all numeric columns are downcasted to the smallest dtype that can hold
+        their values, and if columns that can not be downcasted are left unaltered.
+        """
+        expected = self.dataset.copy(deep=True)
+        saved = Downcaster().downcast(self.dataset)
+        self.assertEqual(self.dataset['small_int'].dtype, np.int8)
+        self.assertEqual(self.dataset['medium_int'].dtype, np.int16)
+        self.assertEqual(self.dataset['large_int'].dtype, np.int64)
+        self.assertEqual(self.dataset['float'].dtype, np.float32)
+        self.assertEqual(self.dataset['huge_float'].dtype, np.float64)
+        self.assertEqual(self.dataset['string'].dtype, object)
+        self.assertEqual(self.dataset['boolean'].dtype, bool)
+        self.assertEqual(saved, 3 * (7 + 6 + 4))
+        self.assertIn('Downcasted 3 columns', stdout.getvalue())
+        pd.testing.assert_frame_equal(self.dataset, expected, check_dtype=False)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_downcast_columns(self, stdout):
+        """
+        Test to see if only the supplied columns are downcasted, skipping absent columns.
+        """
+        Downcaster(['small_int', 'string', 'not_present']).downcast(self.dataset)
+        self.assertEqual(self.dataset['small_int'].dtype, np.int8)
+        self.assertEqual(self.dataset['medium_int'].dtype, np.int64)
+        self.assertEqual(self.dataset['float'].dtype, np.float64)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_downcast_multiple_datasets(self, stdout):
+        """
+        Test to see if a column is downcasted to the same dtype in all datasets, fitting the
+        values of all datasets, and if integer and float columns are not mixed.
+        """
+        other = pd.DataFrame(
+            {
+                'small_int': np.array([1000], dtype=np.int64),
+                'medium_int': [1.5],
+                'huge_float': [0.5]
+            }
+        )
+        Downcaster().downcast(self.dataset, other)
+        for dataset in [self.dataset, other]:
+            self.assertEqual(dataset['small_int'].dtype, np.int16)
+            self.assertEqual(dataset['huge_float'].dtype, np.float64)
+        self.assertEqual(self.dataset['medium_int'].dtype, np.int64)
+        self.assertEqual(other['medium_int'].dtype, np.float64)
+        self.assertEqual(self.dataset['float'].dtype, np.float32)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_downcast_lossless(self, stdout):
+        """
+        Test to see if only integer columns are downcasted when downcasting losslessly.
+        """
+        Downcaster(lossless=True).downcast(self.dataset)
+        self.assertEqual(self.dataset['small_int'].dtype, np.int8)
+        self.assertEqual(self.dataset['float'].dtype, np.float64)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -104,6 +104,54 @@ class TestInputValidator(unittest.TestCase):
         )
         self.assertDictEqual(observed, expected)
 
+    def test_icli_files_pass(self):
+        """
+        Test to see if the multiple files validator returns a list of paths.
+        """
+        correct_paths = [
+            os.path.join(get_testing_resources_dir(), 'existing_tsv_file.tsv.gz'),
+            os.path.join(get_testing_resources_dir(), 'features.json')
+        ]
+        observed = self.validator.validate_input_command_line_interface_files(
+            {'input': correct_paths},
+            extension=('.tsv.gz', '.json')
+        )
+        expected = {'input': [Path(path) for path in correct_paths]}
+        self.assertDictEqual(observed, expected)
+
+    def test_icli_files_extension_fail(self):
+        """
+        Test to see if IOError is raised when one of the multiple files has an incorrect extension.
+        """
+        paths = [
+            os.path.join(get_testing_resources_dir(), 'existing_tsv_file.tsv.gz'),
+            os.path.join(get_testing_resources_dir(), 'features.json')
+        ]
+        self.assertRaises(
+            IOError,
+            self.validator.validate_input_command_line_interface_files,
+            {'input': paths},
+            '.tsv.gz'
+        )
+
+    def test_icli_files_none(self):
+        """
+        Test to see if None passes when can_be_optional is set to True, and fails when not.
+        """
+        expected = {'input': None}
+        observed = self.validator.validate_input_command_line_interface_files(
+            expected,
+            extension='.npy',
+            can_be_optional=True
+        )
+        self.assertDictEqual(observed, expected)
+        self.assertRaises(
+            IOError,
+            self.validator.validate_input_command_line_interface_files,
+            expected,
+            '.npy'
+        )
+
     def test_ocli_path_pass(self):
         directory = 'a_new_directory'
         path = os.path.join(get_testing_resources_dir(), directory)
@@ -0,0 +1,160 @@
+import os
+import gzip
+import unittest
+
+import numpy as np
+
+from tests.capice_resources.testing_utilities import get_testing_resources_dir, \
+    check_and_remove_directory
+from molgenis.capice_resources.core.variant_index import VariantIndex
+
+
+class TestVariantIndex(unittest.TestCase):
+    index_path = os.path.join(get_testing_resources_dir(), 'temporary_index.npy')
+    vcf_path = os.path.join(get_testing_resources_dir(), 'temporary_train_test.vcf.gz')
+
+    def tearDown(self) -> None:
+        check_and_remove_directory(self.index_path)
+        check_and_remove_directory(self.vcf_path)
+
+    def write_train_test_vcf(self, header: str) -> None:
+        with gzip.open(self.vcf_path, 'wt') as fh:
+            fh.write(
+                '##fileformat=VCFv4.2\n'
+                '##CAPICE-Resources_version=5.1.0\n'
+                f'{header}\n'
+                'chr1\t100\tid_1\tA\tT\t.\tPASS\t.\n'
+                'chrM\t400\tid_2\tT\tA\t.\tPASS\t.\n'
+                'chr1\t100\tid_1\tA\tT\t.\tPASS\t.\n'
+            )
+
+    def setUp(self) -> None:
+        self.index = VariantIndex.from_variants(
+            ['1', '2', 'X', 'MT'],
+            [100, 200, 300, 400],
+            ['A', 'C', 'G', 'T'],
+            ['T', 'G', 'C', 'A']
+        )
+
+    def test_contains(self):
+        """
+        Test to see if only the exact variants present in the index are found.
+        """
+        observed = self.index.contains(
+            ['1', '1', '2', 'X', '5'],
+            [100, 101, 200, 300, 100],
+            ['A', 'A', 'C', 'G', 'A'],
+            ['T', 'T', 'A', 'C', 'T']
+        )
+        np.testing.assert_array_equal(observed, np.array([True, False, False, True, False]))
+
+    def test_contains_grch38_notation(self):
+        """
+        Test to see if GRCh38 chromosome notation results in the same keys as GRCh37 notation.
+        """
+        observed = self.index.contains(['chr1', 'chrM'], [100, 400], ['A', 'T'], ['T', 'A'])
+        np.testing.assert_array_equal(observed, np.array([True, True]))
+
+    def test_keys_are_exact(self):
+        """
+        Test to see if variants that only differ in a single base, allele length, position or
+        contig are packed into different keys, and keys sort by contig and position.
+        """
+        keys, variants = VariantIndex.encode(
+            ['1', '1', '1', '1', '1', '2', 'chrY'],
+            [100, 100, 100, 100, 101, 100, 2 ** 29 - 1],
+            ['A', 'A', 'AA', 'A', 'A', 'A', 'ACGTACGTAC'],
+            ['C', 'G', 'C', 'CA', 'C', 'C', 'T']
+        )
+        self.assertEqual(np.unique(keys).size, keys.size)
+        self.assertTrue((keys > 0).all())
+        self.assertEqual(variants.size, 0)
+        self.assertLess(keys[0], keys[4])
+        self.assertLess(keys[4], keys[5])
+
+    def test_unpacked_variants(self):
+        """
+        Test to see if variants that do not fit a key (other contigs, long or non-ACGT alleles)
+        are found exactly, also after storing and loading the index.
+        """
+        variants = (
+            ['GL000192.1', '1', '1', '1'],
+            [100, 100, 100, 100],
+            ['A', 'ACGTACGTACGT', 'A', 'N'],
+            ['T', 'A', '<DEL>', 'A']
+        )
+        index = VariantIndex.from_variants(*variants)
+        self.assertEqual(index.releases[0].keys.size, 0)
+        index.save(self.index_path)
+        loaded = VariantIndex.load(self.index_path)
+        self.assertSetEqual(
+            set(loaded.releases[0].variants),
+            {'GL000192.1:100:A:T', '1:100:ACGTACGTACGT:A', '1:100:A:<DEL>', '1:100:N:A'}
+        )
+        observed = loaded.contains(
+            ['GL000192.1', '1', '1', '1', '1'],
+            [100, 100, 100, 100, 100],
+            ['A', 'ACGTACGTACGT', 'A', 'N', 'ACGTACGTACGA'],
+            ['T', 'A', '<DEL>', 'C', 'A']
+        )
+        np.testing.assert_array_equal(observed, np.array([True, True, True, False, False]))
+
+    def test_save_and_load(self):
+        """
+        Test to see if a stored index is memory-mapped back in and can be combined with other
+        releases.
+        """
+        self.index.save(self.index_path)
+        other_release = VariantIndex.from_variants(['3'], [500], ['A'], ['G'])
+        loaded = VariantIndex.load(self.index_path)
+        self.assertIsInstance(loaded.releases[0].keys, np.memmap)
+        combined = VariantIndex(*loaded.releases, *other_release.releases)
+        observed = combined.contains(['1', '3', '4'], [100, 500, 600], ['A'] * 3, ['T', 'G', 'C'])
+        np.testing.assert_array_equal(observed, np.array([True, True, False]))
+
+    def test_load_train_test_vcf(self):
+        """
+        Test to see if a train-test VCF of a release is indexed while loading, and can be
+        combined with stored indexes of other releases.
+        """
+        self.write_train_test_vcf('#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO')
+        VariantIndex.from_variants(['3'], [500], ['A'], ['G']).save(self.index_path)
+        loaded = VariantIndex.load(self.vcf_path, self.index_path)
+        np.testing.assert_array_equal(
+            loaded.releases[0].keys,
+            VariantIndex.from_variants(
+                ['1', 'MT'], [100, 400], ['A', 'T'], ['T', 'A']
+            ).releases[0].keys
+        )
+        observed = loaded.contains(
+            ['1', 'MT', '3', '2'],
+            [100, 400, 500, 200],
+            ['A', 'T', 'A', 'C'],
+            ['T', 'A', 'G', 'G']
+        )
+        np.testing.assert_array_equal(observed, np.array([True, True, True, False]))
+
+    def test_load_train_test_vcf_missing_columns_fail(self):
+        """
+        Test to see if IOError is raised when a VCF without the REF and ALT columns is loaded.
+        """
+        self.write_train_test_vcf('#CHROM\tPOS\tID\tREFERENCE\tALTERNATIVE\tQUAL\tFILTER\tINFO')
+        self.assertRaises(IOError, VariantIndex.load, self.vcf_path)
+
+    def test_save_multiple_releases_fail(self):
+        """
+        Test to see if ValueError is raised when an index of multiple releases is stored.
+        """
+        combined = VariantIndex(*self.index.releases, *self.index.releases)
+        self.assertRaises(ValueError, combined.save, self.index_path)
+
+    def test_load_invalid_fail(self):
+        """
+        Test to see if IOError is raised when a .npy file that is not a variant index is loaded.
+        """
+        np.save(self.index_path, np.array([1.0, 2.0]))
+        self.assertRaises(IOError, VariantIndex.load, self.index_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,16 @@
 import os
+import gzip
 import unittest
+from io import StringIO
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
+from molgenis.capice_resources.core.variant_index import VariantIndex
 from molgenis.capice_resources.process_vep.__main__ import ProcessVEP
+from molgenis.capice_resources.process_vep.progress_printer import ProgressPrinter
+from molgenis.capice_resources.utilities import normalize_keys
 from tests.capice_resources.testing_utilities import get_testing_resources_dir, \
     check_and_remove_directory
 
@@ -89,6 +95,32 @@ class TestProcessVEP(unittest.TestCase):
         self.assertGreaterEqual(observed.shape[0], 3000)
         self.assertNotIn('dataset_source', observed.columns)
 
+    def test_component_process_vep_chunksize(self):
+        """
+        Full component test of process-vep in streaming mode. Tests if the exported train-test
+        and validation processed in chunks are byte-for-byte equal to the train-test and
+        validation processed in full.
+        """
+        arguments = [
+            __file__,
+            '-t', os.path.join(get_testing_resources_dir(), 'process_vep', 'train_test_vep.tsv.gz'),
+            '-v', os.path.join(get_testing_resources_dir(), 'process_vep', 'validation_vep.tsv.gz'),
+            '-f', os.path.join(get_testing_resources_dir(), 'process_vep', 'train_features.json'),
+            '-o', os.path.join(get_testing_resources_dir(), 'process_vep', 'output'),
+            '-g', os.path.join(get_testing_resources_dir(), 'process_vep', 'CGD.txt.gz')
+        ]
+        output_path = os.path.join(get_testing_resources_dir(), 'process_vep', 'output')
+        observed = {}
+        expected = {}
+        for results, chunksize in [(observed, ['-c', '137']), (expected, [])]:
+            with patch('sys.argv', arguments + chunksize):
+                self.processor.run()
+            for dataset in ['train_test', 'validation']:
+                with gzip.open(os.path.join(output_path, f'{dataset}.tsv.gz'), 'rt') as fh:
+                    results[dataset] = fh.read()
+        for dataset in ['train_test', 'validation']:
+            self.assertEqual(observed[dataset], expected[dataset])
+
     @patch(
         'sys.argv',
         [
@@ -176,6 +208,8 @@ class TestProcessVEP(unittest.TestCase):
             os.path.join(output_path, 'validation_filtered.tsv.gz'),
             sep='\t'
         )
+        validation = pd.read_csv(os.path.join(output_path, 'validation.tsv.gz'), sep='\t')
+        self.assertListEqual(filtered_validation.columns.tolist(), validation.columns.tolist())
         previous_iteration_tt = pd.read_csv(
             os.path.join(
                 get_testing_resources_dir(),
@@ -184,8 +218,15 @@ class TestProcessVEP(unittest.TestCase):
             ),
             sep='\t'
         )
-        for identifier in previous_iteration_tt['ID'].values.tolist():
-            self.assertNotIn(identifier, filtered_validation['ID'].values.tolist())
+        key = ['CHROM', 'POS', 'REF', 'ALT', 'Gene', 'SYMBOL_SOURCE']
+        previous_keys = set(
+            normalize_keys(previous_iteration_tt, key).itertuples(index=False, name=None)
+        )
+        for filtered_key in normalize_keys(filtered_validation, key).itertuples(
+                index=False,
+                name=None
+        ):
+            self.assertNotIn(filtered_key, previous_keys)
 
     def test_filtered_validation_pass(self):
         """
@@ -227,6 +268,8 @@ class TestProcessVEP(unittest.TestCase):
         self.assertEqual(observed.shape[0], 3)
         # Checking if the original validation is unaltered
         self.assertEqual(test_validation.shape[0], 5)
+        self.assertListEqual(test_validation.columns.tolist(), observed.columns.tolist())
+        self.assertEqual(test_previous_iteration.shape[1], 6)
 
     def test_filtered_validation_none_pass(self):
         """
@@ -252,6 +295,76 @@ class TestProcessVEP(unittest.TestCase):
         # Checking if validation remains unaltered
         self.assertEqual(test_validation.shape[0], 5)
 
+    def test_filtered_validation_variant_index(self):
+        """
+        Test to see if the validation dataset is filtered on the variants present in the variant
+        index of previously released models.
+        """
+        test_validation = pd.DataFrame(
+            {
+                'CHROM': ['1', '2', '3', 'X'],
+                'POS': [100, 200, 300, 500],
+                'REF': ['A', 'C', 'T', 'GC'],
+                'ALT': ['C', 'A', 'G', 'CA'],
+                'UniqueID': ['id1', 'id2', 'id3', 'id4']
+            }
+        )
+        variant_index = VariantIndex.from_variants(
+            ['chr1', 'chr3', 'chrX'],
+            [100, 300, 501],
+            ['A', 'T', 'GC'],
+            ['C', 'G', 'CA']
+        )
+        observed = self.processor._process_variant_index(test_validation, variant_index)
+        np.testing.assert_array_equal(observed['UniqueID'].values, np.array(['id2', 'id4']))
+        # Checking if the original validation is unaltered
+        self.assertEqual(test_validation.shape[0], 4)
+
+    def test_process_vep_workers(self):
+        """
+        Test to see if processing sharded over multiple workers results in the same processed
+        data and the same progress as processing in a single process, including the GRCh38
+        chromosome processing.
+        """
+        resources = os.path.join(get_testing_resources_dir(), 'process_vep')
+        data = self.processor._read_vep_data(os.path.join(resources, 'validation_vep.tsv.gz'))
+        data['CHROM'] = 'chr' + data['CHROM'].astype(str)
+        data.loc[data.index[:10], 'CHROM'] = 'chr1_alternative_contig'
+        train_features = self.processor._read_train_features(
+            os.path.join(resources, 'train_features.json')
+        )
+        cgd = self.processor._read_cgd_data(os.path.join(resources, 'CGD.txt.gz'))
+        observed = {}
+        for workers in [1, 3]:
+            copy = data.copy(deep=True)
+            with patch('sys.stdout', new_callable=StringIO) as stdout:
+                processed = self.processor._process_vep(
+                    copy,
+                    train_features,
+                    cgd,
+                    True,
+                    ProgressPrinter('validation', copy.shape[0]),
+                    workers=workers
+                )
+            progress = [line for line in stdout.getvalue().splitlines() if 'Dropped' in line]
+            observed[workers] = (processed, progress)
+        pd.testing.assert_frame_equal(observed[3][0], observed[1][0])
+        self.assertListEqual(observed[3][1], observed[1][1])
+        self.assertNotIn('chr1_alternative_contig', observed[3][0]['CHROM'].values)
+        self.assertIn('1', observed[3][0]['CHROM'].values)
+
+    def test_shard_by_contig(self):
+        """
+        Test to see if contigs are kept within a single shard and divided over the shards by
+        size.
+        """
+        test_case = pd.DataFrame({'CHROM': ['1', '2', '1', '3', '1', '2', 'X', '3']})
+        observed = self.processor._shard_by_contig(test_case, 2)
+        self.assertEqual(len(observed), 2)
+        np.testing.assert_array_equal(observed[0], np.array([0, 2, 4, 6]))
+        np.testing.assert_array_equal(observed[1], np.array([1, 3, 5, 7]))
+        self.assertEqual(len(self.processor._shard_by_contig(test_case, 10)), 4)
+
 
 if __name__ == '__main__':
     unittest.main()
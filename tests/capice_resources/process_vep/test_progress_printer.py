@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import patch
 from io import StringIO
 
-import pandas as pd
+import numpy as np
 
 from molgenis.capice_resources.process_vep.progress_printer import ProgressPrinter
 
@@ -14,20 +14,32 @@ class TestProgressPrinter(unittest.TestCase):
         Test to check if progress_printer correctly tracks progression of a dataframe and prints
         the expected messages.
         """
-        test_case = pd.DataFrame(
-            {
-                'variant': ['var1', 'var2', 'var3'],
-                'dataset_source': ['train_test', 'train_test', 'validation']
-            }
-        )
-        printer = ProgressPrinter(test_case)
-        test_case.drop(index=1, inplace=True)
-        printer.new_shape(test_case)
+        printer = ProgressPrinter('train_test', 3)
+        printer.new_mask(np.array([False, True, False]))
         printer.print_final_shape()
         self.assertIn('Dropped 1 variants from train_test', stdout.getvalue())
-        self.assertIn('Dropped 0 variants from validation', stdout.getvalue())
-        self.assertIn('Final number of samples in train_test: 1', stdout.getvalue())
-        self.assertIn('Final number of samples in validation: 1', stdout.getvalue())
+        self.assertIn('Final number of samples in train_test: 2', stdout.getvalue())
+        self.assertEqual(printer.remaining_samples(), 2)
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_progress_printer_overlapping_masks(self, stdout):
+        """
+        Test to check if samples dropped by multiple processing steps are only accounted to the
+        first step that drops them.
+        """
+        printer = ProgressPrinter('validation', 3)
+        printer.new_mask(np.array([True, False, False]))
+        printer.new_mask(np.array([True, False, True]))
+        printer.print_final_shape()
+        self.assertListEqual(
+            stdout.getvalue().splitlines(),
+            [
+                'Dropped 1 variants from validation',
+                'Dropped 1 variants from validation',
+                'Final number of samples in validation: 1'
+            ]
+        )
+        np.testing.assert_array_equal(printer.dropped, np.array([True, False, True]))
 
 
 if __name__ == '__main__':
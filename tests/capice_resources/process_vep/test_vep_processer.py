@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.process_vep.vep_processer import VEPProcesser
@@ -24,10 +25,11 @@ class TestVepProcesser(unittest.TestCase):
                 ['variant_6', 'value_16', 'value_17', 'value_18']
             ], columns=['variant', 'feature_1', 'feature_2', 'feature_3']
         )
-        self.processor.drop_duplicates(test_case, ['feature_1', 'feature_2'])
-        self.assertNotIn('variant_3', test_case['variant'].values)
-        for variant in ['variant_1', 'variant_2', 'variant_4', 'variant_5', 'variant_6']:
-            self.assertIn(variant, test_case['variant'].values)
+        observed = self.processor.drop_duplicates(test_case, ['feature_1', 'feature_2'])
+        np.testing.assert_array_equal(
+            observed,
+            np.array([False, False, True, False, False, False])
+        )
 
     def test_drop_genes_empty(self):
         """
@@ -40,8 +42,8 @@ class TestVepProcesser(unittest.TestCase):
                 ['variant_3', 'gene_2', 'train_test']
             ], columns=['variant', 'SYMBOL', 'dataset_source']
         )
-        self.processor.drop_genes_empty(test_case)
-        self.assertNotIn('variant_2', test_case['variant'].values)
+        observed = self.processor.drop_genes_empty(test_case)
+        np.testing.assert_array_equal(observed, np.array([False, True, False]))
 
     def test_process_grch38(self):
         """
@@ -54,12 +56,12 @@ class TestVepProcesser(unittest.TestCase):
                 'variant': ['var1', 'var2', 'var3', 'var4', 'var5']
             }
         )
-        self.processor.process_grch38(test_case)
-        self.assertNotIn('var3', test_case['variant'].values)
-        self.assertNotIn('var5', test_case['variant'].values)
-        expected = ['var1', 'var2', 'var4']
-        for e in expected:
-            self.assertIn(e, test_case['variant'].values)
+        observed = self.processor.process_grch38(test_case)
+        np.testing.assert_array_equal(observed, np.array([False, False, True, False, True]))
+        self.assertListEqual(
+            test_case.loc[~observed, 'CHROM'].values.tolist(),
+            ['1', '2', 'X']
+        )
 
     def test_drop_duplicate_entries(self):
         """
@@ -74,15 +76,8 @@ class TestVepProcesser(unittest.TestCase):
                 'feature_1': [1, 2, 3, 5, 5]
             }
         )
-        expected = pd.DataFrame(
-            {
-                'variant': ['variant_1', 'variant_2', 'variant_2', 'variant_3'],
-                'transcript': ['t1', 't2', 't1', 't1'],
-                'feature_1': [1, 2, 3, 5]
-            }
-        )
-        self.processor.drop_duplicate_entries(test_case)
-        pd.testing.assert_frame_equal(test_case, expected)
+        observed = self.processor.drop_duplicate_entries(test_case)
+        np.testing.assert_array_equal(observed, np.array([False, False, False, False, True]))
 
     def test_mismatching_genes(self):
         """
@@ -96,8 +91,8 @@ class TestVepProcesser(unittest.TestCase):
                 'variant': ['var1', 'var2', 'var3']
             }
         )
-        self.processor.drop_mismatching_genes(test_case)
-        self.assertNotIn('var3', test_case['variant'].values)
+        observed = self.processor.drop_mismatching_genes(test_case)
+        np.testing.assert_array_equal(observed, np.array([False, False, True]))
 
     def test_drop_heterozygous_variants_in_ar_genes(self):
         """
@@ -111,13 +106,11 @@ class TestVepProcesser(unittest.TestCase):
                 'gnomAD_HN': [None, 0, 0]
             }
         )
-        self.processor.drop_heterozygous_variants_in_ar_genes(
+        observed = self.processor.drop_heterozygous_variants_in_ar_genes(
             test_case,
             ['foo', 'bar', 'gene1']
         )
-        self.assertNotIn('var2', test_case['variant'].values)
-        for variant in ['var1', 'var3']:
-            self.assertIn(variant, test_case['variant'].values)
+        np.testing.assert_array_equal(observed, np.array([False, True, False]))
 
     def test_drop_variants_incorrect_label_or_weight(self):
         """
@@ -133,11 +126,8 @@ class TestVepProcesser(unittest.TestCase):
                 'variant': ['var1', 'var2', 'var3', 'var4']
             }
         )
-        self.processor.drop_variants_incorrect_label_or_weight(test_case)
-        self.assertNotIn('ID', test_case.columns)
-        self.assertIn('var3', test_case['variant'].values)
-        for notin in ['var1', 'var2', 'var4']:
-            self.assertNotIn(notin, test_case['variant'].values)
+        observed = self.processor.drop_variants_incorrect_label_or_weight(test_case)
+        np.testing.assert_array_equal(observed, np.array([True, True, False, True]))
 
 
 if __name__ == '__main__':
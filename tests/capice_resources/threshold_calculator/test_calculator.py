@@ -0,0 +1,199 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import recall_score, precision_score, f1_score
+
+from molgenis.capice_resources.threshold_calculator.calculator import Calculator
+
+
+class TestCalculator(unittest.TestCase):
+    def setUp(self) -> None:
+        random = np.random.RandomState(5)
+        scores = random.random_sample(500).round(3)
+        scores[:5] = np.nan
+        self.dataset = pd.DataFrame(
+            {
+                'binarized_label': (random.random_sample(500) < scores).astype(float),
+                'score': scores
+            }
+        )
+
+    def test_sweep_equal_to_sklearn(self):
+        """
+        Test to see if the Recall, Precision and F1 score of each threshold are equal to the
+        scores of sklearn, including thresholds at which no sample is positive.
+        """
+        thresholds = np.array([0.0, 0.25, 0.5, 0.999, 1.0])
+        observed = Calculator.sweep(
+            self.dataset['binarized_label'],
+            self.dataset['score'],
+            thresholds
+        )
+        for row, threshold in enumerate(thresholds):
+            predicted = (self.dataset['score'] >= threshold).astype(int)
+            for column, metric in [
+                ('Recall_score', recall_score),
+                ('Precision', precision_score),
+                ('F1_score', f1_score)
+            ]:
+                self.assertAlmostEqual(
+                    observed.loc[row, column],
+                    metric(self.dataset['binarized_label'], predicted, zero_division=0),
+                    msg=f'{column} at threshold {threshold}'
+                )
+
+    def test_optimal_threshold(self):
+        """
+        Test to see if the optimal threshold is the highest threshold out of the distinct scores
+        with the highest recall between 0.94 and 0.96.
+        """
+        observed = Calculator().calculate_optimal_threshold(self.dataset)
+        sweep = Calculator.sweep(self.dataset['binarized_label'], self.dataset['score'])
+        in_range = sweep[sweep['Recall_score'].between(0.94, 0.96)]
+        self.assertEqual(observed['Recall_score'], in_range['Recall_score'].max())
+        self.assertEqual(
+            observed['Threshold'],
+            in_range[in_range['Recall_score'] == in_range['Recall_score'].max()][
+                'Threshold'
+            ].max()
+        )
+        self.assertIn(observed['Threshold'], self.dataset['score'].values)
+
+    def test_bootstrap_equal_to_optimal_threshold_of_resamples(self):
+        """
+        Test to see if the optimal threshold of each bootstrap resample is equal to the optimal
+        threshold of that resample as obtained by calculate_optimal_threshold().
+        """
+        calculator = Calculator()
+        observed = calculator.bootstrap(self.dataset, 5, random_state=3)
+        resamples = np.random.default_rng(3).integers(
+            0,
+            self.dataset.shape[0],
+            size=(5, self.dataset.shape[0])
+        )
+        self.assertEqual(observed.shape[0], 5)
+        for row, resample in enumerate(resamples):
+            expected = calculator.calculate_optimal_threshold(
+                self.dataset.iloc[resample].reset_index(drop=True)
+            )
+            pd.testing.assert_series_equal(
+                observed.loc[row],
+                expected,
+                check_names=False
+            )
+
+    def test_bootstrap_batches(self):
+        """
+        Test to see if all resamples are obtained when drawn in multiple batches.
+        """
+        calculator = Calculator()
+        calculator.BOOTSTRAP_BATCH_CELLS = 1000
+        observed = calculator.bootstrap(self.dataset, 7)
+        self.assertEqual(observed.shape[0], 7)
+        self.assertTrue(observed['Threshold'].isin(self.dataset['score']).all())
+
+    def test_confidence_intervals(self):
+        """
+        Test to see if the confidence intervals are the 2.5 and 97.5 percentiles of the bootstrap
+        resamples.
+        """
+        calculator = Calculator()
+        optimal = calculator.calculate_optimal_threshold(self.dataset)
+        bootstrap = calculator.bootstrap(self.dataset, 200)
+        observed = calculator.calculate_confidence_intervals(optimal, bootstrap)
+        self.assertListEqual(
+            observed['Statistic'].tolist(),
+            ['Threshold', 'Recall_score', 'Precision', 'F1_score']
+        )
+        self.assertAlmostEqual(
+            observed.loc[0, 'CI_lower'],
+            np.percentile(bootstrap['Threshold'], 2.5)
+        )
+        self.assertAlmostEqual(
+            observed.loc[3, 'CI_upper'],
+            np.percentile(bootstrap['F1_score'], 97.5)
+        )
+        self.assertEqual(observed.loc[0, 'Optimal'], optimal['Threshold'])
+
+    def test_grouped_optimal_thresholds(self):
+        """
+        Test to see if the optimal threshold of each consequence and allele frequency bin group
+        is equal to the optimal threshold of the subset of the group, with samples containing
+        multiple consequences present in the group of each of them.
+        """
+        random = np.random.RandomState(3)
+        dataset = self.dataset.copy()
+        dataset['Consequence'] = random.choice(
+            ['missense_variant', 'intron_variant', 'missense_variant&splice_region_variant'],
+            dataset.shape[0]
+        )
+        dataset['gnomAD_AF'] = random.choice([np.nan, 0, 5e-6, 0.05], dataset.shape[0])
+        calculator = Calculator()
+        observed = calculator.calculate_grouped_optimal_thresholds(
+            dataset,
+            ['Consequence', 'af_bin']
+        )
+        self.assertListEqual(
+            observed.columns.tolist(),
+            [
+                'Consequence', 'gnomAD_AF_bin', 'n_pathogenic', 'n_benign', 'Threshold',
+                'Recall_score', 'Precision', 'F1_score'
+            ]
+        )
+        self.assertListEqual(
+            observed['Consequence'].unique().tolist(),
+            ['intron_variant', 'missense_variant', 'splice_region_variant']
+        )
+        self.assertListEqual(
+            observed['gnomAD_AF_bin'].unique().tolist(),
+            ['[0.0, 1e-06)', '[1e-06, 1e-05)', '[0.01, 1.0)']
+        )
+        bins = {'[0.0, 1e-06)': [0], '[1e-06, 1e-05)': [5e-6], '[0.01, 1.0)': [0.05]}
+        for _, group in observed.iterrows():
+            subset = dataset[
+                dataset['Consequence'].str.split('&').apply(lambda c: group['Consequence'] in c) &
+                dataset['gnomAD_AF'].fillna(0).isin(bins[group['gnomAD_AF_bin']])
+            ].reset_index(drop=True)
+            expected = calculator.calculate_optimal_threshold(subset)
+            self.assertEqual(group['n_pathogenic'], (subset['binarized_label'] == 1).sum())
+            self.assertEqual(group['n_benign'], (subset['binarized_label'] == 0).sum())
+            pd.testing.assert_series_equal(
+                group[expected.index].astype(float),
+                expected,
+                check_names=False
+            )
+
+    def test_grouped_optimal_thresholds_no_pathogenic(self):
+        """
+        Test to see if the Threshold, Recall, Precision and F1 score of a group without
+        pathogenic samples are NaN, while those of the other groups are still obtained.
+        """
+        dataset = pd.DataFrame(
+            {
+                'binarized_label': [0, 0, 0, 1, 0, 1],
+                'score': [0.1, 0.4, 0.2, 0.9, 0.3, 0.8],
+                'Consequence': [
+                    'intron_variant', 'intron_variant', 'intron_variant',
+                    'missense_variant', 'missense_variant', 'missense_variant'
+                ]
+            }
+        )
+        observed = Calculator().calculate_grouped_optimal_thresholds(
+            dataset,
+            ['Consequence']
+        ).set_index('Consequence')
+        self.assertEqual(observed.loc['intron_variant', 'n_pathogenic'], 0)
+        self.assertEqual(observed.loc['intron_variant', 'n_benign'], 3)
+        self.assertTrue(
+            observed.loc[
+                'intron_variant',
+                ['Threshold', 'Recall_score', 'Precision', 'F1_score']
+            ].isna().all()
+        )
+        self.assertEqual(observed.loc['missense_variant', 'Threshold'], 0.8)
+        self.assertEqual(observed.loc['missense_variant', 'Recall_score'], 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.threshold_calculator.calculator import Calculator
+from molgenis.capice_resources.threshold_calculator.histogram import ScoreHistogram
+
+
+class TestScoreHistogram(unittest.TestCase):
+    def setUp(self) -> None:
+        random = np.random.RandomState(5)
+        scores = random.random_sample(500).round(4)
+        scores[:5] = np.nan
+        scores[5:7] = [0.0, 1.0]
+        self.dataset = pd.DataFrame(
+            {
+                'binarized_label': (random.random_sample(500) < scores).astype(float),
+                'score': scores
+            }
+        )
+
+    def test_chunks_equal_to_sweep(self):
+        """
+        Test to see if the Recall, Precision and F1 score of thresholds on bin edges are equal
+        to those of the unbinned scores, when the histogram is accumulated in chunks.
+        """
+        histogram = ScoreHistogram(1000)
+        for start in range(0, self.dataset.shape[0], 150):
+            chunk = self.dataset.iloc[start:start + 150]
+            histogram.add(chunk['binarized_label'], chunk['score'])
+        self.assertEqual(histogram.counts.sum() + histogram.unscored.sum(), 500)
+        self.assertEqual(histogram.true_sum, self.dataset['binarized_label'].sum())
+        thresholds = np.array([0.0, 0.01, 0.5, 0.999, 1.0])
+        tp, fp = histogram.positives(thresholds)
+        expected = Calculator.sweep(
+            self.dataset['binarized_label'],
+            self.dataset['score'],
+            thresholds
+        )
+        pd.testing.assert_frame_equal(
+            Calculator._metrics(thresholds, tp, fp, histogram.true_sum),
+            expected
+        )
+
+    def test_optimal_threshold_equal_to_grid(self):
+        """
+        Test to see if the thresholds TSV of a histogram is equal to that of the dataset, and
+        if the optimal threshold of a histogram is a bin edge.
+        """
+        histogram = ScoreHistogram(200)
+        histogram.add(self.dataset['binarized_label'], self.dataset['score'])
+        calculator = Calculator()
+        pd.testing.assert_frame_equal(
+            calculator.calculate_threshold(histogram),
+            calculator.calculate_threshold(self.dataset)
+        )
+        observed = calculator.calculate_optimal_threshold(histogram)
+        self.assertIn(observed['Threshold'], histogram.edges)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,6 +61,30 @@ class TestCalculator(unittest.TestCase):
         )
         pd.testing.assert_frame_equal(observed, expected)
 
+    @patch(
+        'sys.argv',
+        [
+            __file__,
+            '-v', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-s', os.path.join(get_testing_resources_dir(), 'scores.tsv.gz'),
+            '-o', output_directory,
+            '-c', '5000'
+        ]
+    )
+    def test_component_calculator_chunksize(self):
+        """
+        Component test of streaming the validation and scores in chunks. Tests if the output tsv
+        is equal to that of the non-streaming mode.
+        """
+        module = ThresholdCalculator()
+        args = module.parse_and_validate_cli()
+        observed = module.run_module(args)['thresholds']
+        expected = pd.read_csv(
+            os.path.join(get_testing_resources_dir(), 'threshold_calculator', 'thresholds.tsv.gz'),
+            sep='\t'
+        )
+        pd.testing.assert_frame_equal(observed, expected)
+
     @patch(
         'sys.argv',
         [
@@ -77,6 +101,35 @@ class TestCalculator(unittest.TestCase):
         self.assertEqual(100, plot.dpi)
         self.assertTupleEqual((0, 1), plot.axes[0].get_ylim())
 
+    @patch(
+        'sys.argv',
+        [
+            __file__,
+            '-v', os.path.join(get_testing_resources_dir(), 'labels.tsv.gz'),
+            '-s', os.path.join(get_testing_resources_dir(), 'scores.tsv.gz'),
+            '-o', output_directory,
+            '-d'
+        ]
+    )
+    def test_plotter_density(self):
+        """
+        Test to see if the density plot contains the histograms of both labels instead of a
+        marker per sample, and keeps the size, limits and threshold legend.
+        """
+        module = ThresholdCalculator()
+        args = module.parse_and_validate_cli()
+        plot = module.run_module(args)['figure']
+        self.assertEqual(100, plot.dpi)
+        self.assertTupleEqual((0, 1), plot.axes[0].get_ylim())
+        self.assertEqual(len(plot.axes[0].collections), 1)  # Only the threshold line
+        self.assertEqual(len(plot.axes[0].patches), 2)
+        legend = [text.get_text() for text in plot.axes[0].get_legend().get_texts()]
+        self.assertListEqual(
+            legend[:2],
+            ['N benign: 11063', 'N pathogenic: 13761']
+        )
+        self.assertTrue(legend[2].startswith('Threshold: 0.555'))
+
 
 if __name__ == '__main__':
     unittest.main()
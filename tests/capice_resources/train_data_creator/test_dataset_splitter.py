@@ -1,17 +1,14 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 
 from molgenis.capice_resources.train_data_creator.dataset_splitter import SplitDatasets
 
 
 class TestSplitDatasets(unittest.TestCase):
-    def test_split(self):
-        """
-        Tests if the train-test and validation splitter performs as expected. Unique IDentifiers
-        are added to ensure that samples are in 1 dataset but not the other.
-        """
-        dataset = pd.DataFrame(
+    def setUp(self) -> None:
+        self.dataset = pd.DataFrame(
             {
                 '#CHROM': ['1', '2', '4', '5', '6', '7', '8', '10'],
                 'POS': [100, 200, 400, 500, 600, 700, 800, 1000],
@@ -26,8 +23,14 @@ class TestSplitDatasets(unittest.TestCase):
                 'unique_id': ['fooa', 'foob', 'fooc', 'food', 'fooe', 'foof', 'foog', 'fooh']
             }
         )
+
+    def test_split(self):
+        """
+        Tests if the train-test and validation splitter performs as expected. Unique IDentifiers
+        are added to ensure that samples are in 1 dataset but not the other.
+        """
         splitter = SplitDatasets()
-        observed_train, observed_validation = splitter.split(dataset)
+        observed_train, observed_validation = splitter.split(self.dataset)
         self.assertEqual(
             observed_validation[observed_validation['binarized_label'] == 1.0].shape[0],
             observed_validation[observed_validation['binarized_label'] == 0.0].shape[0]
@@ -46,6 +49,24 @@ class TestSplitDatasets(unittest.TestCase):
                 observed_train['unique_id'].values
             )
 
+    def test_split_previously_trained(self):
+        """
+        Tests if samples that have been trained on by a previous model are never sampled into
+        validation, but do remain in train-test.
+        """
+        previously_trained = np.array([True, True, False, True, True, False, False, False])
+        observed_train, observed_validation = SplitDatasets().split(
+            self.dataset,
+            previously_trained
+        )
+        for uid in ['fooa', 'foob', 'food', 'fooe']:
+            self.assertNotIn(uid, observed_validation['unique_id'].values)
+            self.assertIn(uid, observed_train['unique_id'].values)
+        self.assertEqual(
+            observed_train.shape[0] + observed_validation.shape[0],
+            self.dataset.shape[0]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -26,6 +26,10 @@ class TestTrainDataCreator(unittest.TestCase):
     def tearDownClass(cls) -> None:
         check_and_remove_directory(os.path.join(cls.output_directory, 'train_test.vcf.gz'))
         check_and_remove_directory(os.path.join(cls.output_directory, 'validation.vcf.gz'))
+        check_and_remove_directory(os.path.join(cls.output_directory, 'train_test.npy'))
+        check_and_remove_directory(
+            os.path.join(cls.output_directory, 'previous_train_test.vcf.gz')
+        )
 
     def test_classmethod_list_columns_of_interest(self):
         """
@@ -185,6 +189,42 @@ class TestTrainDataCreator(unittest.TestCase):
         correct_order_vcf_notation(val)
         pandas.testing.assert_frame_equal(val, val_output)
 
+    def test_component_previous_release_train_test(self):
+        """
+        Component test of train-data-creator supplying the train-test VCF of a previous release
+        to -i / --variant-index: none of its variants should be sampled into validation.
+        """
+        arguments = [
+            __file__,
+            '-v', os.path.join(
+                get_testing_resources_dir(),
+                'train_data_creator',
+                'smol_vkgl_may2023.tsv.gz'
+            ),
+            '-c', os.path.join(
+                get_testing_resources_dir(),
+                'train_data_creator',
+                'smol_clinvar_20230508.vcf.gz'
+            ),
+            '-o', self.output_directory
+        ]
+        previous_train_test = os.path.join(self.output_directory, 'previous_train_test.vcf.gz')
+        with patch('sys.argv', arguments):
+            TrainDataCreator().run()
+        os.replace(os.path.join(self.output_directory, 'train_test.vcf.gz'), previous_train_test)
+        with patch('sys.argv', arguments + ['-i', previous_train_test]):
+            TrainDataCreator().run()
+        variant_columns = ['#CHROM', 'POS', 'REF', 'ALT']
+        previous = pd.read_csv(previous_train_test, sep='\t', skiprows=31, usecols=variant_columns)
+        validation = pd.read_csv(
+            os.path.join(self.output_directory, 'validation.vcf.gz'),
+            sep='\t',
+            skiprows=31,
+            usecols=variant_columns
+        )
+        self.assertGreater(validation.shape[0], 0)
+        self.assertEqual(validation.merge(previous, on=variant_columns).shape[0], 0)
+
     def test_vkgl_date_incorrect(self):
         module = TrainDataCreator()
         module.input_vkgl_filename = 'vkgl_public_consensus_2022may.tsv.gz'
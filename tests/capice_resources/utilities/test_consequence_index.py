@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from molgenis.capice_resources.utilities import split_consequences
+from molgenis.capice_resources.utilities.consequence_index import ConsequenceIndex
+
+
+class TestConsequenceIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.consequences = pd.Series(
+            [
+                'missense_variant&splice_region_variant',
+                'intron_variant',
+                np.nan,
+                'NMD_transcript_variant&intron_variant',
+                'splice_region_variant',
+                'missense_variant&splice_region_variant'
+            ]
+        )
+
+    def test_consequences(self):
+        """
+        Test to see if all unique (split) consequences are obtained, sorted, and if these are
+        equal to split_consequences().
+        """
+        observed = ConsequenceIndex(self.consequences).consequences
+        expected = [
+            'NMD_transcript_variant',
+            'intron_variant',
+            'missense_variant',
+            'splice_region_variant'
+        ]
+        self.assertListEqual(observed, expected)
+        self.assertListEqual(split_consequences(self.consequences.values), expected)
+
+    def test_rows(self):
+        """
+        Test to see if the positions of all samples containing a consequence are obtained.
+        """
+        index = ConsequenceIndex(self.consequences)
+        np.testing.assert_array_equal(index.rows('splice_region_variant'), np.array([0, 4, 5]))
+        np.testing.assert_array_equal(index.rows('intron_variant'), np.array([1, 3]))
+        np.testing.assert_array_equal(
+            index.mask('missense_variant'),
+            np.array([True, False, False, False, False, True])
+        )
+        self.assertEqual(index.count('NMD_transcript_variant'), 1)
+        self.assertEqual(index.count('stop_gained'), 0)
+
+    def test_no_substring_match(self):
+        """
+        Test to see if a consequence is not matched with samples of which a consequence merely
+        contains the name of the consequence.
+        """
+        index = ConsequenceIndex(['non_coding_transcript_variant', 'coding_transcript_variant'])
+        np.testing.assert_array_equal(index.rows('coding_transcript_variant'), np.array([1]))
+
+    def test_empty(self):
+        """
+        Test to see if an empty Consequence column results in an empty index.
+        """
+        index = ConsequenceIndex(pd.Series([], dtype=object))
+        self.assertListEqual(index.consequences, [])
+        self.assertEqual(index.rows('intron_variant').size, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
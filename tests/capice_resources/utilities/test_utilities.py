@@ -1,8 +1,12 @@
 import unittest
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
-from molgenis.capice_resources.utilities import merge_dataset_rows
+from molgenis.capice_resources.core.deduplicator import Deduplicator
+from molgenis.capice_resources.utilities import merge_dataset_rows, anti_join, encode_keys, \
+    af_bin_codes
 
 
 class TestUtilities(unittest.TestCase):
@@ -76,6 +80,63 @@ class TestUtilities(unittest.TestCase):
         # how expensive the function is.
         pd.testing.assert_index_equal(observed.index, pd.Index(['a', 'b', 'c', 'b', 'c', 'e']))
 
+    def test_encode_keys_dtype_independent(self):
+        """
+        Test to see if keys encode equally, regardless of the dtype of the key columns (for
+        instance integer columns that are read in as float due to missing values).
+        """
+        frame_float = pd.DataFrame({'chrom': ['1', 'X'], 'gene': [10397.0, np.nan]})
+        frame_int = pd.DataFrame({'chrom': [1, 'X'], 'gene': [10397, None]})
+        frame_int['gene'] = frame_int['gene'].astype('Int64')
+        np.testing.assert_array_equal(
+            encode_keys(frame_float, ['chrom', 'gene']),
+            encode_keys(frame_int, ['chrom', 'gene'])
+        )
+
+    def test_anti_join(self):
+        """
+        Test to see if only the samples of left of which the key is not present in right are
+        kept, and that neither left nor right are altered.
+        """
+        left = pd.DataFrame(
+            {
+                'chrom': ['1', '1', '2', '3'],
+                'pos': [100, 100, 200, 300],
+                'gene': [1.0, 1.0, 2.0, np.nan],
+                'other': ['a', 'b', 'c', 'd']
+            }
+        )
+        right = pd.DataFrame({'chrom': [1, 3, 4], 'pos': [100, 300, 400], 'gene': [1, 5, 6]})
+        left_copy = left.copy(deep=True)
+        right_copy = right.copy(deep=True)
+        observed = anti_join(left, right, ['chrom', 'pos', 'gene'])
+        np.testing.assert_array_equal(observed, np.array([False, False, True, True]))
+        pd.testing.assert_frame_equal(left, left_copy)
+        pd.testing.assert_frame_equal(right, right_copy)
+
+    def test_anti_join_encoding_collision(self):
+        """
+        Test to see if samples of which the encoded key collides, but the key itself differs, are
+        kept.
+        """
+        left = pd.DataFrame({'chrom': ['1', '2']})
+        right = pd.DataFrame({'chrom': ['2', '3', '4']})
+        with patch.object(
+                Deduplicator,
+                'hash_rows',
+                side_effect=lambda frame: np.zeros(frame.shape[0], dtype=np.uint64)
+        ):
+            observed = anti_join(left, right, ['chrom'])
+        np.testing.assert_array_equal(observed, np.array([True, False]))
+
+    def test_af_bin_codes(self):
+        """
+        Test to see if the allele frequency bins are left inclusive, and if samples without
+        allele frequency or outside the bins obtain code -1.
+        """
+        observed = af_bin_codes(pd.Series([0, 1e-6, 5e-4, 0.01, 0.5, 1, np.nan, -0.1]))
+        np.testing.assert_array_equal(observed, np.array([0, 1, 3, 5, 5, -1, -1, -1]))
+
 
 if __name__ == '__main__':
     unittest.main()
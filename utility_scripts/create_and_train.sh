@@ -17,9 +17,8 @@ main() {
 	install_capice_resources "${CAPICE_RESOURCES}"
 	install_capice "${CAPICE_BRANCH}"
 	install_capice "${PROD_CAPICE_VERSION}"
-	create_train_data
 	download_prod_train_test
-	filter_validation
+	create_train_data
 	vep
 	postprocess
 	create_model_job
@@ -105,7 +104,7 @@ create_train_data() {
 	echo "running train-data-creator"
 	module load Python/3.10.4-GCCcore-11.3.0-bare
 	source ${WORKDIR}/venvs/capice-resources/bin/activate
-	train-data-creator -v ${VKGL_FILE} -c ${CLINVAR_FILE} -o ${WORKDIR}/data/
+	train-data-creator -v ${VKGL_FILE} -c ${CLINVAR_FILE} -i ${WORKDIR}/validation/prod/${PROD_TRAIN_FILE} -o ${WORKDIR}/data/
 	deactivate
 	module purge
 	echo "finished running train-data-creator"
@@ -119,22 +118,13 @@ download_prod_train_test() {
 	echo "finished downloading production train_test"
 }
 
-filter_validation() {
-	ml HTSlib
-	gunzip -c ${WORKDIR}/validation/prod/${PROD_TRAIN_FILE} > ${WORKDIR}/validation/prod/previous_train.vcf
-	gunzip ${WORKDIR}/data/validation.vcf.gz
-	awk 'FNR==NR { a[$1_$2_$4_$5]; next } /^#/ || !($1_$2_$4_$5 in a)' ${WORKDIR}/validation/prod/previous_train.vcf ${WORKDIR}/data/validation.vcf | bgzip > ${WORKDIR}/data/filtered_validation.vcf.gz
-	rm ${WORKDIR}/data/validation.vcf
-	rm ${WORKDIR}/validation/prod/previous_train.vcf
-}
-
 vep() {
 	echo "running vep on train test"
 	bash ${CAPICE_RESOURCES}/utility_scripts/slurm_run_vep.sh -r ${VIP_RESOURCES_DIR} -e ${VEP_SIF} -p ${VEP_PLUGIN_DIR} -g -i ${WORKDIR}/data/train_test.vcf.gz -o ${WORKDIR}/data/train_test_vep.vcf.gz
 	bash ${CAPICE}/scripts/convert_vep_vcf_to_tsv_capice.sh -p ${BCFTOOLS_SIF} -t -i ${WORKDIR}/data/train_test_vep.vcf.gz -o ${WORKDIR}/data/train_test_vep.tsv.gz
 	echo "finished running vep on train test"
 	echo "running vep on validation"
-	bash ${CAPICE_RESOURCES}/utility_scripts/slurm_run_vep.sh -r ${VIP_RESOURCES_DIR} -e ${VEP_SIF} -p ${VEP_PLUGIN_DIR} -g -i ${WORKDIR}/data/filtered_validation.vcf.gz -o ${WORKDIR}/data/validation_vep.vcf.gz
+	bash ${CAPICE_RESOURCES}/utility_scripts/slurm_run_vep.sh -r ${VIP_RESOURCES_DIR} -e ${VEP_SIF} -p ${VEP_PLUGIN_DIR} -g -i ${WORKDIR}/data/validation.vcf.gz -o ${WORKDIR}/data/validation_vep.vcf.gz
 	bash ${CAPICE}/scripts/convert_vep_vcf_to_tsv_capice.sh -p ${BCFTOOLS_SIF} -t -i ${WORKDIR}/data/validation_vep.vcf.gz -o ${WORKDIR}/data/validation_vep.tsv.gz
 	echo "finished running vep on validation"
 }